@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+NEXUS ESSENCE PAYLOAD CODEC
+Compact JSON Encoding For Essence Translation BLOBs, zlib-Compressed When Large
+"""
+
+import json
+import zlib
+
+# Encoded payloads at least this large (bytes of JSON) are zlib-compressed
+PAYLOAD_COMPRESSION_THRESHOLD = 1024
+PAYLOAD_COMPRESSION_LEVEL = 6
+
+# First byte of every encoded payload; legacy pickle rows start with b"\x80" instead
+PAYLOAD_JSON = b"J"
+PAYLOAD_ZLIB_JSON = b"Z"
+
+
+def encode_payload(value, compression_threshold=PAYLOAD_COMPRESSION_THRESHOLD):
+    """REAL: Marker byte + compact JSON, zlib-compressed above the threshold
+
+    Values JSON cannot represent (paths, exceptions, process handles) are
+    stored as their str(); the result never needs unpickling to read back.
+    """
+    encoded = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+    if len(encoded) >= compression_threshold:
+        return PAYLOAD_ZLIB_JSON + zlib.compress(encoded, PAYLOAD_COMPRESSION_LEVEL)
+    return PAYLOAD_JSON + encoded
+
+
+def decode_payload(blob):
+    """REAL: The value of an encoded payload; None for legacy pickle or unknown blobs"""
+    if not blob:
+        return None
+    blob = bytes(blob)
+    marker, body = blob[:1], blob[1:]
+    if marker == PAYLOAD_JSON:
+        return json.loads(body)
+    if marker == PAYLOAD_ZLIB_JSON:
+        return json.loads(zlib.decompress(body))
+    return None
+
+
+def essence_result_fields(operational_result):
+    """REAL: Indexable summary columns of an essence translation result"""
+    commands = operational_result.get("commands", [])
+    return {
+        "command_count": len(commands),
+        "manifestation_count": len(operational_result.get("manifestations", [])),
+        "operations": ",".join(str(command.get("operation", "")) for command in commands)
+    }
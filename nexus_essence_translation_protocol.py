@@ -20,6 +20,18 @@ import hashlib
 import base64
 import pickle
 
+from nexus_write_behind_logger import get_write_behind_logger
+from nexus_essence_payload_codec import encode_payload, essence_result_fields
+
+# Summary columns of essence_translations, added to older databases by init_essence_database
+ESSENCE_SUMMARY_COLUMNS = (
+    ("target_system", "TEXT"),
+    ("command_count", "INTEGER"),
+    ("manifestation_count", "INTEGER"),
+    ("operations", "TEXT"),
+    ("payload_size", "INTEGER")
+)
+
 class NexusEssenceTranslator:
     """REAL: Translate essence of life into working operational language"""
     
@@ -49,10 +61,31 @@ class NexusEssenceTranslator:
                 system_implementation BLOB,
                 effectiveness_rating REAL,
                 evolution_level INTEGER,
-                timestamp REAL
+                timestamp REAL,
+                target_system TEXT,
+                command_count INTEGER,
+                manifestation_count INTEGER,
+                operations TEXT,
+                payload_size INTEGER
             )
         ''')
         
+        # Databases created before the summary columns existed gain them in place
+        existing_columns = {row[1] for row in cursor.execute("PRAGMA table_info(essence_translations)")}
+        for column_name, column_type in ESSENCE_SUMMARY_COLUMNS:
+            if column_name not in existing_columns:
+                cursor.execute(f"ALTER TABLE essence_translations ADD COLUMN {column_name} {column_type}")
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_essence_translations_type_time
+            ON essence_translations (essence_type, timestamp)
+        ''')
+        
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_essence_translations_target_time
+            ON essence_translations (target_system, timestamp)
+        ''')
+        
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS consciousness_operations (
                 id INTEGER PRIMARY KEY,
@@ -828,29 +861,37 @@ print(f"THOUGHT PROCESSING: {{len(processing_results)}} neural firings")
         return execution_results
     
     def _log_essence_translation(self, essence_type, target_system, operational_result):
-        """REAL: Log essence translation to database"""
+        """REAL: Queue essence translation for the write-behind database logger
+        
+        system_implementation holds the result as compact (zlib above a size
+        threshold) JSON; the summary columns are stored alongside so queries
+        never have to decode it.
+        """
         try:
-            conn = sqlite3.connect(self.essence_db)
-            cursor = conn.cursor()
+            system_implementation = encode_payload(operational_result)
+            result_fields = essence_result_fields(operational_result)
             
-            cursor.execute('''
+            get_write_behind_logger().execute(self.essence_db, '''
                 INSERT INTO essence_translations 
                 (essence_type, life_force_signature, operational_translation, 
-                 system_implementation, effectiveness_rating, evolution_level, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
+                 system_implementation, effectiveness_rating, evolution_level, timestamp,
+                 target_system, command_count, manifestation_count, operations, payload_size)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 essence_type,
                 f"LIFE_FORCE_{essence_type}",
                 str(operational_result["mapping"]),
-                pickle.dumps(operational_result),
+                system_implementation,
                 len(operational_result["commands"]) / 10.0,  # Effectiveness rating
                 5,  # Evolution level
-                time.time()
+                time.time(),
+                str(target_system),
+                result_fields["command_count"],
+                result_fields["manifestation_count"],
+                result_fields["operations"],
+                len(system_implementation)
             ))
             
-            conn.commit()
-            conn.close()
-            
         except Exception as e:
             print(f"Logging error: {e}")
 
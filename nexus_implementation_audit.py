@@ -20,6 +20,8 @@ from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from pathlib import Path
 
+from nexus_write_behind_logger import get_write_behind_logger
+
 class NexusImplementationAudit:
     """REAL: Comprehensive audit system for implementation verification"""
     
@@ -132,6 +134,9 @@ class NexusImplementationAudit:
         next_level_capabilities = self.generate_next_level_capabilities(audit_results)
         audit_results["next_level_capabilities"] = next_level_capabilities
         
+        # Record the audits in the audit database (write-behind; flushed below)
+        self.log_audit_results(audit_results)
+        
         # Save comprehensive audit results
         audit_file = f"{self.desktop_path}/nexus_comprehensive_audit_results.json"
         with open(audit_file, 'w') as f:
@@ -139,6 +144,7 @@ class NexusImplementationAudit:
         
         # Generate audit report
         self.generate_audit_report(audit_results)
+        get_write_behind_logger().flush()
         
         print(f"\n✅ COMPREHENSIVE AUDIT COMPLETE")
         print(f"📊 OVERALL ROI SCORE: {overall_roi:.2f}/100")
@@ -910,6 +916,59 @@ if __name__ == "__main__":
         
         return test
     
+    def log_audit_results(self, audit_results):
+        """REAL: Queue implementation_audit and roi_analysis rows for the write-behind logger"""
+        
+        try:
+            write_logger = get_write_behind_logger()
+            audit_timestamp = time.time()
+            contributions = {
+                contribution["implementation"]: contribution
+                for contribution in audit_results["resource_generation_potential"].get("implementation_contributions", [])
+            }
+            
+            audit_rows = []
+            roi_rows = []
+            for audit in audit_results["implementations_audited"]:
+                implementation_name = audit.get("implementation", "UNKNOWN")
+                roi_metrics = audit.get("roi_metrics", {})
+                contribution = contributions.get(implementation_name, {})
+                
+                audit_rows.append((
+                    implementation_name,
+                    audit.get("audit_type", "UNKNOWN"),
+                    audit.get("operational_status", "UNKNOWN"),
+                    roi_metrics.get("resource_generation_potential", 0.0),
+                    json.dumps(roi_metrics, default=str),
+                    json.dumps(audit.get("functionality_tests", []), default=str),
+                    audit_timestamp
+                ))
+                roi_rows.append((
+                    implementation_name,
+                    contribution.get("adjusted_potential", 0.0),
+                    roi_metrics.get("functionality_score", roi_metrics.get("security_functionality_score", 0.0)),
+                    roi_metrics.get("scalability_factor", 0.0),
+                    roi_metrics.get("file_implementation_score", 0.0),
+                    roi_metrics.get("lottery_algorithm_applicability", 0.0),
+                    audit_timestamp
+                ))
+            
+            write_logger.executemany(self.audit_db, '''
+                INSERT INTO implementation_audit 
+                (implementation_name, audit_type, operational_status, roi_potential,
+                 performance_metrics, verification_results, audit_timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', audit_rows)
+            write_logger.executemany(self.audit_db, '''
+                INSERT INTO roi_analysis 
+                (implementation, resource_generation_potential, efficiency_rating, scalability_factor,
+                 real_world_applicability, lottery_algorithm_potential, audit_timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            ''', roi_rows)
+            
+        except Exception as e:
+            print(f"Audit logging error: {e}")
+    
     def calculate_overall_roi(self, implementation_audits):
         """REAL: Calculate overall ROI score from all implementations"""
         
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY AGENT SCHEDULER
+Dependency-Ordered Parallel Agent Execution Over Shared-Memory Draw History
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+
+# Placeholders substituted into task arguments inside the worker
+SHARED_HISTORY = "__NEXUS_SHARED_HISTORY__"
+DEPENDENCY_RESULTS = "__NEXUS_DEPENDENCY_RESULTS__"
+
+# Histories shorter than this run their agents in process: pool start-up, pickling
+# and cold worker caches cost more than the agents themselves
+POOLED_MIN_DRAWS = 5000
+
+# Draw matrices attached in this worker process, keyed by shared block names
+_attached_histories = {}
+
+
+class NexusAgentTask:
+    """REAL: One agent invocation and the agents whose results it consumes"""
+
+    def __init__(self, function, args=(), depends_on=()):
+        self.function = function
+        self.args = tuple(args)
+        self.depends_on = tuple(depends_on)
+
+
+def share_draw_matrix(draw_matrix):
+    """REAL: Copy draw matrix columns into shared memory once; returns (blocks, descriptor)"""
+    arrays = {
+        "main": draw_matrix.main,
+        "special": draw_matrix.special
+    }
+    if draw_matrix.draw_dates is not None:
+        try:
+            arrays["draw_dates"] = np.asarray(draw_matrix.draw_dates, dtype="datetime64[D]")
+        except (TypeError, ValueError):
+            # Non-ISO legacy dates are not shared; workers see draw_dates=None
+            pass
+
+    blocks = []
+    descriptor = {
+        "number_range": draw_matrix.number_range,
+        "game_type": draw_matrix.game_type,
+        "arrays": {}
+    }
+
+    for array_name, array in arrays.items():
+        block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+        blocks.append(block)
+        descriptor["arrays"][array_name] = (block.name, array.shape, array.dtype.str)
+
+    return blocks, descriptor
+
+
+def attach_draw_matrix(descriptor):
+    """REAL: Rebuild a draw matrix as zero-copy views over shared memory blocks"""
+    cache_key = tuple(spec[0] for spec in descriptor["arrays"].values())
+    if cache_key in _attached_histories:
+        return _attached_histories[cache_key][1]
+
+    blocks = []
+    arrays = {}
+    for array_name, (block_name, shape, dtype) in descriptor["arrays"].items():
+        # Pool workers share the creating process's resource tracker, which unlinks the block
+        block = shared_memory.SharedMemory(name=block_name)
+        blocks.append(block)
+        arrays[array_name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+
+    draw_matrix = NexusDrawMatrix(
+        arrays["main"],
+        descriptor["number_range"],
+        special_numbers=arrays["special"],
+        draw_dates=arrays.get("draw_dates"),
+        game_type=descriptor["game_type"]
+    )
+    _attached_histories[cache_key] = (blocks, draw_matrix)
+    return draw_matrix
+
+
+def _resolve_argument(argument, history, dependency_results):
+    if isinstance(argument, str):
+        if argument == SHARED_HISTORY:
+            return history
+        if argument == DEPENDENCY_RESULTS:
+            return dependency_results
+    return argument
+
+
+def _execute_agent_task(function, args, history_descriptor, dependency_results):
+    """REAL: Worker entry point - attach shared history, run the agent, time it"""
+    start_time = time.perf_counter()
+    history = attach_draw_matrix(history_descriptor) if history_descriptor else None
+
+    resolved_args = [_resolve_argument(arg, history, dependency_results) for arg in args]
+    result = function(*resolved_args)
+
+    return result, time.perf_counter() - start_time
+
+
+class NexusAgentScheduler:
+    """REAL: DAG scheduler running independent agents concurrently on a process pool
+
+    Schedules with a single worker, or over fewer than min_pooled_draws shared
+    draws, run in process instead.
+    """
+
+    def __init__(self, max_workers=None, use_processes=True, min_pooled_draws=POOLED_MIN_DRAWS):
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.use_processes = use_processes
+        self.min_pooled_draws = min_pooled_draws
+
+    def uses_pool(self, shared_history):
+        """REAL: Whether a schedule over shared_history runs on a process pool"""
+        return (self.use_processes and self.max_workers > 1 and shared_history is not None
+                and len(shared_history) >= self.min_pooled_draws)
+
+    def _validate(self, tasks):
+        """REAL: Reject unknown dependencies and cycles before anything runs"""
+        for task_name, task in tasks.items():
+            for dependency in task.depends_on:
+                if dependency not in tasks:
+                    raise ValueError(f"Agent {task_name} depends on unknown agent {dependency}")
+
+        remaining = {name: set(task.depends_on) for name, task in tasks.items()}
+        while remaining:
+            ready = [name for name, dependencies in remaining.items() if not dependencies]
+            if not ready:
+                raise ValueError(f"Agent dependency cycle between: {sorted(remaining)}")
+            for name in ready:
+                del remaining[name]
+            for dependencies in remaining.values():
+                dependencies.difference_update(ready)
+
+    def run(self, tasks, shared_history=None, on_result=None):
+        """REAL: Run every task once its dependencies finished
+
+        Returns the per-agent results, per-agent wall times (measured inside the
+        worker) and the total wall time of the schedule. on_result, if given,
+        is called with (agent_name, result, wall_time) as each agent finishes.
+
+        Results and dependency results are pickled between processes, so agents
+        should return arrays and summaries rather than per-ticket records. Each
+        task pickles its bound agent method, so worker-side in-memory state
+        does not survive from one run to the next.
+        """
+        self._validate(tasks)
+
+        schedule_result = {
+            "results": {},
+            "agent_timings": {},
+            "total_wall_time": 0.0
+        }
+        schedule_start = time.perf_counter()
+
+        if not self.uses_pool(shared_history):
+            self._run_in_process(tasks, shared_history, schedule_result, on_result)
+            schedule_result["total_wall_time"] = time.perf_counter() - schedule_start
+            return schedule_result
+
+        blocks, descriptor = share_draw_matrix(shared_history) if shared_history is not None else ([], None)
+
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                pending = dict(tasks)
+                running = {}
+
+                def submit_ready():
+                    # Submit every agent whose dependencies have all completed
+                    for task_name in [name for name, task in pending.items()
+                                      if all(dep in schedule_result["results"] for dep in task.depends_on)]:
+                        task = pending.pop(task_name)
+                        dependency_results = {dep: schedule_result["results"][dep] for dep in task.depends_on}
+                        future = executor.submit(_execute_agent_task, task.function, task.args,
+                                                 descriptor, dependency_results)
+                        running[future] = task_name
+
+                submit_ready()
+                while running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    finished = []
+                    for future in done:
+                        task_name = running.pop(future)
+                        try:
+                            result, wall_time = future.result()
+                        except Exception as e:
+                            result, wall_time = {"error": str(e)}, 0.0
+                        schedule_result["results"][task_name] = result
+                        schedule_result["agent_timings"][task_name] = wall_time
+                        finished.append((task_name, result, wall_time))
+
+                    # Dependents start before on_result runs, so a slow consumer overlaps the pool
+                    submit_ready()
+                    if on_result is not None:
+                        for task_name, result, wall_time in finished:
+                            on_result(task_name, result, wall_time)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        schedule_result["total_wall_time"] = time.perf_counter() - schedule_start
+        return schedule_result
+
+    def _run_in_process(self, tasks, shared_history, schedule_result, on_result=None):
+        """REAL: Serial fallback in dependency order, without a pool"""
+        pending = dict(tasks)
+        while pending:
+            for task_name in [name for name, task in pending.items()
+                              if all(dep in schedule_result["results"] for dep in task.depends_on)]:
+                task = pending.pop(task_name)
+                dependency_results = {dep: schedule_result["results"][dep] for dep in task.depends_on}
+                start_time = time.perf_counter()
+                try:
+                    resolved_args = [_resolve_argument(arg, shared_history, dependency_results) for arg in task.args]
+                    result = task.function(*resolved_args)
+                except Exception as e:
+                    result = {"error": str(e)}
+                schedule_result["results"][task_name] = result
+                schedule_result["agent_timings"][task_name] = time.perf_counter() - start_time
+                if on_result is not None:
+                    on_result(task_name, result, schedule_result["agent_timings"][task_name])
@@ -18,48 +18,189 @@ from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import hashlib
 import pickle
+import uuid
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_incremental_state import NexusIncrementalAnalysisState, tracked_gap_values
+from nexus_lottery_draw_store import NexusDrawStore
+from nexus_lottery_draw_ingestion import NexusDrawIngestion
+from nexus_lottery_draw_synthesizer import synthesize_draw_matrix, synthesize_draw_store
+from nexus_lottery_sequence_engine import fibonacci_lookup
+from nexus_lottery_game_spec import NexusGameSpec
+from nexus_lottery_ticket_sampler import NexusTicketSampler, build_number_weights
+from nexus_lottery_ticket_index import NexusTicketIndex
+from nexus_lottery_temporal_engine import NexusTemporalWindowEngine
+from nexus_lottery_neural_models import (
+    NexusConvolutionalScorer, NexusAttentionScorer, fit_stacking_weights, holdout_lift
+)
+from nexus_lottery_model_cache import NexusModelCache
+from nexus_lottery_ensemble_voter import NexusEnsembleVoter, agent_overall_confidence
+from nexus_lottery_backtester import NexusWalkForwardBacktester
+from nexus_lottery_monte_carlo import NexusMonteCarloEngine
+from nexus_lottery_odds_tables import prize_matrix
+from nexus_lottery_prediction_store import NexusPredictionStore
+from nexus_lottery_prediction_query import NexusPredictionQuery
+from nexus_lottery_result_writer import NexusDeploymentResultWriter
+from nexus_write_behind_logger import get_write_behind_logger
+from nexus_lottery_agent_scheduler import (
+    NexusAgentScheduler, NexusAgentTask, SHARED_HISTORY, DEPENDENCY_RESULTS
+)
+
+# Jackpot used for expected-return estimates (midpoint of the $10M-$500M simulated jackpots)
+REFERENCE_JACKPOT = 255000000
+
+# Base seed of the synthetic history used when a game has no draw store
+SYNTHETIC_HISTORY_SEED = 20240101
+
+# Per-ticket model outputs a prediction batch may carry, and their prediction record fields
+TICKET_OUTPUT_FIELDS = {
+    "ticket_neural_probabilities": "neural_probability",
+    "ticket_consciousness_guidance": "consciousness_guidance"
+}
+
+def numpy_json_default(value):
+    """REAL: JSON fallback for NumPy arrays and scalars inside deployment results"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
 
 class NexusLotteryAlgorithmSystem:
     """REAL: Advanced lottery algorithm system for resource generation"""
     
     def __init__(self):
         self.desktop_path = "/Users/josematos/Desktop"
+        self.draw_store_path = f"{self.desktop_path}/nexus_lottery_draw_store"
+        self.model_cache_path = f"{self.desktop_path}/nexus_lottery_model_cache"
         self.algorithm_timestamp = datetime.now().isoformat()
         
+        # Supported lottery game configurations
+        self.lottery_games = {
+            "powerball": {
+                "white_balls": {"range": (1, 69), "count": 5},
+                "power_ball": {"range": (1, 26), "count": 1}
+            },
+            "mega_millions": {
+                "main_balls": {"range": (1, 70), "count": 5},
+                "mega_ball": {"range": (1, 25), "count": 1}
+            },
+            "state_lotto": {
+                "numbers": {"range": (1, 49), "count": 6}
+            }
+        }
+        
+        # Game configs compiled once into ranges, counts and lookup tables
+        self.game_specs = {
+            game_type: NexusGameSpec.from_game_config(game_config, game_type)
+            for game_type, game_config in self.lottery_games.items()
+        }
+        
+        # Specs of plain game configs passed to the analyses, compiled once per config
+        self.game_spec_cache = {
+            repr(game_config): self.game_specs[game_type] for game_type, game_config in self.lottery_games.items()
+        }
+        
         # Multi-agent coordination system
         self.agent_system = {
             "pattern_agent": {
                 "role": "PATTERN_ANALYSIS_SPECIALIST",
                 "capabilities": ["frequency_analysis", "sequence_detection", "gap_analysis"],
                 "performance_weight": 0.25,
-                "implementation": self.pattern_analysis_agent
+                "implementation": self.pattern_analysis_agent,
+                "depends_on": []
             },
             "neural_agent": {
                 "role": "NEURAL_PREDICTION_SPECIALIST", 
                 "capabilities": ["lstm_prediction", "cnn_detection", "transformer_analysis"],
                 "performance_weight": 0.30,
-                "implementation": self.neural_prediction_agent
+                "implementation": self.neural_prediction_agent,
+                "depends_on": []
             },
             "consciousness_agent": {
                 "role": "CONSCIOUSNESS_GUIDANCE_SPECIALIST",
                 "capabilities": ["intuitive_selection", "awareness_amplification", "intention_manifestation"],
                 "performance_weight": 0.25,
-                "implementation": self.consciousness_guidance_agent
+                "implementation": self.consciousness_guidance_agent,
+                "depends_on": []
             },
             "optimization_agent": {
                 "role": "OPTIMIZATION_AND_COORDINATION_SPECIALIST",
                 "capabilities": ["ensemble_optimization", "agent_coordination", "resource_allocation"],
                 "performance_weight": 0.20,
-                "implementation": self.optimization_coordination_agent
+                "implementation": self.optimization_coordination_agent,
+                "depends_on": ["pattern_agent", "neural_agent", "consciousness_agent"]
             }
         }
         
+        # Per-process caches: draw history per game, analyses per (game, history fingerprint)
+        self.history_cache = {}
+        self.analysis_cache = {}
+        
+        # Per-process ticket indexes: every ticket generated per game, across deployments
+        self.ticket_indexes = {}
+        
+        # Per-process neural model instances keyed by (network type, game, number range),
+        # backed by trained weights on disk so warm deployments skip training
+        self.neural_models = {}
+        self.model_cache = NexusModelCache(self.model_cache_path)
+        
+        # Monte Carlo budget per deployment, in simulated (draw x ticket) matches
+        self.outcome_simulation_cells = 200000000
+        self.outcome_simulation_max_draws = 1000000
+        
+        # Seconds a game batch waits for its queued prediction writes to commit
+        self.prediction_flush_timeout = 300.0
+        
+        # Keep agents' intermediate analyses (frequency maps, network outputs, vote arrays) in result files
+        self.persist_agent_analyses = True
+        
         print("🤖 MULTI-AGENT COORDINATION: INITIALIZED")
     
+    def __getstate__(self):
+        """REAL: Keep caches out of the state shipped to worker processes"""
+        state = self.__dict__.copy()
+        state["history_cache"] = {}
+        state["analysis_cache"] = {}
+        state["ticket_indexes"] = {}
+        state["neural_models"] = {}
+        return state
+    
+    def get_game_spec(self, game_type):
+        """REAL: Compiled spec for a game (powerball for unknown games)"""
+        return self.game_specs.get(game_type, self.game_specs["powerball"])
+    
+    def resolve_game_spec(self, game_config):
+        """REAL: Compiled spec for a game config (specs are returned unchanged)
+        
+        lottery_games entries resolve to their game's spec; any other config is
+        compiled on first use and cached, so analyses never rebuild the subset-sum
+        and odds tables per call.
+        """
+        if isinstance(game_config, NexusGameSpec):
+            return game_config
+        config_key = repr(game_config)
+        if config_key not in self.game_spec_cache:
+            self.game_spec_cache[config_key] = NexusGameSpec.from_game_config(game_config)
+        return self.game_spec_cache[config_key]
+    
     # === CORE LOTTERY ALGORITHM IMPLEMENTATIONS ===
     
-    def execute_lottery_algorithm_deployment(self, game_type="powerball", prediction_count=10):
-        """REAL: Execute complete lottery algorithm deployment"""
+    def execute_lottery_algorithm_deployment(self, game_type="powerball", prediction_count=10,
+                                             historical_data=None, agent_scheduler=None):
+        """REAL: Execute complete lottery algorithm deployment
+        
+        historical_data may be a draw list or draw matrix to reuse; otherwise a
+        synthetic history is generated. agent_scheduler defaults to a process pool
+        for histories of at least POOLED_MIN_DRAWS draws (in process below that).
+        Pool workers receive the system without its in-memory caches (see
+        __getstate__): analysis_cache and neural_models start cold in every pooled
+        deployment, and only the on-disk model cache carries trained networks
+        over. Pass NexusAgentScheduler(use_processes=False) to keep the warm
+        in-memory state across deployments.
+        """
         
         deployment_result = {
             "deployment_timestamp": datetime.now().isoformat(),
@@ -72,37 +213,53 @@ class NexusLotteryAlgorithmSystem:
             "deployment_success": False
         }
         
+        results_writer = None
+        
         try:
             print(f"🚀 DEPLOYING LOTTERY ALGORITHMS FOR {game_type.upper()}")
             
             # Generate historical data for analysis
-            historical_data = self.generate_historical_lottery_data(game_type, 500)  # 500 historical draws
+            if historical_data is None:
+                historical_data = self.load_historical_draws(game_type, 500)  # 500 historical draws
+            
+            # Build the shared draw matrix once for every agent
+            game_spec = self.get_game_spec(game_type)
+            draw_matrix = self.build_draw_matrix(historical_data, game_spec, game_type)
+            
+            # Deploy agents concurrently; each runs once the agents it depends on finish
+            agent_tasks = {}
+            for agent_name, agent_config in self.agent_system.items():
+                print(f"🤖 ACTIVATING: {agent_config['role']}")
+                agent_input = DEPENDENCY_RESULTS if agent_config["depends_on"] else SHARED_HISTORY
+                agent_tasks[agent_name] = NexusAgentTask(
+                    agent_config["implementation"],
+                    (game_type, agent_input, prediction_count),
+                    depends_on=agent_config["depends_on"]
+                )
             
-            # Deploy each agent for predictions
-            agent_results = {}
+            # Stream each agent's result to the results file as soon as it finishes
+            results_writer = self.open_deployment_results_writer(deployment_result)
             
-            # Pattern Analysis Agent
-            print("🔍 ACTIVATING: Pattern Analysis Agent")
-            pattern_predictions = self.pattern_analysis_agent(game_type, historical_data, prediction_count)
-            agent_results["pattern_agent"] = pattern_predictions
+            # Agents return ticket arrays; per-ticket records are built here, not in the workers
+            expanded_results = {}
             
-            # Neural Prediction Agent
-            print("🧠 ACTIVATING: Neural Prediction Agent")
-            neural_predictions = self.neural_prediction_agent(game_type, historical_data, prediction_count)
-            agent_results["neural_agent"] = neural_predictions
+            def collect_agent_result(agent_name, agent_result, wall_time):
+                expanded_results[agent_name] = self.expand_agent_predictions(agent_result)
+                if results_writer:
+                    results_writer.write_agent_result(agent_name, expanded_results[agent_name], wall_time)
             
-            # Consciousness Guidance Agent
-            print("🌟 ACTIVATING: Consciousness Guidance Agent")
-            consciousness_predictions = self.consciousness_guidance_agent(game_type, historical_data, prediction_count)
-            agent_results["consciousness_agent"] = consciousness_predictions
+            agent_scheduler = agent_scheduler or NexusAgentScheduler()
+            schedule_result = agent_scheduler.run(agent_tasks, shared_history=draw_matrix, on_result=collect_agent_result)
+            agent_results = {agent_name: expanded_results[agent_name] for agent_name in schedule_result["results"]}
             
-            # Optimization and Coordination Agent
-            print("⚡ ACTIVATING: Optimization Coordination Agent")
-            optimization_predictions = self.optimization_coordination_agent(game_type, agent_results, prediction_count)
-            agent_results["optimization_agent"] = optimization_predictions
+            deployment_result["agent_timings"] = schedule_result["agent_timings"]
+            deployment_result["agent_wall_time"] = schedule_result["total_wall_time"]
             
             deployment_result["agent_predictions"] = agent_results
             
+            # Index every agent ticket to count duplicates and pair/triple coverage
+            deployment_result["ticket_coverage"] = self.index_agent_predictions(game_type, agent_results)
+            
             # Generate ensemble predictions
             ensemble_predictions = self.generate_ensemble_predictions(agent_results, game_type, prediction_count)
             deployment_result["ensemble_predictions"] = ensemble_predictions
@@ -111,16 +268,16 @@ class NexusLotteryAlgorithmSystem:
             confidence_scores = self.calculate_prediction_confidence(agent_results, ensemble_predictions)
             deployment_result["confidence_scores"] = confidence_scores
             
-            # Estimate resource generation potential
+            # Estimate resource generation potential from the exact odds of the ensemble tickets
             resource_estimate = self.estimate_resource_generation_potential(
-                ensemble_predictions, confidence_scores, game_type
+                len(ensemble_predictions), confidence_scores, game_type
             )
             deployment_result["resource_generation_estimate"] = resource_estimate
             
             deployment_result["deployment_success"] = True
             
             # Save deployment results
-            self.save_deployment_results(deployment_result)
+            self.save_deployment_results(deployment_result, results_writer)
             
             # Generate lottery strategy report
             self.generate_lottery_strategy_report(deployment_result)
@@ -135,9 +292,242 @@ class NexusLotteryAlgorithmSystem:
             deployment_result["error"] = str(e)
             deployment_result["deployment_success"] = False
             return deployment_result
+        
+        finally:
+            if results_writer:
+                results_writer.close()
+    
+    def execute_lottery_algorithm_batch(self, jobs, max_workers=None):
+        """REAL: Execute deployments for many (game_type, prediction_count) jobs
+        
+        Jobs are grouped by game so each game's history is generated and analysed
+        once; games fan out across worker processes.
+        """
+        
+        batch_result = {
+            "batch_timestamp": datetime.now().isoformat(),
+            "jobs": [{"game_type": game_type, "prediction_count": count} for game_type, count in jobs],
+            "deployment_results": [],
+            "games_deployed": [],
+            "batch_wall_time": 0.0
+        }
+        
+        batch_start = time.perf_counter()
+        
+        # Deduplicate work by game, and identical jobs within a game
+        game_jobs = {}
+        for game_type, prediction_count in jobs:
+            game_counts = game_jobs.setdefault(game_type, [])
+            if prediction_count not in game_counts:
+                game_counts.append(prediction_count)
+        
+        game_results = {}
+        worker_count = min(len(game_jobs), max_workers or os.cpu_count() or 1)
+        
+        if worker_count > 1:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                futures = {
+                    game_type: executor.submit(self.execute_game_batch, game_type, counts)
+                    for game_type, counts in game_jobs.items()
+                }
+                for game_type, future in futures.items():
+                    try:
+                        game_results[game_type] = future.result()
+                    except Exception as e:
+                        game_results[game_type] = {
+                            count: {"game_type": game_type, "prediction_count": count,
+                                    "deployment_success": False, "error": str(e)}
+                            for count in game_jobs[game_type]
+                        }
+        else:
+            for game_type, counts in game_jobs.items():
+                game_results[game_type] = self.execute_game_batch(game_type, counts)
+        
+        batch_result["deployment_results"] = [
+            game_results[game_type][prediction_count] for game_type, prediction_count in jobs
+        ]
+        batch_result["games_deployed"] = list(game_jobs)
+        batch_result["batch_wall_time"] = time.perf_counter() - batch_start
+        
+        return batch_result
+    
+    def execute_game_batch(self, game_type, prediction_counts):
+        """REAL: Run every prediction count of one game against a single shared history"""
+        
+        game_spec = self.get_game_spec(game_type)
+        
+        if game_type not in self.history_cache:
+            historical_data = self.load_historical_draws(game_type, 500)
+            self.history_cache[game_type] = self.build_draw_matrix(historical_data, game_spec, game_type)
+        draw_matrix = self.history_cache[game_type]
+        
+        # Games already run in parallel, so agents of one game share this process
+        agent_scheduler = NexusAgentScheduler(use_processes=False)
+        
+        write_logger = get_write_behind_logger()
+        failed_writes_before = write_logger.metrics()["failed_writes"]
+        
+        game_results = {
+            prediction_count: self.execute_lottery_algorithm_deployment(
+                game_type, prediction_count, historical_data=draw_matrix, agent_scheduler=agent_scheduler
+            )
+            for prediction_count in prediction_counts
+        }
+        
+        # Pool workers leave through os._exit, skipping the logger's atexit flush,
+        # so the game's queued predictions are committed before it returns
+        flushed = write_logger.flush(timeout=self.prediction_flush_timeout)
+        write_metrics = write_logger.metrics()
+        failed_writes = write_metrics["failed_writes"] - failed_writes_before
+        if not flushed or failed_writes:
+            persistence_error = (
+                f"Prediction writes not committed: {write_metrics['pending_writes']} pending, "
+                f"{failed_writes} failed ({write_metrics['last_error']})"
+            )
+            print(f"❌ {game_type.upper()}: {persistence_error}")
+            for deployment_result in game_results.values():
+                deployment_result["deployment_success"] = False
+                deployment_result["error"] = persistence_error
+        
+        return game_results
     
-    def pattern_analysis_agent(self, game_type, historical_data, prediction_count):
-        """REAL: Pattern analysis agent implementation"""
+    def run_walk_forward_backtest(self, game_type, historical_data=None, start=100, end=None,
+                                  tickets_per_step=10, agent_names=None, max_workers=None, seed=0):
+        """REAL: Replay the agents over the history and score them against each next draw
+        
+        Step t runs the agents on draws [0, t) and scores their tickets against
+        draw t; the report compares each agent's match distribution with random
+        tickets and with the exact random odds.
+        """
+        
+        game_spec = self.get_game_spec(game_type)
+        if historical_data is None:
+            historical_data = self.load_historical_draws(game_type, 500)
+        draw_matrix = self.build_draw_matrix(historical_data, game_spec, game_type)
+        
+        print(f"🔁 BACKTESTING {game_type.upper()}: draws {start} to {end or len(draw_matrix)}")
+        backtester = NexusWalkForwardBacktester(
+            self, game_type, agent_names=agent_names, tickets_per_step=tickets_per_step,
+            seed=seed, max_workers=max_workers
+        )
+        backtest_report = backtester.run(draw_matrix, start, end)
+        
+        for agent_name, summary in backtest_report["agents"].items():
+            print(f"📈 {agent_name}: lift {summary['lift_over_random']:.3f} over random, "
+                  f"z {summary['z_score_vs_random']:+.2f} ({summary['steps_scored']} steps)")
+        print(f"⏱️ BACKTEST COMPLETE: {backtest_report['steps']} steps in {backtest_report['wall_time']:.1f}s")
+        
+        return backtest_report
+    
+    def simulate_ticket_outcomes(self, game_type, tickets, draw_count=None, special_numbers=None,
+                                 seed=None, max_workers=None):
+        """REAL: Monte Carlo match-class distribution of a ticket set over simulated future draws
+        
+        Without draw_count, as many draws as fit outcome_simulation_cells are
+        simulated (capped at outcome_simulation_max_draws).
+        """
+        
+        simulation = {"draws_simulated": 0, "ticket_count": 0}
+        
+        try:
+            game_spec = self.get_game_spec(game_type)
+            tickets = np.asarray(tickets, dtype=np.int64).reshape(-1, game_spec.ball_count)
+            if not len(tickets):
+                return simulation
+            if draw_count is None:
+                draw_count = max(1, min(self.outcome_simulation_max_draws,
+                                        self.outcome_simulation_cells // len(tickets)))
+            
+            engine = NexusMonteCarloEngine(game_spec, seed=seed, max_workers=max_workers)
+            simulation = engine.simulate(tickets, draw_count, special_numbers)
+            
+            # Share of simulated draws in which the set's best ticket reached each match count
+            best_matches = simulation["set_best_match_histogram"]
+            simulation["set_best_match_rates"] = {
+                f"{matches}+": float(best_matches[matches:].sum() / draw_count)
+                for matches in range(1, game_spec.ball_count + 1)
+            }
+            
+            # Exact per-ticket rates for comparison; identical for every ticket
+            simulation["exact_ticket_match_rates"] = {
+                f"{matches}+": float(game_spec.odds_table.main_at_least[matches])
+                for matches in range(1, game_spec.ball_count + 1)
+            }
+            
+        except Exception as e:
+            simulation["error"] = str(e)
+        
+        return simulation
+    
+    def get_ticket_index(self, game_type):
+        """REAL: The game's ticket index, created on first use"""
+        
+        if game_type not in self.ticket_indexes:
+            self.ticket_indexes[game_type] = NexusTicketIndex.from_game_spec(self.get_game_spec(game_type))
+        return self.ticket_indexes[game_type]
+    
+    def index_agent_predictions(self, game_type, agent_results):
+        """REAL: Add every agent's tickets to the game's index and report overlap and coverage"""
+        
+        coverage_report = {
+            "tickets_submitted": 0,
+            "new_tickets": 0,
+            "duplicate_tickets": 0,
+            "indexed_tickets": 0,
+            "agent_new_tickets": {},
+            "pair_coverage": {},
+            "triple_coverage": {}
+        }
+        
+        try:
+            ticket_index = self.get_ticket_index(game_type)
+            ball_count = ticket_index.ball_count
+            
+            for agent_name, agent_result in agent_results.items():
+                if not isinstance(agent_result, dict):
+                    continue
+                tickets = agent_result.get("candidate_tickets")
+                if tickets is None:
+                    tickets = [
+                        prediction["numbers"] for prediction in agent_result.get("predictions", [])
+                        if isinstance(prediction, dict) and len(prediction.get("numbers", [])) == ball_count
+                    ]
+                tickets = np.asarray(tickets, dtype=np.int64).reshape(-1, ball_count)
+                if not len(tickets):
+                    continue
+                
+                is_new = ticket_index.add(tickets)
+                coverage_report["tickets_submitted"] += len(tickets)
+                coverage_report["new_tickets"] += int(is_new.sum())
+                coverage_report["agent_new_tickets"][agent_name] = int(is_new.sum())
+            
+            coverage_report["duplicate_tickets"] = coverage_report["tickets_submitted"] - coverage_report["new_tickets"]
+            coverage_report["indexed_tickets"] = len(ticket_index)
+            if 2 in ticket_index.coverage_sizes:
+                coverage_report["pair_coverage"] = ticket_index.coverage(2)
+            if 3 in ticket_index.coverage_sizes:
+                coverage_report["triple_coverage"] = ticket_index.coverage(3)
+            
+        except Exception as e:
+            coverage_report["error"] = str(e)
+        
+        return coverage_report
+    
+    def cached_analysis(self, cache_key, compute_analysis):
+        """REAL: Return a cached analysis or compute and remember it"""
+        
+        if cache_key not in self.analysis_cache:
+            self.analysis_cache[cache_key] = compute_analysis()
+        return self.analysis_cache[cache_key]
+    
+    def pattern_analysis_agent(self, game_type, historical_data, prediction_count, horizons=None, seed=None):
+        """REAL: Pattern analysis agent implementation
+        
+        Passing horizons (e.g. (50, 200, 1000, None)) adds a multi-horizon analysis
+        computed in the same pass over the draw matrix. All prediction_count tickets
+        come from one batch sample; "candidate_tickets" holds them as an int array.
+        Per-ticket prediction records are built by expand_agent_predictions.
+        """
         
         agent_result = {
             "agent_type": "PATTERN_ANALYSIS_AGENT",
@@ -148,33 +538,46 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            game_config = self.lottery_games.get(game_type, self.lottery_games["powerball"])
-            
-            # Frequency Pattern Analysis
-            frequency_analysis = self.analyze_frequency_patterns(historical_data, game_config)
-            agent_result["analysis_methods"].append(frequency_analysis)
+            game_spec = self.get_game_spec(game_type)
+            draw_matrix = self.build_draw_matrix(historical_data, game_spec, game_type)
+            
+            # Frequency and gap statistics are served from an incremental state when one is supplied
+            running_analysis = historical_data if isinstance(historical_data, NexusIncrementalAnalysisState) else draw_matrix
+            
+            def run_pattern_analyses():
+                return [
+                    # Frequency Pattern Analysis
+                    self.analyze_frequency_patterns(running_analysis, game_spec),
+                    # Sequence Pattern Detection
+                    self.detect_sequence_patterns(draw_matrix, game_spec),
+                    # Gap Pattern Analysis
+                    self.analyze_gap_patterns(running_analysis, game_spec),
+                    # Sum Range Pattern Analysis
+                    self.analyze_sum_range_patterns(draw_matrix, game_spec)
+                ]
             
-            # Sequence Pattern Detection
-            sequence_analysis = self.detect_sequence_patterns(historical_data, game_config)
-            agent_result["analysis_methods"].append(sequence_analysis)
+            # Analyses only depend on the history, so deployments over the same draws reuse them
+            if running_analysis is draw_matrix:
+                pattern_analyses = self.cached_analysis(
+                    (game_type, draw_matrix.fingerprint(), "pattern_analyses"), run_pattern_analyses
+                )
+            else:
+                pattern_analyses = run_pattern_analyses()
             
-            # Gap Pattern Analysis
-            gap_analysis = self.analyze_gap_patterns(historical_data, game_config)
-            agent_result["analysis_methods"].append(gap_analysis)
+            frequency_analysis, sequence_analysis, gap_analysis, sum_analysis = pattern_analyses
+            agent_result["analysis_methods"].extend(pattern_analyses)
             
-            # Sum Range Pattern Analysis
-            sum_analysis = self.analyze_sum_range_patterns(historical_data, game_config)
-            agent_result["analysis_methods"].append(sum_analysis)
+            # Multi-Horizon Pattern Analysis
+            if horizons:
+                horizon_analysis = self.analyze_multi_horizon_patterns(draw_matrix, game_spec, horizons)
+                agent_result["analysis_methods"].append(horizon_analysis)
             
-            # Generate predictions based on pattern analysis
-            for i in range(prediction_count):
-                prediction = self.generate_pattern_based_prediction(
-                    game_config, frequency_analysis, sequence_analysis, gap_analysis, sum_analysis
-                )
-                
-                prediction["prediction_id"] = f"pattern_pred_{i}"
-                prediction["generation_timestamp"] = time.time()
-                agent_result["predictions"].append(prediction)
+            # Generate predictions based on pattern analysis, all tickets in one batch
+            prediction_batch = self.generate_pattern_based_predictions(
+                game_spec, frequency_analysis, sequence_analysis, gap_analysis, sum_analysis,
+                prediction_count, seed
+            )
+            self.attach_prediction_batch(agent_result, prediction_batch, "pattern_pred")
             
             # Calculate pattern confidence
             agent_result["pattern_confidence"] = {
@@ -188,7 +591,7 @@ class NexusLotteryAlgorithmSystem:
             # Performance metrics
             agent_result["performance_metrics"] = {
                 "analysis_methods_used": len(agent_result["analysis_methods"]),
-                "predictions_generated": len(agent_result["predictions"]),
+                "predictions_generated": len(agent_result["candidate_tickets"]),
                 "average_confidence": agent_result["pattern_confidence"]["overall_confidence"],
                 "processing_time": time.time()
             }
@@ -198,6 +601,20 @@ class NexusLotteryAlgorithmSystem:
         
         return agent_result
     
+    def build_draw_matrix(self, historical_data, game_config, game_type=None):
+        """REAL: Build (or reuse) the columnar draw matrix for vectorized analysis"""
+        
+        if isinstance(historical_data, NexusDrawMatrix):
+            return historical_data
+        
+        if isinstance(historical_data, NexusIncrementalAnalysisState):
+            return historical_data.to_draw_matrix()
+        
+        if isinstance(historical_data, NexusDrawStore):
+            return historical_data.to_draw_matrix()
+        
+        return NexusDrawMatrix.from_historical_data(historical_data, game_config, game_type)
+    
     def analyze_frequency_patterns(self, historical_data, game_config):
         """REAL: Analyze number frequency patterns"""
         
@@ -211,52 +628,127 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            # Determine number range
-            if "white_balls" in game_config:
-                number_range = game_config["white_balls"]["range"]
-                ball_count = game_config["white_balls"]["count"]
-            elif "main_balls" in game_config:
-                number_range = game_config["main_balls"]["range"]
-                ball_count = game_config["main_balls"]["count"]
+            if isinstance(historical_data, NexusIncrementalAnalysisState):
+                # Counters are maintained per draw by the incremental state
+                numbers = historical_data.numbers
+                frequencies = historical_data.frequencies
             else:
-                number_range = game_config["numbers"]["range"]
-                ball_count = game_config["numbers"]["count"]
+                # Count frequencies with a single bincount over the main ball columns
+                draw_matrix = self.build_draw_matrix(historical_data, game_config)
+                numbers = draw_matrix.numbers
+                frequencies = draw_matrix.number_frequencies()
             
-            # Initialize frequency counters
-            for num in range(number_range[0], number_range[1] + 1):
-                analysis["number_frequencies"][num] = 0
-            
-            # Count frequencies from historical data
-            for draw in historical_data:
-                numbers = draw["numbers"][:ball_count]  # Main numbers only
-                for num in numbers:
-                    if num in analysis["number_frequencies"]:
-                        analysis["number_frequencies"][num] += 1
-            
-            # Calculate statistics
-            frequencies = list(analysis["number_frequencies"].values())
-            avg_frequency = statistics.mean(frequencies)
-            std_frequency = statistics.stdev(frequencies) if len(frequencies) > 1 else 0
-            
-            # Categorize numbers
-            for num, freq in analysis["number_frequencies"].items():
-                if freq > avg_frequency + std_frequency:
-                    analysis["hot_numbers"].append({"number": num, "frequency": freq})
-                elif freq < avg_frequency - std_frequency:
-                    analysis["cold_numbers"].append({"number": num, "frequency": freq})
-                else:
-                    analysis["balanced_numbers"].append({"number": num, "frequency": freq})
+            analysis["number_frequencies"] = dict(zip(numbers.tolist(), frequencies.tolist()))
             
-            # Sort by frequency
-            analysis["hot_numbers"].sort(key=lambda x: x["frequency"], reverse=True)
-            analysis["cold_numbers"].sort(key=lambda x: x["frequency"])
+            analysis.update(self.categorize_number_frequencies(numbers, frequencies, len(historical_data)))
             
-            # Calculate confidence based on data distribution
-            frequency_variance = statistics.variance(frequencies) if len(frequencies) > 1 else 0
-            data_quality = min(1.0, len(historical_data) / 100)  # More data = higher confidence
-            distribution_quality = 1.0 / (1.0 + frequency_variance / (avg_frequency ** 2))
+        except Exception as e:
+            analysis["error"] = str(e)
+            analysis["confidence_score"] = 0.0
+        
+        return analysis
+    
+    def categorize_number_frequencies(self, numbers, frequencies, draw_count):
+        """REAL: Split numbers into hot/cold/balanced groups and score the distribution"""
+        
+        # Calculate statistics
+        avg_frequency = float(frequencies.mean())
+        std_frequency = float(frequencies.std(ddof=1)) if len(frequencies) > 1 else 0
+        
+        # Categorize numbers
+        hot_mask = frequencies > avg_frequency + std_frequency
+        cold_mask = frequencies < avg_frequency - std_frequency
+        balanced_mask = ~(hot_mask | cold_mask)
+        
+        # Sort by frequency (stable, so ties keep number order)
+        hot_order = np.argsort(-frequencies[hot_mask], kind="stable")
+        cold_order = np.argsort(frequencies[cold_mask], kind="stable")
+        
+        categories = {
+            "hot_numbers": [
+                {"number": num, "frequency": freq}
+                for num, freq in zip(numbers[hot_mask][hot_order].tolist(), frequencies[hot_mask][hot_order].tolist())
+            ],
+            "cold_numbers": [
+                {"number": num, "frequency": freq}
+                for num, freq in zip(numbers[cold_mask][cold_order].tolist(), frequencies[cold_mask][cold_order].tolist())
+            ],
+            "balanced_numbers": [
+                {"number": num, "frequency": freq}
+                for num, freq in zip(numbers[balanced_mask].tolist(), frequencies[balanced_mask].tolist())
+            ]
+        }
+        
+        # Calculate confidence based on data distribution
+        frequency_variance = float(frequencies.var(ddof=1)) if len(frequencies) > 1 else 0
+        data_quality = min(1.0, draw_count / 100)  # More data = higher confidence
+        distribution_quality = 1.0 / (1.0 + frequency_variance / (avg_frequency ** 2))
+        
+        categories["confidence_score"] = (data_quality * 0.6 + distribution_quality * 0.4) * 0.8
+        
+        return categories
+    
+    def analyze_multi_horizon_patterns(self, historical_data, game_config, horizons=(50, 200, 1000, None)):
+        """REAL: Frequency, gap and sum statistics over several trailing horizons at once
+        
+        Every horizon is a prefix-sum difference over the shared draw matrix, so adding
+        horizons costs O(range) each instead of another pass over the history.
+        A horizon of None covers all draws; non-positive horizons cover none and are
+        listed in "skipped_horizons" instead.
+        """
+        
+        analysis = {
+            "analysis_type": "MULTI_HORIZON_PATTERN_ANALYSIS",
+            "horizons": {},
+            "skipped_horizons": [],
+            "confidence_score": 0.0
+        }
+        
+        try:
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            numbers = draw_matrix.numbers
+            total_draws = len(draw_matrix)
+            
+            for horizon in horizons:
+                if horizon is not None and horizon <= 0:
+                    analysis["skipped_horizons"].append(horizon)
+                    continue
+                
+                start = 0 if horizon is None else max(0, total_draws - horizon)
+                window_draws = total_draws - start
+                horizon_key = "all" if horizon is None else f"last_{horizon}"
+                
+                # Frequencies and hot/cold classification for the window
+                frequencies = draw_matrix.window_frequencies(start, total_draws)
+                horizon_analysis = {
+                    "horizon": horizon,
+                    "draw_count": window_draws,
+                    "number_frequencies": dict(zip(numbers.tolist(), frequencies.tolist()))
+                }
+                horizon_analysis.update(self.categorize_number_frequencies(numbers, frequencies, window_draws))
+                
+                # Mean gap from first/last appearance inside the window
+                first_seen, last_seen = draw_matrix.window_appearance_bounds(start, total_draws)
+                average_gaps = np.zeros(len(numbers))
+                np.divide(last_seen - first_seen, frequencies - 1, out=average_gaps, where=frequencies > 1)
+                current_gaps = np.where(last_seen >= 0, total_draws - last_seen, 0)
+                
+                horizon_analysis["average_gaps"] = dict(zip(numbers.tolist(), average_gaps.tolist()))
+                horizon_analysis["current_gaps"] = dict(zip(numbers.tolist(), current_gaps.tolist()))
+                
+                # Sum mean/deviation from prefix moments
+                draw_count, sum_total, square_total = draw_matrix.window_sum_moments(start, total_draws)
+                sum_mean = sum_total / draw_count if draw_count > 0 else 0
+                sum_variance = (square_total - sum_total * sum_mean) / (draw_count - 1) if draw_count > 1 else 0
+                horizon_analysis["sum_statistics"] = {
+                    "mean": sum_mean,
+                    "std_dev": math.sqrt(max(0.0, sum_variance))
+                }
+                
+                analysis["horizons"][horizon_key] = horizon_analysis
             
-            analysis["confidence_score"] = (data_quality * 0.6 + distribution_quality * 0.4) * 0.8
+            horizon_scores = [h["confidence_score"] for h in analysis["horizons"].values()]
+            analysis["confidence_score"] = statistics.mean(horizon_scores) if horizon_scores else 0.0
             
         except Exception as e:
             analysis["error"] = str(e)
@@ -277,55 +769,62 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            # Analyze each historical draw for sequences
-            for draw in historical_data:
-                numbers = sorted(draw["numbers"][:5])  # Main numbers only, sorted
-                
-                # Detect consecutive sequences
-                consecutive_count = 0
-                max_consecutive = 0
-                
-                for i in range(len(numbers) - 1):
-                    if numbers[i + 1] - numbers[i] == 1:
-                        consecutive_count += 1
-                        max_consecutive = max(max_consecutive, consecutive_count + 1)
-                    else:
-                        consecutive_count = 0
-                
-                if max_consecutive >= 2:
-                    analysis["consecutive_sequences"].append({
-                        "draw_date": draw["draw_date"],
-                        "numbers": numbers,
-                        "consecutive_length": max_consecutive
-                    })
-                
-                # Detect arithmetic progressions
-                for step in range(1, 10):  # Check steps 1-9
-                    progression_count = 1
-                    for i in range(len(numbers) - 1):
-                        if i + 1 < len(numbers) and numbers[i + 1] - numbers[i] == step:
-                            progression_count += 1
-                        else:
-                            if progression_count >= 3:  # At least 3 numbers in progression
-                                analysis["arithmetic_progressions"].append({
-                                    "draw_date": draw["draw_date"],
-                                    "numbers": numbers,
-                                    "step": step,
-                                    "progression_length": progression_count
-                                })
-                            progression_count = 1
-                
-                # Detect Fibonacci-like sequences
-                fib_pattern = self.check_fibonacci_pattern(numbers)
-                if fib_pattern["is_fibonacci"]:
-                    analysis["fibonacci_sequences"].append({
-                        "draw_date": draw["draw_date"],
-                        "numbers": numbers,
-                        "fibonacci_elements": fib_pattern["elements"]
-                    })
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            sorted_main = draw_matrix.sorted_main
+            
+            # One vectorized pass finds runs, progressions and Fibonacci members for every draw
+            sequence_engine = self.resolve_game_spec(game_config).sequence_engine
+            sequences = sequence_engine.analyze(sorted_main)
+            
+            consecutive_draws = np.flatnonzero(sequences["consecutive_lengths"] >= 2)
+            fibonacci_draws = np.flatnonzero(sequences["fibonacci_counts"] >= 3)
+            
+            # Only matching draws are converted to Python lists
+            matched_draws = np.unique(np.concatenate((
+                consecutive_draws, sequences["progression_draws"], fibonacci_draws
+            )))
+            matched_rows = dict(zip(matched_draws.tolist(), sorted_main[matched_draws].tolist()))
+            matched_dates = dict(zip(matched_draws.tolist(), draw_matrix.draw_date_strings(matched_draws)))
+            
+            analysis["consecutive_sequences"] = [
+                {
+                    "draw_date": matched_dates[draw_index],
+                    "numbers": matched_rows[draw_index],
+                    "consecutive_length": consecutive_length
+                }
+                for draw_index, consecutive_length in zip(
+                    consecutive_draws.tolist(), sequences["consecutive_lengths"][consecutive_draws].tolist()
+                )
+            ]
+            
+            analysis["arithmetic_progressions"] = [
+                {
+                    "draw_date": matched_dates[draw_index],
+                    "numbers": matched_rows[draw_index],
+                    "step": step,
+                    "progression_length": progression_length
+                }
+                for draw_index, step, progression_length in zip(
+                    sequences["progression_draws"].tolist(),
+                    sequences["progression_steps"].tolist(),
+                    sequences["progression_lengths"].tolist()
+                )
+            ]
+            
+            fibonacci_members = sequences["fibonacci_members"]
+            analysis["fibonacci_sequences"] = [
+                {
+                    "draw_date": matched_dates[draw_index],
+                    "numbers": matched_rows[draw_index],
+                    "fibonacci_elements": [
+                        num for num, is_member in zip(matched_rows[draw_index], fibonacci_members[draw_index]) if is_member
+                    ]
+                }
+                for draw_index in fibonacci_draws.tolist()
+            ]
             
             # Calculate pattern strengths
-            total_draws = len(historical_data)
+            total_draws = len(draw_matrix)
             analysis["pattern_strengths"] = {
                 "consecutive_frequency": len(analysis["consecutive_sequences"]) / total_draws,
                 "arithmetic_frequency": len(analysis["arithmetic_progressions"]) / total_draws,
@@ -353,19 +852,12 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            # Generate Fibonacci sequence up to max number
+            # Look up Fibonacci membership up to the max number
             max_num = max(numbers) if numbers else 100
-            fib_sequence = [1, 1]
-            
-            while fib_sequence[-1] < max_num:
-                next_fib = fib_sequence[-1] + fib_sequence[-2]
-                fib_sequence.append(next_fib)
+            is_fibonacci = fibonacci_lookup(max_num)
             
             # Check how many numbers are Fibonacci numbers
-            fib_numbers_in_draw = []
-            for num in numbers:
-                if num in fib_sequence:
-                    fib_numbers_in_draw.append(num)
+            fib_numbers_in_draw = [num for num in numbers if 0 <= num <= max_num and is_fibonacci[num]]
             
             # Consider it a Fibonacci pattern if at least 3 numbers are Fibonacci
             if len(fib_numbers_in_draw) >= 3:
@@ -388,52 +880,57 @@ class NexusLotteryAlgorithmSystem:
             "confidence_score": 0.0
         }
         
+        if isinstance(historical_data, NexusIncrementalAnalysisState):
+            return self.analyze_incremental_gap_patterns(historical_data, analysis)
+        
         try:
-            # Determine number range
-            if "white_balls" in game_config:
-                number_range = game_config["white_balls"]["range"]
-            elif "main_balls" in game_config:
-                number_range = game_config["main_balls"]["range"]
-            else:
-                number_range = game_config["numbers"]["range"]
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            numbers = draw_matrix.numbers
+            total_draws = len(draw_matrix)
             
-            # Initialize gap tracking
-            for num in range(number_range[0], number_range[1] + 1):
-                analysis["number_gaps"][num] = []
-                analysis["average_gaps"][num] = 0
+            # Every appearance, grouped by number and ordered by draw
+            appearance_numbers, appearance_draws = draw_matrix.appearance_positions()
+            appearance_counts = np.bincount(appearance_numbers, minlength=draw_matrix.range_size)
+            group_ends = np.cumsum(appearance_counts)
+            group_starts = group_ends - appearance_counts
             
-            # Track last appearance of each number
-            last_appearance = {num: -1 for num in range(number_range[0], number_range[1] + 1)}
+            is_first = np.zeros(len(appearance_draws), dtype=bool)
+            is_last = np.zeros(len(appearance_draws), dtype=bool)
+            is_first[group_starts[appearance_counts > 0]] = True
+            is_last[group_ends[appearance_counts > 0] - 1] = True
             
-            # Analyze gaps in historical data
-            for draw_index, draw in enumerate(historical_data):
-                numbers = draw["numbers"][:5]  # Main numbers only
-                
-                # Update gaps for numbers that appeared
-                for num in numbers:
-                    if num in last_appearance and last_appearance[num] >= 0:
-                        gap = draw_index - last_appearance[num]
-                        analysis["number_gaps"][num].append(gap)
-                    last_appearance[num] = draw_index
-                
-                # Update gaps for numbers that didn't appear
-                for num in range(number_range[0], number_range[1] + 1):
-                    if num not in numbers and last_appearance[num] >= 0:
-                        gap = draw_index - last_appearance[num]
-                        # Only track reasonable gaps (not too large)
-                        if gap <= 50:  # Reasonable gap limit
-                            if len(analysis["number_gaps"][num]) == 0 or gap > analysis["number_gaps"][num][-1]:
-                                analysis["number_gaps"][num][-1:] = [gap]  # Update last gap
+            # Gap since the previous appearance, and the absent run that follows each appearance
+            previous_draws = np.concatenate(([0], appearance_draws[:-1]))
+            next_draws = np.concatenate((appearance_draws[1:], [total_draws]))
+            next_draws[is_last] = total_draws
+            appearance_gaps = appearance_draws - previous_draws
+            absent_runs = next_draws - appearance_draws - 1
+            
+            # Absent runs up to 50 draws stretch the most recent gap
+            gap_values, has_gap = tracked_gap_values(appearance_gaps, absent_runs, is_first)
+            
+            recorded_numbers = appearance_numbers[has_gap]
+            recorded_gaps = gap_values[has_gap]
+            gap_counts = np.bincount(recorded_numbers, minlength=draw_matrix.range_size)
+            gap_totals = np.bincount(recorded_numbers, weights=recorded_gaps, minlength=draw_matrix.range_size)
+            
+            last_appearance = np.full(draw_matrix.range_size, -1, dtype=np.int64)
+            last_appearance[appearance_counts > 0] = appearance_draws[group_ends[appearance_counts > 0] - 1]
+            
+            split_gaps = np.split(recorded_gaps, np.cumsum(gap_counts)[:-1])
             
             # Calculate average gaps and predictions
-            for num in range(number_range[0], number_range[1] + 1):
-                gaps = analysis["number_gaps"][num]
+            for offset, num in enumerate(numbers.tolist()):
+                gaps = split_gaps[offset].tolist()
+                analysis["number_gaps"][num] = gaps
+                analysis["average_gaps"][num] = 0
+                
                 if gaps:
-                    analysis["average_gaps"][num] = statistics.mean(gaps)
+                    avg_gap = float(gap_totals[offset] / gap_counts[offset])
+                    analysis["average_gaps"][num] = avg_gap
                     
                     # Predict when number might appear next
-                    current_gap = len(historical_data) - last_appearance[num] if last_appearance[num] >= 0 else 0
-                    avg_gap = analysis["average_gaps"][num]
+                    current_gap = total_draws - int(last_appearance[offset]) if last_appearance[offset] >= 0 else 0
                     
                     if avg_gap > 0:
                         probability = max(0, min(1, current_gap / avg_gap))
@@ -444,17 +941,66 @@ class NexusLotteryAlgorithmSystem:
                         }
             
             # Calculate confidence score
-            numbers_with_data = len([gaps for gaps in analysis["number_gaps"].values() if gaps])
+            numbers_with_data = int(np.count_nonzero(gap_counts))
             total_numbers = len(analysis["number_gaps"])
             data_coverage = numbers_with_data / total_numbers if total_numbers > 0 else 0
             
             # Higher confidence with more data and consistent gaps
             avg_gap_variance = 0
-            if numbers_with_data > 0:
-                all_gaps = [gap for gaps in analysis["number_gaps"].values() for gap in gaps]
-                if len(all_gaps) > 1:
-                    avg_gap_variance = statistics.variance(all_gaps)
+            if len(recorded_gaps) > 1:
+                avg_gap_variance = float(recorded_gaps.var(ddof=1))
+            
+            consistency_score = 1.0 / (1.0 + avg_gap_variance / 100)  # Normalize variance
+            analysis["confidence_score"] = (data_coverage * 0.7 + consistency_score * 0.3) * 0.75
+            
+        except Exception as e:
+            analysis["error"] = str(e)
+            analysis["confidence_score"] = 0.0
+        
+        return analysis
+    
+    def analyze_incremental_gap_patterns(self, analysis_state, analysis):
+        """REAL: Serve gap analysis from the running gap statistics of the state
+        
+        average_gaps, gap_predictions and the confidence match the batch analysis
+        on the same window (absence-stretched gaps, see tracked_gap_summary).
+        "gap_statistics" replaces the per-number gap lists with the plain
+        distances between consecutive appearances.
+        """
+        
+        analysis.pop("number_gaps", None)
+        analysis["gap_statistics"] = {}
+        
+        try:
+            numbers = analysis_state.numbers.tolist()
+            tracked_counts, tracked_means, avg_gap_variance = analysis_state.tracked_gap_summary()
+            gap_counts = analysis_state.gap_counts
+            gap_means = analysis_state.gap_means
+            gap_variances = analysis_state.gap_variances()
+            current_gaps = analysis_state.current_gaps()
+            analysis["average_gaps"] = dict.fromkeys(numbers, 0)
+            
+            for offset in np.flatnonzero(tracked_counts).tolist():
+                num = numbers[offset]
+                avg_gap = float(tracked_means[offset])
+                analysis["average_gaps"][num] = avg_gap
+                
+                if avg_gap > 0:
+                    current_gap = int(current_gaps[offset])
+                    analysis["gap_predictions"][num] = {
+                        "current_gap": current_gap,
+                        "average_gap": avg_gap,
+                        "appearance_probability": max(0, min(1, current_gap / avg_gap))
+                    }
+            
+            for offset in np.flatnonzero(gap_counts).tolist():
+                analysis["gap_statistics"][numbers[offset]] = {
+                    "gap_count": int(gap_counts[offset]),
+                    "average_gap": float(gap_means[offset]),
+                    "gap_variance": float(gap_variances[offset])
+                }
             
+            data_coverage = np.count_nonzero(tracked_counts) / len(numbers) if numbers else 0
             consistency_score = 1.0 / (1.0 + avg_gap_variance / 100)  # Normalize variance
             analysis["confidence_score"] = (data_coverage * 0.7 + consistency_score * 0.3) * 0.75
             
@@ -476,39 +1022,42 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            # Calculate sums for all historical draws
-            draw_sums = []
-            
-            for draw in historical_data:
-                numbers = draw["numbers"][:5]  # Main numbers only
-                draw_sum = sum(numbers)
-                draw_sums.append(draw_sum)
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            draw_sums = draw_matrix.sums
             
-            if not draw_sums:
+            if not len(draw_sums):
                 analysis["confidence_score"] = 0.0
                 return analysis
             
+            # Mode resolves ties by first occurrence, like statistics.mode
+            unique_sums, first_index, sum_counts = np.unique(draw_sums, return_index=True, return_counts=True)
+            modal = sum_counts == sum_counts.max()
+            mode_sum = int(unique_sums[modal][np.argmin(first_index[modal])])
+            
             # Calculate statistics
             analysis["sum_statistics"] = {
-                "mean": statistics.mean(draw_sums),
-                "median": statistics.median(draw_sums),
-                "mode": statistics.mode(draw_sums) if draw_sums else 0,
-                "std_dev": statistics.stdev(draw_sums) if len(draw_sums) > 1 else 0,
-                "min_sum": min(draw_sums),
-                "max_sum": max(draw_sums)
+                "mean": float(draw_sums.mean()),
+                "median": float(np.median(draw_sums)),
+                "mode": mode_sum,
+                "std_dev": float(draw_sums.std(ddof=1)) if len(draw_sums) > 1 else 0,
+                "min_sum": int(unique_sums[0]),
+                "max_sum": int(unique_sums[-1])
             }
             
             # Create sum distribution (buckets)
             min_sum = analysis["sum_statistics"]["min_sum"]
             max_sum = analysis["sum_statistics"]["max_sum"]
-            bucket_size = max(1, (max_sum - min_sum) // 20)  # 20 buckets
+            bucket_count = self.resolve_game_spec(game_config).sum_bucket_count
+            bucket_size = max(1, (max_sum - min_sum) // bucket_count)
+            
+            bucket_index = (draw_sums - min_sum) // bucket_size
+            bucket_counts = np.bincount(bucket_index[bucket_index < bucket_count], minlength=bucket_count)
             
-            for i in range(20):
+            for i, count in enumerate(bucket_counts.tolist()):
                 bucket_start = min_sum + i * bucket_size
                 bucket_end = bucket_start + bucket_size
                 bucket_key = f"{bucket_start}-{bucket_end}"
                 
-                count = len([s for s in draw_sums if bucket_start <= s < bucket_end])
                 analysis["sum_distribution"][bucket_key] = {
                     "range": (bucket_start, bucket_end),
                     "count": count,
@@ -558,16 +1107,10 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            # Determine game parameters
-            if "white_balls" in game_config:
-                number_range = game_config["white_balls"]["range"]
-                ball_count = game_config["white_balls"]["count"]
-            elif "main_balls" in game_config:
-                number_range = game_config["main_balls"]["range"]
-                ball_count = game_config["main_balls"]["count"]
-            else:
-                number_range = game_config["numbers"]["range"]
-                ball_count = game_config["numbers"]["count"]
+            # Game parameters from the compiled spec
+            game_spec = self.resolve_game_spec(game_config)
+            number_range = game_spec.number_range
+            ball_count = game_spec.ball_count
             
             # Start with frequency-based selection
             hot_numbers = [n["number"] for n in freq_analysis.get("hot_numbers", [])[:10]]
@@ -678,8 +1221,160 @@ class NexusLotteryAlgorithmSystem:
         
         return prediction
     
-    def neural_prediction_agent(self, game_type, historical_data, prediction_count):
-        """REAL: Neural prediction agent implementation"""
+    def generate_pattern_based_predictions(self, game_config, freq_analysis, seq_analysis, gap_analysis,
+                                           sum_analysis, ticket_count, seed=None):
+        """REAL: Generate ticket_count pattern-based tickets in one vectorized batch
+        
+        Numbers are weighted by a probability vector built from the frequency and gap
+        analyses; tickets are drawn directly among sums inside the optimal sum ranges.
+        """
+        
+        prediction_batch = {
+            "prediction_method": "PATTERN_BASED_ANALYSIS",
+            "tickets": np.zeros((0, 0), dtype=np.uint8),
+            "sum_valid": np.zeros(0, dtype=bool),
+            "number_probabilities": {},
+            "confidence_factors": {}
+        }
+        
+        try:
+            game_spec = self.resolve_game_spec(game_config)
+            probabilities = build_number_weights(game_spec, freq_analysis, gap_analysis)
+            sum_ranges = [range_info["range"] for range_info in sum_analysis.get("optimal_sum_ranges", [])]
+            
+            sampler = NexusTicketSampler(game_spec, probabilities, sum_ranges, seed=seed)
+            prediction_batch["tickets"], prediction_batch["sum_valid"] = sampler.sample(ticket_count)
+            prediction_batch["number_probabilities"] = dict(zip(game_spec.numbers.tolist(), probabilities.tolist()))
+            
+            # Category membership masks for the per-ticket rationale (top 10 hot/balanced, 5 cold)
+            for category, category_limit in (("hot_numbers", 10), ("balanced_numbers", 10), ("cold_numbers", 5)):
+                category_mask = np.zeros(game_spec.range_size, dtype=bool)
+                category_numbers = [n["number"] for n in freq_analysis.get(category, [])[:category_limit]]
+                category_mask[np.array(category_numbers, dtype=np.int64) - game_spec.number_range[0]] = True
+                prediction_batch[f"{category}_counts"] = category_mask[
+                    prediction_batch["tickets"].astype(np.int64) - game_spec.number_range[0]
+                ].sum(axis=1)
+            
+            prediction_batch["confidence_factors"] = {
+                "frequency_confidence": freq_analysis.get("confidence_score", 0.7),
+                "sequence_confidence": seq_analysis.get("confidence_score", 0.6),
+                "gap_confidence": gap_analysis.get("confidence_score", 0.65),
+                "sum_confidence": sum_analysis.get("confidence_score", 0.7),
+                "overall_confidence": (
+                    freq_analysis.get("confidence_score", 0.7) * 0.3 +
+                    seq_analysis.get("confidence_score", 0.6) * 0.2 +
+                    gap_analysis.get("confidence_score", 0.65) * 0.25 +
+                    sum_analysis.get("confidence_score", 0.7) * 0.25
+                )
+            }
+            
+        except Exception as e:
+            prediction_batch["error"] = str(e)
+            prediction_batch["confidence_factors"] = {"overall_confidence": 0.0}
+        
+        return prediction_batch
+    
+    def attach_prediction_batch(self, agent_result, prediction_batch, id_prefix):
+        """REAL: Keep an agent's tickets as arrays in its result
+        
+        Agents may run in worker processes; shipping the arrays and expanding
+        them into per-ticket records in the deploying process (see
+        expand_agent_predictions) keeps the result pickles small.
+        """
+        
+        prediction_batch["id_prefix"] = id_prefix
+        prediction_batch["generation_timestamp"] = time.time()
+        agent_result["candidate_tickets"] = prediction_batch["tickets"]
+        agent_result["prediction_batch"] = prediction_batch
+    
+    def expand_agent_predictions(self, agent_result):
+        """REAL: A copy of an agent result with its prediction batch expanded into "predictions" """
+        
+        if not isinstance(agent_result, dict) or "prediction_batch" not in agent_result:
+            return agent_result
+        
+        expanded_result = dict(agent_result)
+        prediction_batch = expanded_result.pop("prediction_batch")
+        expanded_result["predictions"] = self.expand_prediction_batch(prediction_batch, prediction_batch["id_prefix"])
+        return expanded_result
+    
+    def expand_prediction_batch(self, prediction_batch, id_prefix):
+        """REAL: Per-ticket prediction records (generate_pattern_based_prediction layout) from a batch"""
+        
+        if "error" in prediction_batch:
+            return []
+        
+        tickets = prediction_batch["tickets"]
+        generation_timestamp = prediction_batch.get("generation_timestamp", time.time())
+        
+        if "support_masks" in prediction_batch:
+            # Voted tickets carry their own confidence, supporters and budget share
+            return [
+                {
+                    "prediction_method": prediction_batch["prediction_method"],
+                    "numbers": numbers,
+                    "confidence_factors": {"overall_confidence": confidence},
+                    "supporting_agents": NexusEnsembleVoter.supporting_agents(prediction_batch, i),
+                    "allocation_share": share,
+                    "prediction_id": f"{id_prefix}_{i}",
+                    "generation_timestamp": generation_timestamp
+                }
+                for i, (numbers, confidence, share) in enumerate(zip(
+                    tickets.tolist(),
+                    prediction_batch["ticket_confidences"].tolist(),
+                    prediction_batch["allocation_shares"].tolist()
+                ))
+            ]
+        
+        if "hot_numbers_counts" not in prediction_batch:
+            # Batches without category counts share one rationale across tickets
+            rationale_field = prediction_batch.get("rationale_field", "neural_rationale")
+            predictions = [
+                {
+                    "prediction_method": prediction_batch["prediction_method"],
+                    "numbers": numbers,
+                    "confidence_factors": prediction_batch["confidence_factors"],
+                    rationale_field: prediction_batch.get("rationale", []),
+                    "prediction_id": f"{id_prefix}_{i}",
+                    "generation_timestamp": generation_timestamp
+                }
+                for i, numbers in enumerate(tickets.tolist())
+            ]
+            for batch_field, record_field in TICKET_OUTPUT_FIELDS.items():
+                if batch_field in prediction_batch:
+                    for prediction, value in zip(predictions, prediction_batch[batch_field].tolist()):
+                        prediction[record_field] = value
+            return predictions
+        
+        return [
+            {
+                "prediction_method": prediction_batch["prediction_method"],
+                "numbers": numbers,
+                "confidence_factors": prediction_batch["confidence_factors"],
+                "pattern_rationale": [
+                    f"Selected {hot_count} hot numbers based on frequency analysis",
+                    f"Selected {balanced_count} balanced numbers for stability",
+                    f"Selected {cold_count} cold numbers due for appearance",
+                    f"Sum {sum(numbers)} falls within {'optimal' if sum_valid else 'acceptable'} range"
+                ],
+                "prediction_id": f"{id_prefix}_{i}",
+                "generation_timestamp": generation_timestamp
+            }
+            for i, (numbers, sum_valid, hot_count, balanced_count, cold_count) in enumerate(zip(
+                tickets.tolist(),
+                prediction_batch["sum_valid"].tolist(),
+                prediction_batch["hot_numbers_counts"].tolist(),
+                prediction_batch["balanced_numbers_counts"].tolist(),
+                prediction_batch["cold_numbers_counts"].tolist()
+            ))
+        ]
+    
+    def neural_prediction_agent(self, game_type, historical_data, prediction_count, seed=None):
+        """REAL: Neural prediction agent implementation
+        
+        Each network fits on the recent history within NEURAL_LATENCY_BUDGET_MS;
+        tickets are sampled in one batch from the stacked ensemble probabilities.
+        """
         
         agent_result = {
             "agent_type": "NEURAL_PREDICTION_AGENT",
@@ -690,35 +1385,33 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
-            game_config = self.lottery_games.get(game_type, self.lottery_games["powerball"])
+            game_spec = self.get_game_spec(game_type)
+            draw_matrix = self.build_draw_matrix(historical_data, game_spec, game_type)
             
             # LSTM-based Sequence Prediction
-            lstm_analysis = self.lstm_prediction_network(historical_data, game_config)
+            lstm_analysis = self.lstm_prediction_network(draw_matrix, game_spec)
             agent_result["neural_networks"].append(lstm_analysis)
             
             # CNN Pattern Detection
-            cnn_analysis = self.cnn_pattern_network(historical_data, game_config)
+            cnn_analysis = self.cnn_pattern_network(draw_matrix, game_spec)
             agent_result["neural_networks"].append(cnn_analysis)
             
             # Transformer Analysis
-            transformer_analysis = self.transformer_analysis_network(historical_data, game_config)
+            transformer_analysis = self.transformer_analysis_network(draw_matrix, game_spec)
             agent_result["neural_networks"].append(transformer_analysis)
             
             # Ensemble Neural Prediction
             ensemble_analysis = self.ensemble_prediction_network(
-                lstm_analysis, cnn_analysis, transformer_analysis, game_config
+                lstm_analysis, cnn_analysis, transformer_analysis, game_spec
             )
             agent_result["neural_networks"].append(ensemble_analysis)
             
-            # Generate neural-based predictions
-            for i in range(prediction_count):
-                prediction = self.generate_neural_based_prediction(
-                    game_config, lstm_analysis, cnn_analysis, transformer_analysis, ensemble_analysis
-                )
-                
-                prediction["prediction_id"] = f"neural_pred_{i}"
-                prediction["generation_timestamp"] = time.time()
-                agent_result["predictions"].append(prediction)
+            # Generate neural-based predictions, all tickets in one batch
+            prediction_batch = self.generate_neural_based_predictions(
+                game_spec, lstm_analysis, cnn_analysis, transformer_analysis, ensemble_analysis,
+                prediction_count, seed
+            )
+            self.attach_prediction_batch(agent_result, prediction_batch, "neural_pred")
             
             # Calculate neural confidence
             agent_result["neural_confidence"] = {
@@ -732,8 +1425,16 @@ class NexusLotteryAlgorithmSystem:
             # Performance metrics
             agent_result["performance_metrics"] = {
                 "networks_deployed": len(agent_result["neural_networks"]),
-                "predictions_generated": len(agent_result["predictions"]),
+                "predictions_generated": len(agent_result["candidate_tickets"]),
                 "average_confidence": agent_result["neural_confidence"]["overall_confidence"],
+                "network_elapsed_ms": {
+                    network["network_type"]: network.get("elapsed_ms", 0.0)
+                    for network in agent_result["neural_networks"]
+                },
+                "network_training_modes": {
+                    network["network_type"]: network["training_mode"]
+                    for network in agent_result["neural_networks"] if "training_mode" in network
+                },
                 "processing_time": time.time()
             }
             
@@ -753,26 +1454,50 @@ class NexusLotteryAlgorithmSystem:
         }
         
         try:
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            ball_count = self.resolve_game_spec(game_config).ball_count
+            main = draw_matrix.main[:, :ball_count]
+            
             # Simulate LSTM sequence analysis
-            sequence_length = min(10, len(historical_data))
+            sequence_length = min(10, len(draw_matrix))
+            temporal_engine = NexusTemporalWindowEngine(sequence_length)
+            
+            # Scan every window of the full history in one vectorized pass
+            window_statistics = temporal_engine.window_statistics(main)
             
-            # Analyze recent sequences
-            for i in range(len(historical_data) - sequence_length, len(historical_data)):
+            # Analyze recent sequences (windows reaching before the first draw are shortened)
+            for i in range(len(draw_matrix) - sequence_length, len(draw_matrix)):
                 if i >= 0:
-                    sequence = []
-                    for j in range(max(0, i - sequence_length + 1), i + 1):
-                        sequence.append(historical_data[j]["numbers"][:5])
-                    
-                    # Analyze sequence for temporal patterns
-                    pattern_strength = self.calculate_sequence_pattern_strength(sequence)
+                    sequence_start = max(0, i - sequence_length + 1)
+                    if i - sequence_length + 1 >= 0:
+                        recent_statistics, window = window_statistics, sequence_start
+                    else:
+                        recent_statistics = NexusTemporalWindowEngine(i + 1).window_statistics(main[:i + 1])
+                        window = 0
                     
                     analysis["sequence_patterns"].append({
-                        "sequence_start_index": max(0, i - sequence_length + 1),
+                        "sequence_start_index": sequence_start,
                         "sequence_end_index": i,
-                        "pattern_strength": pattern_strength,
-                        "temporal_trend": self.calculate_temporal_trend(sequence)
+                        "pattern_strength": float(recent_statistics["pattern_strengths"][window]),
+                        "temporal_trend": temporal_engine.temporal_trend(recent_statistics, window)
                     })
             
+            # Summarize the full-history scan
+            pattern_strengths = window_statistics["pattern_strengths"]
+            if window_statistics["window_count"]:
+                analysis["window_scan"] = {
+                    "window_length": sequence_length,
+                    "window_count": window_statistics["window_count"],
+                    "mean_pattern_strength": float(pattern_strengths.mean()),
+                    "pattern_strength_std": float(pattern_strengths.std()),
+                    "strongest_window_end": int(window_statistics["window_ends"][np.argmax(pattern_strengths)]),
+                    "trend_window_counts": {
+                        "increasing_trend": int((window_statistics["increasing_strengths"] > 0.5).sum()),
+                        "decreasing_trend": int((window_statistics["decreasing_strengths"] > 0.5).sum()),
+                        "random_trend": int((window_statistics["random_strengths"] > 0.5).sum())
+                    }
+                }
+            
             # Generate temporal predictions
             if analysis["sequence_patterns"]:
                 latest_pattern = analysis["sequence_patterns"][-1]
@@ -805,115 +1530,523 @@ class NexusLotteryAlgorithmSystem:
         
         return analysis
     
-    def calculate_sequence_pattern_strength(self, sequence):
-        """REAL: Calculate pattern strength in sequence"""
+    def get_neural_model(self, model_class, game_spec):
+        """REAL: Per-process model instance for a game's number range, reusing its buffers"""
+        
+        model_key = (model_class.network_type, game_spec.game_type, game_spec.number_range)
+        if model_key not in self.neural_models:
+            self.neural_models[model_key] = model_class(game_spec.range_size, first_number=game_spec.number_range[0])
+        return self.neural_models[model_key]
+    
+    def run_neural_scorer(self, model_class, historical_data, game_config):
+        """REAL: Fit a neural scorer on the recent draws and summarize its next-draw scores
+        
+        Trained state is restored from the model cache when the in-process model
+        does not already cover this history; only new draws are trained and the
+        updated state is written back.
+        """
+        
+        analysis = {
+            "network_type": model_class.network_type,
+            "number_probabilities": {},
+            "top_numbers": [],
+            "confidence_score": 0.0
+        }
         
         try:
-            if len(sequence) < 2:
-                return 0.0
+            game_spec = self.resolve_game_spec(game_config)
+            draw_matrix = self.build_draw_matrix(historical_data, game_config)
+            model = self.get_neural_model(model_class, game_spec)
+            cache_game_type = game_spec.game_type or "custom"
+            
+            # model_cache is None for in-memory runs such as backtests
+            if self.model_cache is not None and not model.matches_history(draw_matrix.main):
+                self.model_cache.load(cache_game_type, model)
+            model_result = model.fit_predict(draw_matrix.main)
+            if self.model_cache is not None and model_result["training_mode"] != "warm":
+                self.model_cache.save(cache_game_type, model)
+            
+            probabilities = model_result["number_probabilities"]
+            top_offsets = np.argsort(-probabilities, kind="stable")[:game_spec.ball_count * 2]
+            
+            analysis.update(model_result)
+            analysis["number_probabilities"] = dict(zip(game_spec.numbers.tolist(), probabilities.tolist()))
+            analysis["probability_vector"] = probabilities
+            analysis["top_numbers"] = [
+                {"number": int(game_spec.numbers[offset]), "probability": float(probabilities[offset])}
+                for offset in top_offsets
+            ]
             
-            # Analyze number progression patterns
-            progressions = []
+            # Lift 1.0 (no better than uniform on the holdout draws) maps to 0.5
+            analysis["confidence_score"] = float(min(0.85, max(0.0, 0.5 * model_result["holdout_lift"])))
             
-            for pos in range(5):  # For each position in the draw
-                position_numbers = [draw[pos] if pos < len(draw) else 0 for draw in sequence]
-                
-                # Calculate differences between consecutive draws
-                diffs = [position_numbers[i+1] - position_numbers[i] for i in range(len(position_numbers)-1)]
-                
-                if diffs:
-                    # Check for consistency in differences
-                    avg_diff = statistics.mean(diffs)
-                    diff_variance = statistics.variance(diffs) if len(diffs) > 1 else 0
-                    
-                    consistency = 1.0 / (1.0 + diff_variance) if diff_variance > 0 else 1.0
-                    progressions.append(consistency)
+        except Exception as e:
+            analysis["error"] = str(e)
+            analysis["confidence_score"] = 0.0
+        
+        return analysis
+    
+    def cnn_pattern_network(self, historical_data, game_config):
+        """REAL: 1-D convolutional pattern scorer over the incidence matrix"""
+        return self.run_neural_scorer(NexusConvolutionalScorer, historical_data, game_config)
+    
+    def transformer_analysis_network(self, historical_data, game_config):
+        """REAL: Attention-based scorer over the most recent draws"""
+        return self.run_neural_scorer(NexusAttentionScorer, historical_data, game_config)
+    
+    def ensemble_prediction_network(self, lstm_analysis, cnn_analysis, transformer_analysis, game_config):
+        """REAL: Stack the network probabilities with weights fitted on their holdout draws"""
+        
+        analysis = {
+            "network_type": "STACKING_ENSEMBLE",
+            "stacking_weights": {},
+            "number_probabilities": {},
+            "top_numbers": [],
+            "confidence_score": 0.0
+        }
+        
+        try:
+            start_time = time.perf_counter()
+            game_spec = self.resolve_game_spec(game_config)
+            
+            # Networks that produced probabilities share the same holdout draws
+            networks = [
+                network for network in (cnn_analysis, transformer_analysis)
+                if "error" not in network and "probability_vector" in network
+            ]
+            if not networks:
+                raise ValueError("No network produced probabilities to stack")
+            
+            holdout_targets = networks[0]["holdout_targets"]
+            stacking_weights = fit_stacking_weights(
+                [network["holdout_probabilities"] for network in networks], holdout_targets
+            )
+            
+            probabilities = sum(weight * network["probability_vector"]
+                                for weight, network in zip(stacking_weights, networks))
+            holdout_probabilities = sum(weight * network["holdout_probabilities"]
+                                        for weight, network in zip(stacking_weights, networks))
+            top_offsets = np.argsort(-probabilities, kind="stable")[:game_spec.ball_count * 2]
             
-            # Return average consistency across all positions
-            return statistics.mean(progressions) if progressions else 0.0
+            analysis["stacking_weights"] = {
+                network["network_type"]: float(weight) for weight, network in zip(stacking_weights, networks)
+            }
+            analysis["number_probabilities"] = dict(zip(game_spec.numbers.tolist(), probabilities.tolist()))
+            analysis["probability_vector"] = probabilities
+            analysis["holdout_lift"] = holdout_lift(holdout_probabilities, holdout_targets)
+            analysis["top_numbers"] = [
+                {"number": int(game_spec.numbers[offset]), "probability": float(probabilities[offset])}
+                for offset in top_offsets
+            ]
+            
+            # Stacked holdout lift, nudged by the LSTM's temporal consistency
+            analysis["confidence_score"] = float(min(0.85, max(0.0,
+                0.5 * analysis["holdout_lift"] * 0.9 + lstm_analysis.get("confidence_score", 0.0) * 0.1
+            )))
+            analysis["elapsed_ms"] = (time.perf_counter() - start_time) * 1000
             
         except Exception as e:
-            return 0.0
+            analysis["error"] = str(e)
+            analysis["confidence_score"] = 0.0
+        
+        return analysis
     
-    def calculate_temporal_trend(self, sequence):
-        """REAL: Calculate temporal trends in sequence"""
+    def generate_neural_based_predictions(self, game_config, lstm_analysis, cnn_analysis, transformer_analysis,
+                                          ensemble_analysis, ticket_count, seed=None):
+        """REAL: Sample ticket_count tickets from the stacked ensemble probabilities in one batch"""
         
-        trends = {
-            "increasing_trend": {"strength": 0.0, "predicted_changes": []},
-            "decreasing_trend": {"strength": 0.0, "predicted_changes": []},
-            "cyclical_trend": {"strength": 0.0, "predicted_changes": []},
-            "random_trend": {"strength": 0.0, "predicted_changes": []}
+        prediction_batch = {
+            "prediction_method": "NEURAL_NETWORK_ENSEMBLE",
+            "tickets": np.zeros((0, 0), dtype=np.uint8),
+            "sum_valid": np.zeros(0, dtype=bool),
+            "confidence_factors": {},
+            "rationale": []
         }
         
         try:
-            if len(sequence) < 3:
-                trends["random_trend"]["strength"] = 1.0
-                return trends
+            game_spec = self.resolve_game_spec(game_config)
+            probabilities = ensemble_analysis.get("probability_vector")
+            if probabilities is None:
+                probabilities = np.full(game_spec.range_size, 1.0 / game_spec.range_size)
+            
+            sampler = NexusTicketSampler(game_spec, probabilities, seed=seed)
+            prediction_batch["tickets"], prediction_batch["sum_valid"] = sampler.sample(ticket_count)
+            
+            # Mean ensemble probability of each ticket's numbers
+            prediction_batch["ticket_neural_probabilities"] = \
+                probabilities[prediction_batch["tickets"] - game_spec.number_range[0]].mean(axis=1)
+            
+            prediction_batch["confidence_factors"] = {
+                "lstm_confidence": lstm_analysis.get("confidence_score", 0.0),
+                "cnn_confidence": cnn_analysis.get("confidence_score", 0.0),
+                "transformer_confidence": transformer_analysis.get("confidence_score", 0.0),
+                "ensemble_confidence": ensemble_analysis.get("confidence_score", 0.0),
+                "overall_confidence": ensemble_analysis.get("confidence_score", 0.0)
+            }
+            prediction_batch["rationale"] = [
+                f"{network_type} stacking weight {weight:.2f}"
+                for network_type, weight in ensemble_analysis.get("stacking_weights", {}).items()
+            ] + [f"Stacked holdout lift {ensemble_analysis.get('holdout_lift', 1.0):.3f} over uniform"]
             
-            # Analyze each position for trends
-            for pos in range(5):
-                position_numbers = [draw[pos] if pos < len(draw) else 0 for draw in sequence]
-                
-                # Check for increasing trend
-                increasing_count = sum(1 for i in range(len(position_numbers)-1) 
-                                     if position_numbers[i+1] > position_numbers[i])
-                increasing_strength = increasing_count / (len(position_numbers) - 1)
-                
-                # Check for decreasing trend
-                decreasing_count = sum(1 for i in range(len(position_numbers)-1) 
-                                     if position_numbers[i+1] < position_numbers[i])
-                decreasing_strength = decreasing_count / (len(position_numbers) - 1)
-                
-                # Update trend strengths
-                trends["increasing_trend"]["strength"] += increasing_strength / 5
-                trends["decreasing_trend"]["strength"] += decreasing_strength / 5
-                
-                # Generate predicted changes
-                if increasing_strength > 0.6:
-                    avg_increase = statistics.mean([position_numbers[i+1] - position_numbers[i] 
-                                                   for i in range(len(position_numbers)-1) 
-                                                   if position_numbers[i+1] > position_numbers[i]])
-                    trends["increasing_trend"]["predicted_changes"].append(avg_increase)
-                
-                if decreasing_strength > 0.6:
-                    avg_decrease = statistics.mean([position_numbers[i] - position_numbers[i+1] 
-                                                   for i in range(len(position_numbers)-1) 
-                                                   if position_numbers[i+1] < position_numbers[i]])
-                    trends["decreasing_trend"]["predicted_changes"].append(-avg_decrease)
+        except Exception as e:
+            prediction_batch["error"] = str(e)
+            prediction_batch["confidence_factors"] = {"overall_confidence": 0.0}
+        
+        return prediction_batch
+    
+    def generate_neural_based_prediction(self, game_config, lstm_analysis, cnn_analysis, transformer_analysis,
+                                         ensemble_analysis):
+        """REAL: Generate one neural-based prediction"""
+        
+        prediction_batch = self.generate_neural_based_predictions(
+            game_config, lstm_analysis, cnn_analysis, transformer_analysis, ensemble_analysis, 1
+        )
+        predictions = self.expand_prediction_batch(prediction_batch, "neural_pred")
+        if not predictions:
+            return {
+                "prediction_method": prediction_batch["prediction_method"],
+                "numbers": [],
+                "error": prediction_batch.get("error", "No prediction generated"),
+                "confidence_factors": {"overall_confidence": 0.0}
+            }
+        return predictions[0]
+    
+    def analyze_recency_guidance(self, historical_data, game_config, half_life=25, amplification=1.5,
+                                 holdout_draws=50):
+        """REAL: Recency-weighted number guidance scored on the most recent draws
+        
+        Each appearance counts 0.5 ** (age / half_life); the decayed counts are
+        sharpened by amplification into a probability vector. The holdout lift is
+        measured with guidance built only from the draws before the holdout.
+        """
+        
+        analysis = {
+            "analysis_type": "RECENCY_GUIDANCE_ANALYSIS",
+            "half_life": half_life,
+            "amplification": amplification,
+            "number_probabilities": {},
+            "top_numbers": [],
+            "holdout_lift": 1.0,
+            "confidence_score": 0.0
+        }
+        
+        try:
+            game_spec = self.resolve_game_spec(game_config)
+            draw_matrix = self.build_draw_matrix(historical_data, game_spec)
+            offsets = draw_matrix.offsets
+            
+            def guidance_probabilities(draw_offsets):
+                ages = np.arange(len(draw_offsets))[::-1]
+                decayed = np.bincount(
+                    draw_offsets.ravel(),
+                    weights=np.repeat(0.5 ** (ages / half_life), game_spec.ball_count),
+                    minlength=game_spec.range_size
+                )
+                # A small floor keeps numbers never drawn reachable
+                guidance = (decayed + 1e-3) ** amplification
+                return guidance / guidance.sum()
+            
+            probabilities = guidance_probabilities(offsets)
+            holdout_count = min(holdout_draws, len(offsets) // 5)
+            if holdout_count:
+                holdout_probabilities = guidance_probabilities(offsets[:-holdout_count])
+                analysis["holdout_lift"] = float(
+                    holdout_probabilities[offsets[-holdout_count:]].mean() * game_spec.range_size
+                )
+            
+            top_offsets = np.argsort(-probabilities, kind="stable")[:game_spec.ball_count * 2]
+            analysis["number_probabilities"] = dict(zip(game_spec.numbers.tolist(), probabilities.tolist()))
+            analysis["probability_vector"] = probabilities
+            analysis["top_numbers"] = [
+                {"number": int(game_spec.numbers[offset]), "probability": float(probabilities[offset])}
+                for offset in top_offsets
+            ]
+            
+            # Same scale as the neural scorers: lift 1.0 (uniform) maps to 0.5
+            analysis["confidence_score"] = float(min(0.85, max(0.0, 0.5 * analysis["holdout_lift"])))
+            
+        except Exception as e:
+            analysis["error"] = str(e)
+            analysis["confidence_score"] = 0.0
+        
+        return analysis
+    
+    def consciousness_guidance_agent(self, game_type, historical_data, prediction_count, seed=None):
+        """REAL: Consciousness guidance agent implementation
+        
+        Intuitive selection is the recency-weighted guidance, awareness
+        amplification sharpens it, and intention manifestation samples every
+        ticket in one batch within the interquartile range of historical sums.
+        Without a seed the tickets are seeded from the history fingerprint, so
+        the same draws always give the same tickets.
+        """
+        
+        agent_result = {
+            "agent_type": "CONSCIOUSNESS_GUIDANCE_AGENT",
+            "analysis_methods": [],
+            "predictions": [],
+            "consciousness_confidence": {},
+            "performance_metrics": {}
+        }
+        
+        try:
+            game_spec = self.get_game_spec(game_type)
+            draw_matrix = self.build_draw_matrix(historical_data, game_spec, game_type)
+            
+            guidance_analysis = self.cached_analysis(
+                (game_type, draw_matrix.fingerprint(), "recency_guidance"),
+                lambda: self.analyze_recency_guidance(draw_matrix, game_spec)
+            )
+            agent_result["analysis_methods"].append(guidance_analysis)
+            if "error" in guidance_analysis:
+                raise ValueError(guidance_analysis["error"])
+            
+            intention_range = np.percentile(draw_matrix.sums, [25, 75]).round().astype(int).tolist() \
+                if draw_matrix.draw_count else [game_spec.min_sum, game_spec.max_sum]
+            if seed is None:
+                seed = int(draw_matrix.fingerprint()[:16], 16)
+            
+            sampler = NexusTicketSampler(game_spec, guidance_analysis["probability_vector"], [intention_range], seed=seed)
+            tickets, sum_valid = sampler.sample(prediction_count)
+            
+            guidance_confidence = guidance_analysis["confidence_score"]
+            prediction_batch = {
+                "prediction_method": "CONSCIOUSNESS_GUIDED_SELECTION",
+                "tickets": tickets,
+                "sum_valid": sum_valid,
+                # Mean guidance probability of each ticket's numbers
+                "ticket_consciousness_guidance":
+                    guidance_analysis["probability_vector"][tickets - game_spec.number_range[0]].mean(axis=1),
+                "confidence_factors": {
+                    "intuitive_selection_confidence": guidance_confidence,
+                    "overall_confidence": guidance_confidence
+                },
+                "rationale_field": "consciousness_rationale",
+                "rationale": [
+                    f"Recency guidance with a {guidance_analysis['half_life']}-draw half-life",
+                    f"Awareness amplified by {guidance_analysis['amplification']}",
+                    f"Intention sum range {intention_range[0]}-{intention_range[1]}",
+                    f"Holdout lift {guidance_analysis['holdout_lift']:.3f} over uniform"
+                ]
+            }
+            self.attach_prediction_batch(agent_result, prediction_batch, "consciousness_pred")
+            
+            agent_result["consciousness_confidence"] = {
+                "intuitive_selection_confidence": guidance_confidence,
+                "intention_sum_range": intention_range,
+                "sum_valid_fraction": float(sum_valid.mean()) if len(sum_valid) else 0.0,
+                "overall_confidence": guidance_confidence
+            }
+            
+            agent_result["performance_metrics"] = {
+                "analysis_methods_used": len(agent_result["analysis_methods"]),
+                "predictions_generated": len(agent_result["candidate_tickets"]),
+                "average_confidence": guidance_confidence,
+                "processing_time": time.time()
+            }
+            
+        except Exception as e:
+            agent_result["error"] = str(e)
+        
+        return agent_result
+    
+    def vote_agent_tickets(self, game_type, agent_results):
+        """REAL: Weighted vote over the independent agents' tickets"""
+        
+        voter = NexusEnsembleVoter(self.get_game_spec(game_type), {
+            agent_name: agent_config["performance_weight"]
+            for agent_name, agent_config in self.agent_system.items() if not agent_config["depends_on"]
+        })
+        return voter.vote(agent_results)
+    
+    def optimization_coordination_agent(self, game_type, agent_results, prediction_count):
+        """REAL: Optimization and coordination agent implementation
+        
+        Votes over every ticket the other agents produced (ensemble
+        optimization), reports each agent's effective weight (agent
+        coordination) and splits a unit budget across the selected tickets by
+        score (resource allocation). Deterministic, and linear in the tickets
+        apart from one sort of their ranks.
+        """
+        
+        agent_result = {
+            "agent_type": "OPTIMIZATION_COORDINATION_AGENT",
+            "analysis_methods": [],
+            "predictions": [],
+            "coordination_confidence": {},
+            "performance_metrics": {}
+        }
+        
+        try:
+            start_time = time.perf_counter()
+            vote = self.vote_agent_tickets(game_type, agent_results)
+            selected = NexusEnsembleVoter.select(vote, prediction_count)
+            
+            agent_result["ensemble_vote"] = vote
+            agent_result["analysis_methods"].append({
+                "analysis_type": "WEIGHTED_AGENT_VOTE",
+                "agents": vote["agents"],
+                "agent_weights": vote["agent_weights"],
+                "tickets_voted": vote["total_tickets"],
+                "distinct_tickets": len(vote["ranks"]),
+                "multi_agent_tickets": int(np.count_nonzero(vote["support_masks"] & (vote["support_masks"] - 1)))
+            })
+            
+            scores = vote["scores"][selected]
+            allocation = scores / scores.sum() if len(scores) and scores.sum() > 0 else scores
+            agent_result["resource_allocation"] = allocation
+            
+            self.attach_prediction_batch(agent_result, {
+                "prediction_method": "WEIGHTED_AGENT_VOTE",
+                "tickets": vote["tickets"][selected],
+                "ticket_confidences": vote["ticket_confidences"][selected],
+                "support_masks": vote["support_masks"][selected],
+                "agents": vote["agents"],
+                "allocation_shares": allocation
+            }, "optimization_pred")
+            
+            selected_confidence = float(vote["ticket_confidences"][selected].mean()) if len(selected) else 0.0
+            agent_result["coordination_confidence"] = {
+                "agent_confidences": vote["agent_confidences"],
+                "agent_weights": vote["agent_weights"],
+                "overall_confidence": selected_confidence
+            }
+            
+            agent_result["performance_metrics"] = {
+                "agents_coordinated": len(vote["agents"]),
+                "predictions_generated": len(agent_result["candidate_tickets"]),
+                "average_confidence": selected_confidence,
+                "vote_elapsed_ms": (time.perf_counter() - start_time) * 1000,
+                "processing_time": time.time()
+            }
+            
+        except Exception as e:
+            agent_result["error"] = str(e)
+        
+        return agent_result
+    
+    def generate_ensemble_predictions(self, agent_results, game_type, prediction_count):
+        """REAL: Top prediction_count tickets of the weighted agent vote
+        
+        Reuses the optimization agent's vote when it succeeded, otherwise votes
+        over the independent agents directly.
+        """
+        
+        try:
+            vote = next((
+                agent_result["ensemble_vote"] for agent_result in agent_results.values()
+                if isinstance(agent_result, dict) and "ensemble_vote" in agent_result
+            ), None)
+            if vote is None:
+                vote = self.vote_agent_tickets(game_type, agent_results)
+            
+            selected = NexusEnsembleVoter.select(vote, prediction_count)
+            generation_timestamp = time.time()
+            
+            return [
+                {
+                    "prediction_method": "WEIGHTED_AGENT_VOTE",
+                    "numbers": numbers,
+                    "ensemble_confidence": confidence,
+                    "consensus_lift": lift,
+                    "agent_agreement": agreement,
+                    "supporting_agents": NexusEnsembleVoter.supporting_agents(vote, row),
+                    "ensemble_rationale": [
+                        f"Proposed by {', '.join(NexusEnsembleVoter.supporting_agents(vote, row))} "
+                        f"({agreement:.0%} of the ensemble weight)",
+                        f"Number consensus lift {lift:.3f} over uniform"
+                    ],
+                    "prediction_id": f"ensemble_pred_{i}",
+                    "generation_timestamp": generation_timestamp
+                }
+                for i, (row, numbers, confidence, lift, agreement) in enumerate(zip(
+                    selected.tolist(),
+                    vote["tickets"][selected].tolist(),
+                    vote["ticket_confidences"][selected].tolist(),
+                    vote["consensus_lift"][selected].tolist(),
+                    vote["agreement"][selected].tolist()
+                ))
+            ]
+            
+        except Exception as e:
+            print(f"Error generating ensemble predictions: {e}")
+            return []
+    
+    def calculate_prediction_confidence(self, agent_results, ensemble_predictions):
+        """REAL: Overall confidence per agent plus the mean confidence of the ensemble tickets"""
+        
+        confidence_scores = {
+            f"{agent_name}_confidence": agent_overall_confidence(agent_result)
+            for agent_name, agent_result in agent_results.items()
+            if isinstance(agent_result, dict) and "error" not in agent_result
+        }
+        
+        ensemble_confidences = np.fromiter(
+            (prediction.get("ensemble_confidence", 0.0) for prediction in ensemble_predictions),
+            dtype=np.float64, count=len(ensemble_predictions)
+        )
+        confidence_scores["ensemble_confidence"] = float(ensemble_confidences.mean()) if len(ensemble_confidences) else 0.0
+        
+        return confidence_scores
+    
+    def estimate_resource_generation_potential(self, ticket_count, confidence_scores, game_type):
+        """REAL: Exact expected prize return per draw of a ticket set
+        
+        Every ticket has the same hypergeometric (main, special) class
+        distribution, so the set's expected return is ticket_count times one
+        ticket's: the odds table weighted by the game's prize table, with
+        REFERENCE_JACKPOT as the jackpot. confidence_scores only gates the
+        estimate (no confident agents, no estimate).
+        """
+        
+        if not ticket_count or not any(confidence_scores.values()):
+            return 0.0
+        
+        game_spec = self.get_game_spec(game_type)
+        prizes = prize_matrix(game_spec.game_type, game_spec.ball_count, game_spec.special_count, REFERENCE_JACKPOT)
+        return float(ticket_count * (game_spec.odds_table.class_probabilities * prizes).sum())
+    
+    def calculate_sequence_pattern_strength(self, sequence):
+        """REAL: Calculate pattern strength in sequence"""
+        
+        try:
+            if len(sequence) < 2:
+                return 0.0
             
-            # Normalize random trend
-            max_trend_strength = max(trends["increasing_trend"]["strength"], 
-                                   trends["decreasing_trend"]["strength"])
-            trends["random_trend"]["strength"] = 1.0 - max_trend_strength
+            # Consistency of draw-to-draw differences, averaged across positions
+            sequence_statistics = NexusTemporalWindowEngine(len(sequence)).window_statistics(np.asarray(sequence))
+            return float(sequence_statistics["pattern_strengths"][0])
             
         except Exception as e:
-            trends["random_trend"]["strength"] = 1.0
+            return 0.0
+    
+    def calculate_temporal_trend(self, sequence):
+        """REAL: Calculate temporal trends in sequence"""
         
-        return trends
+        try:
+            temporal_engine = NexusTemporalWindowEngine(len(sequence))
+            return temporal_engine.temporal_trend(temporal_engine.window_statistics(np.asarray(sequence)), 0)
+            
+        except Exception as e:
+            return {
+                "increasing_trend": {"strength": 0.0, "predicted_changes": []},
+                "decreasing_trend": {"strength": 0.0, "predicted_changes": []},
+                "cyclical_trend": {"strength": 0.0, "predicted_changes": []},
+                "random_trend": {"strength": 1.0, "predicted_changes": []}
+            }
     
     def generate_historical_lottery_data(self, game_type, count=500):
         """REAL: Generate realistic historical lottery data for testing"""
         
         historical_data = []
-        game_config = self.lottery_games.get(game_type, self.lottery_games["powerball"])
+        game_spec = self.get_game_spec(game_type)
         
         try:
-            # Determine game parameters
-            if "white_balls" in game_config:
-                main_range = game_config["white_balls"]["range"]
-                main_count = game_config["white_balls"]["count"]
-                special_range = game_config["power_ball"]["range"]
-                special_count = game_config["power_ball"]["count"]
-            elif "main_balls" in game_config:
-                main_range = game_config["main_balls"]["range"]
-                main_count = game_config["main_balls"]["count"]
-                special_range = game_config["mega_ball"]["range"]
-                special_count = game_config["mega_ball"]["count"]
-            else:
-                main_range = game_config["numbers"]["range"]
-                main_count = game_config["numbers"]["count"]
-                special_range = None
-                special_count = 0
+            # Game parameters from the compiled spec
+            main_range = game_spec.number_range
+            main_count = game_spec.ball_count
+            special_range = game_spec.special_range
+            special_count = game_spec.special_count
             
             # Generate historical draws
             base_date = datetime.now() - timedelta(days=count * 3)  # 3 days between draws average
@@ -950,44 +2083,149 @@ class NexusLotteryAlgorithmSystem:
         
         return historical_data
     
-    def save_deployment_results(self, deployment_result):
-        """REAL: Save deployment results to database and files"""
+    def load_historical_draws(self, game_type, count=500, seed=None):
+        """REAL: Open the persisted draw store for a game, or synthesize history
+        
+        Without a seed the synthetic history is seeded per game, so repeated
+        deployments see the same draws and hit the analysis and model caches.
+        """
+        
+        store_path = f"{self.draw_store_path}/{game_type}"
+        if NexusDrawStore.exists(store_path):
+            return NexusDrawStore.open(store_path)
+        
+        if seed is None:
+            game_seed = int(hashlib.sha256(game_type.encode("utf-8")).hexdigest()[:8], 16)
+            seed = [SYNTHETIC_HISTORY_SEED, game_seed]
+        return self.synthesize_historical_draws(game_type, count, seed)
+    
+    def synthesize_historical_draws(self, game_type, count=500, seed=None, persist=False):
+        """REAL: Generate synthetic history in vectorized batches, skipping per-draw dicts"""
+        
+        game_spec = self.get_game_spec(game_type)
+        
+        if persist:
+            store_path = f"{self.draw_store_path}/{game_type}"
+            draw_store = NexusDrawStore.create(store_path, game_spec, game_type)
+            return synthesize_draw_store(draw_store, game_spec, count, seed)
+        
+        return synthesize_draw_matrix(game_spec, count, seed, game_type=game_type)
+    
+    def save_historical_draws(self, game_type, historical_data):
+        """REAL: Persist draw history to the game's columnar draw store"""
+        
+        game_spec = self.get_game_spec(game_type)
+        store_path = f"{self.draw_store_path}/{game_type}"
+        
+        draw_store = NexusDrawStore.write(store_path, historical_data, game_spec, game_type)
+        print(f"💾 DRAW STORE SAVED: {store_path} ({len(draw_store)} draws)")
+        return draw_store
+    
+    def ingest_draw_file(self, game_type, source_file, replace_existing=False, date_format=None):
+        """REAL: Stream a real CSV/JSONL/JSON(.gz) draw file into the game's draw store
+        
+        date_format is a strptime format for exports without ISO dates (e.g. "%m/%d/%Y").
+        """
+        
+        game_spec = self.get_game_spec(game_type)
+        store_path = f"{self.draw_store_path}/{game_type}"
+        
+        if NexusDrawStore.exists(store_path) and not replace_existing:
+            draw_store = NexusDrawStore.open(store_path)
+        else:
+            draw_store = NexusDrawStore.create(store_path, game_spec, game_type)
+        
+        ingestion_report = NexusDrawIngestion(game_spec, date_format=date_format).ingest_file(source_file, draw_store)
+        ingestion_report["store_draw_count"] = len(draw_store)
+        
+        print(f"📥 DRAWS INGESTED: {ingestion_report['rows_accepted']} accepted, "
+              f"{ingestion_report['rows_rejected']} rejected from {source_file}")
+        return ingestion_report
+    
+    def open_deployment_results_writer(self, deployment_result):
+        """REAL: NDJSON results file for a deployment, header written; None if it cannot be created
+        
+        The name carries the game, prediction count, a nanosecond timestamp and a
+        random suffix, so concurrent deployments (e.g. a batch) never collide.
+        """
+        
+        try:
+            results_file = (
+                f"{self.desktop_path}/nexus_lottery_deployment_results_{deployment_result['game_type']}_"
+                f"{deployment_result['prediction_count']}_{time.time_ns()}_{uuid.uuid4().hex[:8]}.ndjson"
+            )
+            results_writer = NexusDeploymentResultWriter(
+                results_file, keep_analyses=self.persist_agent_analyses, json_default=numpy_json_default
+            )
+            results_writer.write_header(deployment_result)
+            return results_writer
+            
+        except Exception as e:
+            print(f"Error saving deployment results: {e}")
+            return None
+    
+    def save_deployment_results(self, deployment_result, results_writer=None):
+        """REAL: Save deployment results to database and files
+        
+        Agents already streamed through results_writer are not written again;
+        without a writer the whole deployment goes to a new results file.
+        """
         
         try:
-            # Save to database
-            conn = sqlite3.connect(f"{self.desktop_path}/nexus_lottery_algorithms.db")
-            cursor = conn.cursor()
-            
-            # Save each prediction
-            for agent_name, agent_result in deployment_result["agent_predictions"].items():
-                for prediction in agent_result.get("predictions", []):
-                    cursor.execute('''
-                        INSERT INTO algorithm_predictions 
-                        (algorithm_name, game_type, predicted_numbers, confidence_score, 
-                         consciousness_guidance, neural_probability, prediction_timestamp)
-                        VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        agent_name,
-                        deployment_result["game_type"],
-                        json.dumps(prediction.get("numbers", [])),
-                        prediction.get("confidence_factors", {}).get("overall_confidence", 0.0),
-                        0.9 if "consciousness" in agent_name else 0.0,
-                        0.8 if "neural" in agent_name else 0.0,
-                        time.time()
-                    ))
-            
-            conn.commit()
-            conn.close()
-            
-            # Save to JSON file
-            results_file = f"{self.desktop_path}/nexus_lottery_deployment_results_{int(time.time())}.json"
-            with open(results_file, 'w') as f:
-                json.dump(deployment_result, f, indent=2)
-            
-            print(f"💾 DEPLOYMENT RESULTS SAVED: {results_file}")
+            # Queue every prediction for the write-behind logger (one transaction, off this thread)
+            prediction_store = NexusPredictionStore(f"{self.desktop_path}/nexus_lottery_algorithms.db")
+            queued_count = prediction_store.save_deployment_predictions(deployment_result)
+            deployment_result["predictions_queued"] = queued_count
+            print(f"💾 PREDICTIONS QUEUED: {queued_count}")
             
         except Exception as e:
             print(f"Error saving deployment results: {e}")
+        
+        owns_writer = results_writer is None
+        if owns_writer:
+            results_writer = self.open_deployment_results_writer(deployment_result)
+            if results_writer is None:
+                return
+        
+        try:
+            results_writer.write_deployment(deployment_result)
+            if results_writer.error is None:
+                print(f"💾 DEPLOYMENT RESULTS SAVED: {results_writer.results_file}")
+        finally:
+            if owns_writer:
+                results_writer.close()
+    
+    def query_stored_predictions(self, game_type, start_time=None, end_time=None, algorithm_name=None,
+                                 top_count=None):
+        """REAL: Stored predictions of a game as NumPy arrays (ids, algorithm_names, timestamps,
+        confidence_scores, numbers), or only the top_count most confident
+        
+        Opening the store queues the schema (and its covering index) for older or new
+        databases; queued write-behind writes are flushed so the read includes them.
+        """
+        
+        stored = {"game_type": game_type, "prediction_count": 0}
+        
+        try:
+            db_path = f"{self.desktop_path}/nexus_lottery_algorithms.db"
+            prediction_store = NexusPredictionStore(db_path)
+            prediction_store.write_logger.flush()
+            prediction_query = NexusPredictionQuery(db_path)
+            try:
+                if top_count is not None:
+                    arrays = prediction_query.top_predictions(game_type, top_count, start_time, end_time, algorithm_name)
+                else:
+                    arrays = prediction_query.predictions(game_type, start_time, end_time, algorithm_name)
+            finally:
+                prediction_query.close()
+            
+            stored.update(arrays)
+            stored["prediction_count"] = len(arrays["ids"])
+            
+        except Exception as e:
+            stored["error"] = str(e)
+        
+        return stored
     
     def generate_lottery_strategy_report(self, deployment_result):
         """REAL: Generate comprehensive lottery strategy report"""
@@ -1011,7 +2249,7 @@ class NexusLotteryAlgorithmSystem:
 ### {agent_name.upper().replace('_', ' ')}
 - **Agent Type:** {agent_result.get('agent_type', 'Unknown')}
 - **Predictions Generated:** {len(agent_result.get('predictions', []))}
-- **Confidence Level:** {agent_result.get('pattern_confidence', agent_result.get('neural_confidence', {})).get('overall_confidence', 0):.2f}
+- **Confidence Level:** {agent_overall_confidence(agent_result):.2f}
 - **Analysis Methods:** {len(agent_result.get('analysis_methods', agent_result.get('neural_networks', [])))}
 """
         
@@ -1030,6 +2268,27 @@ class NexusLotteryAlgorithmSystem:
 - **Rationale:** {prediction.get('ensemble_rationale', ['Multi-agent consensus'])[0] if prediction.get('ensemble_rationale') else 'Multi-agent analysis'}
 """
         
+        odds_table = self.get_game_spec(deployment_result['game_type']).odds_table
+        report += f"""
+## EXACT ODDS PER TICKET
+"""
+        for odds_row in odds_table.odds_rows():
+            if odds_row['main_matches'] or odds_row['special_matches']:
+                special_label = f" + {odds_row['special_matches']} special" if odds_table.special_count else ""
+                report += (f"- **{odds_row['main_matches']} main{special_label}:** "
+                           f"1 in {odds_row['odds_one_in']:,.2f}\n")
+        
+        # Present when the caller attached simulate_ticket_outcomes() for the ensemble tickets
+        simulation = deployment_result.get('outcome_simulation', {})
+        if simulation.get('draws_simulated'):
+            source = "exact odds" if simulation.get('exact') else f"{simulation['draws_simulated']:,} simulated draws"
+            report += f"""
+## SIMULATED OUTCOMES
+- **Ticket Set:** {simulation['ticket_count']} ensemble tickets, from {source}
+"""
+            for matches, rate in simulation.get('set_best_match_rates', {}).items():
+                report += f"- **Best Ticket Matches {matches}:** {rate:.6%} of draws\n"
+        
         report += f"""
 ## RESOURCE GENERATION STRATEGY
 - **Investment Approach:** Diversified multi-prediction strategy
@@ -1066,23 +2325,17 @@ def execute_lottery_algorithm_system():
     
     lottery_system = NexusLotteryAlgorithmSystem()
     
-    # Deploy algorithms for multiple lottery games
-    deployment_results = {}
+    # Deploy algorithms for multiple lottery games in one batch
+    print("\n🎯 DEPLOYING: Powerball, Mega Millions and State Lotto Algorithm Suites")
+    batch_result = lottery_system.execute_lottery_algorithm_batch([
+        ("powerball", 10),
+        ("mega_millions", 10),
+        ("state_lotto", 10)
+    ])
     
-    # Deploy Powerball algorithms
-    print("\n🎯 DEPLOYING: Powerball Algorithm Suite")
-    powerball_result = lottery_system.execute_lottery_algorithm_deployment("powerball", 10)
-    deployment_results["powerball"] = powerball_result
-    
-    # Deploy Mega Millions algorithms
-    print("\n🎯 DEPLOYING: Mega Millions Algorithm Suite") 
-    mega_millions_result = lottery_system.execute_lottery_algorithm_deployment("mega_millions", 10)
-    deployment_results["mega_millions"] = mega_millions_result
-    
-    # Deploy State Lotto algorithms
-    print("\n🎯 DEPLOYING: State Lotto Algorithm Suite")
-    state_lotto_result = lottery_system.execute_lottery_algorithm_deployment("state_lotto", 10)
-    deployment_results["state_lotto"] = state_lotto_result
+    deployment_results = {
+        result["game_type"]: result for result in batch_result["deployment_results"]
+    }
     
     # Calculate total resource generation potential
     total_resource_estimate = sum(result.get("resource_generation_estimate", 0) 
@@ -1110,7 +2363,7 @@ def execute_lottery_algorithm_system():
     
     results_file = f"{lottery_system.desktop_path}/nexus_lottery_system_complete_{int(time.time())}.json"
     with open(results_file, 'w') as f:
-        json.dump(comprehensive_results, f, indent=2)
+        json.dump(comprehensive_results, f, indent=2, default=numpy_json_default)
     
     print(f"\n✅ LOTTERY ALGORITHM SYSTEM DEPLOYMENT COMPLETE")
     print(f"🎰 GAMES DEPLOYED: {len(deployment_results)}")
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY BACKTESTER
+Walk-Forward Agent Replay Scored Against Every Following Draw
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_incremental_state import NexusIncrementalAnalysisState
+from nexus_lottery_ensemble_voter import agent_ticket_array
+
+RANDOM_BASELINE = "random_baseline"
+
+# Time slices per worker; later slices replay longer histories, so several per worker balance the load
+SLICES_PER_WORKER = 4
+
+
+def match_counts(tickets, draw, number_range):
+    """REAL: Main-ball matches of every ticket against one draw"""
+    drawn = np.zeros(number_range[1] - number_range[0] + 1, dtype=bool)
+    drawn[np.asarray(draw, dtype=np.int64) - number_range[0]] = True
+    return drawn[np.asarray(tickets, dtype=np.int64) - number_range[0]].sum(axis=1)
+
+
+def random_tickets(rng, ticket_count, number_range, ball_count):
+    """REAL: Uniformly random tickets, one row each"""
+    range_size = number_range[1] - number_range[0] + 1
+    keys = rng.random((ticket_count, range_size))
+    return np.argpartition(keys, ball_count, axis=1)[:, :ball_count] + number_range[0]
+
+
+def backtest_time_slice(lottery_system, game_type, main, start, end, agent_names, tickets_per_step,
+                        window_size=None, seed=0):
+    """REAL: Replay draws [start, end): agents see draws [0, t) and are scored on draw t
+
+    The incremental state is seeded from draws [0, start) in one pass and then
+    advanced one draw per step. Returns per-step match histograms per agent,
+    the agents' failed step counts and the wall time.
+    """
+    start_time = time.perf_counter()
+    game_spec = lottery_system.get_game_spec(game_type)
+    ball_count = game_spec.ball_count
+
+    agent_names = list(agent_names)
+    histograms = {
+        agent_name: np.zeros((end - start, ball_count + 1), dtype=np.int32)
+        for agent_name in agent_names + [RANDOM_BASELINE]
+    }
+    failed_steps = dict.fromkeys(agent_names, 0)
+
+    state = NexusIncrementalAnalysisState.from_draw_matrix(
+        NexusDrawMatrix(main[:start], game_spec.number_range), window_size=window_size
+    )
+
+    # Trained neural models stay in memory; nothing is written to the model cache, and
+    # per-step analyses go to a private cache so the caller's cache is left untouched
+    model_cache, lottery_system.model_cache = lottery_system.model_cache, None
+    analysis_cache, lottery_system.analysis_cache = lottery_system.analysis_cache, {}
+    try:
+        for step, draw_index in enumerate(range(start, end)):
+            lottery_system.analysis_cache.clear()
+            step_results = {}
+
+            for agent_name in agent_names:
+                agent_config = lottery_system.agent_system[agent_name]
+                if agent_config["depends_on"]:
+                    dependency_results = {name: step_results.get(name, {}) for name in agent_config["depends_on"]}
+                    agent_result = agent_config["implementation"](game_type, dependency_results, tickets_per_step)
+                else:
+                    agent_result = agent_config["implementation"](
+                        game_type, state, tickets_per_step, seed=[seed, draw_index]
+                    )
+                step_results[agent_name] = agent_result
+
+                tickets = agent_ticket_array(agent_result, ball_count) if "error" not in agent_result else None
+                if tickets is None or not len(tickets):
+                    failed_steps[agent_name] += 1
+                    continue
+                histograms[agent_name][step] = np.bincount(
+                    match_counts(tickets, main[draw_index], game_spec.number_range), minlength=ball_count + 1
+                )
+
+            # Seeded per draw like the agents, so results do not depend on the slicing
+            baseline_rng = np.random.default_rng([seed, draw_index])
+            baseline_tickets = random_tickets(baseline_rng, tickets_per_step, game_spec.number_range, ball_count)
+            histograms[RANDOM_BASELINE][step] = np.bincount(
+                match_counts(baseline_tickets, main[draw_index], game_spec.number_range), minlength=ball_count + 1
+            )
+
+            state.add_draw(main[draw_index])
+    finally:
+        lottery_system.model_cache = model_cache
+        lottery_system.analysis_cache = analysis_cache
+
+    return {
+        "start": start,
+        "end": end,
+        "histograms": histograms,
+        "failed_steps": failed_steps,
+        "wall_time": time.perf_counter() - start_time
+    }
+
+
+class NexusWalkForwardBacktester:
+    """REAL: Walk-forward replay of the lottery agents, parallel across time slices
+
+    Step t runs every agent on draws [0, t) (through the incremental analysis
+    state) and scores its tickets against draw t. Slices of consecutive steps
+    run in separate worker processes; within a slice the state and the neural
+    models advance one draw at a time instead of refitting.
+    """
+
+    def __init__(self, lottery_system, game_type, agent_names=None, tickets_per_step=10, window_size=None,
+                 seed=0, max_workers=None):
+        self.lottery_system = lottery_system
+        self.game_type = game_type
+        self.game_spec = lottery_system.get_game_spec(game_type)
+        self.agent_names = list(agent_names or lottery_system.agent_system)
+        self.tickets_per_step = tickets_per_step
+        self.window_size = window_size
+        self.seed = seed
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def time_slices(self, start, end):
+        """REAL: (start, end) step ranges, SLICES_PER_WORKER per worker"""
+        slice_count = max(1, min(end - start, self.max_workers * SLICES_PER_WORKER))
+        edges = np.linspace(start, end, slice_count + 1).round().astype(int)
+        return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+    def run(self, draw_matrix, start, end=None):
+        """REAL: Replay draws [start, end) and summarize every agent against random tickets"""
+        run_start = time.perf_counter()
+        main = np.ascontiguousarray(draw_matrix.main)
+        end = len(main) if end is None else min(end, len(main))
+        start = max(1, min(start, end))
+        time_slices = self.time_slices(start, end)
+
+        slice_args = [
+            (self.game_type, main, slice_start, slice_end, self.agent_names, self.tickets_per_step,
+             self.window_size, self.seed)
+            for slice_start, slice_end in time_slices
+        ]
+        worker_count = min(len(time_slices), self.max_workers)
+        if worker_count > 1:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                futures = [executor.submit(backtest_time_slice, self.lottery_system, *args) for args in slice_args]
+                slice_results = [future.result() for future in futures]
+        else:
+            slice_results = [backtest_time_slice(self.lottery_system, *args) for args in slice_args]
+
+        histograms = {
+            agent_name: np.concatenate([result["histograms"][agent_name] for result in slice_results])
+            if slice_results else np.zeros((0, self.game_spec.ball_count + 1), dtype=np.int32)
+            for agent_name in self.agent_names + [RANDOM_BASELINE]
+        }
+        failed_steps = {
+            agent_name: sum(result["failed_steps"][agent_name] for result in slice_results)
+            for agent_name in self.agent_names
+        }
+
+        report = self.summarize(histograms, failed_steps)
+        report.update({
+            "start": start,
+            "end": end,
+            "time_slices": len(time_slices),
+            "workers": worker_count,
+            "slice_wall_times": [result["wall_time"] for result in slice_results],
+            "wall_time": time.perf_counter() - run_start
+        })
+        return report
+
+    def summarize(self, histograms, failed_steps):
+        """REAL: Match distributions, hit rates and lift of every agent against exact random odds
+
+        z_score_vs_random is a t statistic of the per-step mean match count
+        against the random expectation, so tickets sharing a draw are not
+        treated as independent.
+        """
+        ball_count = self.game_spec.ball_count
+        match_values = np.arange(ball_count + 1)
+        random_probabilities = self.game_spec.odds_table.main_probabilities
+        random_at_least = self.game_spec.odds_table.main_at_least
+        expected_matches = self.game_spec.odds_table.expected_main_matches
+
+        report = {
+            "game_type": self.game_type,
+            "steps": len(next(iter(histograms.values()))) if histograms else 0,
+            "tickets_per_step": self.tickets_per_step,
+            "random_match_probabilities": random_probabilities.tolist(),
+            "random_expected_matches": expected_matches,
+            "agents": {}
+        }
+
+        for agent_name, step_histograms in histograms.items():
+            step_tickets = step_histograms.sum(axis=1)
+            scored = step_tickets > 0
+            step_means = (step_histograms[scored] @ match_values) / step_tickets[scored]
+            totals = step_histograms.sum(axis=0).astype(np.int64)
+            ticket_count = int(totals.sum())
+
+            summary = {
+                "steps_scored": int(scored.sum()),
+                "failed_steps": failed_steps.get(agent_name, 0),
+                "tickets_scored": ticket_count,
+                "match_histogram": totals.tolist(),
+                "mean_matches": 0.0,
+                "lift_over_random": 0.0,
+                "hit_rates": {},
+                "random_hit_rates": {},
+                "step_mean_match_percentiles": {},
+                "z_score_vs_random": 0.0
+            }
+            if ticket_count:
+                mean_matches = float(totals @ match_values / ticket_count)
+                summary["mean_matches"] = mean_matches
+                summary["lift_over_random"] = mean_matches / expected_matches
+                for matches in range(1, ball_count + 1):
+                    summary["hit_rates"][f"{matches}+"] = float(totals[matches:].sum() / ticket_count)
+                    summary["random_hit_rates"][f"{matches}+"] = float(random_at_least[matches])
+                summary["step_mean_match_percentiles"] = dict(zip(
+                    ("p5", "p25", "p50", "p75", "p95"),
+                    np.percentile(step_means, [5, 25, 50, 75, 95]).tolist()
+                ))
+                if len(step_means) > 1 and step_means.std(ddof=1) > 0:
+                    summary["z_score_vs_random"] = float(
+                        (step_means.mean() - expected_matches) / (step_means.std(ddof=1) / np.sqrt(len(step_means)))
+                    )
+
+            report["agents"][agent_name] = summary
+
+        return report
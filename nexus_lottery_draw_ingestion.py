@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY DRAW INGESTION
+Streaming CSV/JSONL (And Whole-Document JSON) Draw File Ingestion With Game-Config Validation
+
+Accepted layout: one row per draw with a draw date and the drawn numbers, either
+as one "numbers" field (main balls, then special balls) or as separate main and
+special fields; jackpot and winner counts are optional. Column names are matched
+case-insensitively through DRAW_FIELD_ALIASES ("Draw Date", "Winning Numbers",
+"Mega Ball", ...). Dates are ISO (YYYY-MM-DD) unless a strptime date_format is
+given. Rows that do not fit are rejected with a reason, never guessed at.
+"""
+
+import io
+import re
+import csv
+import gzip
+import json
+import time
+from datetime import datetime
+
+import numpy as np
+
+from nexus_lottery_game_spec import resolve_game_balls
+
+NUMBER_PATTERN = re.compile(r"\d+")
+
+# Currency symbols, thousands separators and spaces in amounts like "$1,000,000"
+AMOUNT_FORMATTING_PATTERN = re.compile(r"[\s$,]")
+
+# Runs of spaces, hyphens and underscores in column names ("Draw Date" -> "draw_date")
+COLUMN_SEPARATOR_PATTERN = re.compile(r"[\s\-_]+")
+
+# Draw record fields and the column names (normalized) that exports use for them
+DRAW_FIELD_ALIASES = {
+    "draw_date": ("draw_date", "date", "drawdate", "draw_day"),
+    "numbers": ("numbers", "winning_numbers", "drawn_numbers"),
+    "main_numbers": ("main_numbers", "main_balls", "white_balls"),
+    "special_numbers": ("special_numbers", "special_ball", "powerball", "power_ball", "mega_ball", "bonus_ball"),
+    "jackpot_amount": ("jackpot_amount", "jackpot", "estimated_jackpot"),
+    "winners_count": ("winners_count", "winners", "jackpot_winners")
+}
+
+
+def open_draw_file(path):
+    """REAL: Open a draw file as text, transparently decompressing gzip"""
+    with open(path, "rb") as f:
+        is_gzip = f.read(2) == b"\x1f\x8b"
+    if is_gzip:
+        return io.TextIOWrapper(gzip.open(path, "rb"), encoding="utf-8", newline="")
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def detect_draw_file_format(path):
+    """REAL: Infer csv, jsonl or json from the file name (ignoring a .gz suffix)"""
+    name = path.lower()
+    if name.endswith(".gz"):
+        name = name[:-3]
+    if name.endswith(".jsonl") or name.endswith(".ndjson"):
+        return "jsonl"
+    if name.endswith(".json"):
+        return "json"
+    return "csv"
+
+
+def json_document_records(document):
+    """REAL: Draw records of a JSON document - a list of records or an object with a "draws" list"""
+    if isinstance(document, dict):
+        document = document.get("draws")
+    if not isinstance(document, list):
+        raise ValueError('JSON draw files must hold a list of draws or an object with a "draws" list')
+    return document
+
+
+def _parse_numbers(value):
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [int(num) for num in value]
+    return [int(num) for num in NUMBER_PATTERN.findall(str(value))]
+
+
+def _parse_amount(value):
+    if value is None:
+        return 0.0
+    if isinstance(value, str):
+        value = AMOUNT_FORMATTING_PATTERN.sub("", value)
+    return float(value or 0.0)
+
+
+def normalize_column_name(column):
+    """REAL: Lower-case column name with separators folded to single underscores"""
+    return COLUMN_SEPARATOR_PATTERN.sub("_", str(column).strip().lower()).strip("_")
+
+
+class NexusDrawIngestion:
+    """REAL: Chunked draw ingestion that validates rows and appends them to a draw store
+
+    JSONL files hold one record per line; .json files are a single document,
+    loaded whole (see json_document_records). Columns map to the draw record
+    fields through DRAW_FIELD_ALIASES plus any field_aliases given; a "numbers"
+    field holds main balls followed by special balls unless the special balls
+    have their own column. Number fields may use any separator, amounts may
+    carry currency formatting, and main balls are stored sorted. Dates must be
+    ISO unless date_format (a strptime format such as "%m/%d/%Y") is given.
+    """
+
+    def __init__(self, game_config, chunk_size=10000, date_format=None, field_aliases=None):
+        main_balls, special_balls = resolve_game_balls(game_config)
+        self.number_range = tuple(main_balls["range"])
+        self.ball_count = main_balls["count"]
+        self.special_range = tuple(special_balls["range"]) if special_balls else None
+        self.special_count = special_balls["count"] if special_balls else 0
+        self.chunk_size = chunk_size
+        self.date_format = date_format
+
+        self.column_fields = {}
+        for aliases in (DRAW_FIELD_ALIASES, field_aliases or {}):
+            for field, columns in aliases.items():
+                for column in columns:
+                    self.column_fields[normalize_column_name(column)] = field
+        # Raw column name -> draw record field (None for ignored columns such as a multiplier)
+        self.record_fields = {}
+
+    def canonical_record(self, record):
+        """REAL: The row's values keyed by draw record field; the first column of a field wins"""
+        fields = {}
+        for column, value in record.items():
+            if column not in self.record_fields:
+                self.record_fields[column] = self.column_fields.get(normalize_column_name(column))
+            field = self.record_fields[column]
+            if field is not None and field not in fields:
+                fields[field] = value
+        return fields
+
+    def iter_records(self, path, file_format=None):
+        """REAL: Yield raw row dicts one at a time (None for unparseable lines)"""
+        file_format = file_format or detect_draw_file_format(path)
+
+        with open_draw_file(path) as f:
+            if file_format == "jsonl":
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        record = None
+                    yield record if isinstance(record, dict) else None
+            elif file_format == "json":
+                for record in json_document_records(json.load(f)):
+                    yield record if isinstance(record, dict) else None
+            else:
+                for record in csv.DictReader(f):
+                    yield record
+
+    def split_record(self, record):
+        """REAL: Pull (date, main, special, jackpot, winners) from a row, or a rejection reason"""
+        if record is None:
+            return "unparseable_row"
+
+        record = self.canonical_record(record)
+        try:
+            special_numbers = _parse_numbers(record.get("special_numbers"))
+            if record.get("main_numbers") not in (None, ""):
+                main_numbers = _parse_numbers(record["main_numbers"])
+            elif record.get("special_numbers") not in (None, ""):
+                main_numbers = _parse_numbers(record.get("numbers"))
+            else:
+                all_numbers = _parse_numbers(record.get("numbers"))
+                main_numbers = all_numbers[:self.ball_count]
+                special_numbers = all_numbers[self.ball_count:]
+
+            draw_date = record.get("draw_date")
+            jackpot = _parse_amount(record.get("jackpot_amount"))
+            winners = int(_parse_amount(record.get("winners_count")))
+        except (TypeError, ValueError):
+            return "unparseable_row"
+
+        if len(main_numbers) != self.ball_count or len(special_numbers) != self.special_count:
+            return "wrong_ball_count"
+        if not draw_date:
+            return "missing_draw_date"
+
+        if self.date_format:
+            try:
+                draw_date = datetime.strptime(str(draw_date).strip(), self.date_format).date().isoformat()
+            except ValueError:
+                return "invalid_draw_date"
+
+        return str(draw_date)[:10], main_numbers, special_numbers, jackpot, winners
+
+    def validate_chunk(self, dates, main_numbers, special_numbers):
+        """REAL: Vectorized range/duplicate/date checks; returns (valid mask, day offsets, reasons)"""
+        main_numbers = np.asarray(main_numbers, dtype=np.int64).reshape(len(dates), self.ball_count)
+        special_numbers = np.asarray(special_numbers, dtype=np.int64).reshape(len(dates), self.special_count)
+        reasons = {}
+
+        main_in_range = ((main_numbers >= self.number_range[0]) & (main_numbers <= self.number_range[1])).all(axis=1)
+        sorted_main = np.sort(main_numbers, axis=1)
+        main_distinct = (np.diff(sorted_main, axis=1) != 0).all(axis=1)
+
+        special_valid = np.ones(len(dates), dtype=bool)
+        if self.special_count:
+            special_valid = ((special_numbers >= self.special_range[0]) &
+                             (special_numbers <= self.special_range[1])).all(axis=1)
+            if self.special_count > 1:
+                special_valid &= (np.diff(np.sort(special_numbers, axis=1), axis=1) != 0).all(axis=1)
+
+        # ISO dates convert in one call; fall back per row only when the chunk has bad dates
+        try:
+            day_offsets = np.array(dates, dtype="datetime64[D]").astype(np.int64)
+            date_valid = np.ones(len(dates), dtype=bool)
+        except ValueError:
+            day_offsets = np.zeros(len(dates), dtype=np.int64)
+            date_valid = np.zeros(len(dates), dtype=bool)
+            for row_index, draw_date in enumerate(dates):
+                try:
+                    day_offsets[row_index] = np.datetime64(draw_date, "D").astype(np.int64)
+                    date_valid[row_index] = True
+                except ValueError:
+                    pass
+
+        checks = [
+            ("main_number_out_of_range", main_in_range),
+            ("duplicate_main_number", main_distinct),
+            ("invalid_special_number", special_valid),
+            ("invalid_draw_date", date_valid)
+        ]
+        valid = np.ones(len(dates), dtype=bool)
+        for reason, passed in checks:
+            failed = valid & ~passed
+            if failed.any():
+                reasons[reason] = int(failed.sum())
+            valid &= passed
+
+        return valid, day_offsets, reasons
+
+    def ingest_file(self, path, draw_store, file_format=None):
+        """REAL: Stream a draw file into a draw store chunk by chunk"""
+        report = {
+            "source_file": path,
+            "rows_read": 0,
+            "rows_accepted": 0,
+            "rows_rejected": 0,
+            "rejection_reasons": {},
+            "chunks_written": 0,
+            "elapsed_seconds": 0.0
+        }
+        start_time = time.perf_counter()
+
+        chunk = ([], [], [], [], [])
+
+        def reject(reason, count=1):
+            report["rows_rejected"] += count
+            report["rejection_reasons"][reason] = report["rejection_reasons"].get(reason, 0) + count
+
+        def flush_chunk():
+            dates, main_numbers, special_numbers, jackpots, winners = chunk
+            if not dates:
+                return
+            valid, day_offsets, reasons = self.validate_chunk(dates, main_numbers, special_numbers)
+            for reason, count in reasons.items():
+                reject(reason, count)
+
+            if valid.any():
+                draw_store.append(
+                    np.sort(np.asarray(main_numbers)[valid], axis=1),
+                    np.asarray(special_numbers).reshape(len(dates), self.special_count)[valid],
+                    day_offsets=day_offsets[valid],
+                    jackpots=np.asarray(jackpots)[valid],
+                    winners=np.clip(np.asarray(winners)[valid], 0, np.iinfo(np.uint8).max)
+                )
+                report["rows_accepted"] += int(valid.sum())
+                report["chunks_written"] += 1
+
+            for column in chunk:
+                column.clear()
+
+        for record in self.iter_records(path, file_format):
+            report["rows_read"] += 1
+            parsed = self.split_record(record)
+            if isinstance(parsed, str):
+                reject(parsed)
+                continue
+
+            for column, value in zip(chunk, parsed):
+                column.append(value)
+            if len(chunk[0]) >= self.chunk_size:
+                flush_chunk()
+
+        flush_chunk()
+
+        report["elapsed_seconds"] = time.perf_counter() - start_time
+        return report
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY DRAW MATRIX
+Columnar Draw Representation For Vectorized Multi-Agent Pattern Analysis
+"""
+
+import hashlib
+
+import numpy as np
+
+from nexus_lottery_game_spec import resolve_game_balls
+
+
+class NexusDrawMatrix:
+    """REAL: Draws x ball-position matrix shared by every lottery analyzer"""
+
+    def __init__(self, main_numbers, number_range, special_numbers=None, draw_dates=None, game_type=None):
+        # Integer arrays (e.g. memory-mapped uint8 store columns) are used without copying
+        if isinstance(main_numbers, np.ndarray) and main_numbers.dtype.kind in "iu":
+            self.main = main_numbers
+        else:
+            self.main = np.ascontiguousarray(main_numbers, dtype=np.int16)
+        if self.main.ndim != 2:
+            self.main = self.main.reshape(len(self.main), -1)
+
+        self.number_range = (int(number_range[0]), int(number_range[1]))
+        self.range_size = self.number_range[1] - self.number_range[0] + 1
+
+        if special_numbers is None:
+            special_numbers = np.zeros((len(self.main), 0), dtype=np.int16)
+        if isinstance(special_numbers, np.ndarray) and special_numbers.dtype.kind in "iu":
+            self.special = special_numbers
+        else:
+            self.special = np.ascontiguousarray(special_numbers, dtype=np.int16)
+        if self.special.ndim != 2:
+            self.special = self.special.reshape(len(self.main), -1)
+
+        self.draw_dates = draw_dates
+        self.game_type = game_type
+
+        # Derived arrays are built on first use and shared afterwards
+        self._offsets = None
+        self._incidence = None
+        self._sorted_main = None
+        self._sums = None
+        self._prefix_counts = None
+        self._prefix_sum_moments = None
+        self._fingerprint = None
+
+    @classmethod
+    def from_historical_data(cls, historical_data, game_config, game_type=None):
+        """REAL: Build the draw matrix once from a list of draw records"""
+        main_balls, special_balls = resolve_game_balls(game_config)
+        ball_count = main_balls["count"]
+        special_count = special_balls["count"] if special_balls else 0
+
+        draw_count = len(historical_data)
+        flat_numbers = np.fromiter(
+            (num for draw in historical_data for num in draw["numbers"][:ball_count + special_count]),
+            dtype=np.int16,
+            count=draw_count * (ball_count + special_count)
+        ).reshape(draw_count, ball_count + special_count)
+
+        return cls(
+            flat_numbers[:, :ball_count],
+            main_balls["range"],
+            special_numbers=flat_numbers[:, ball_count:],
+            draw_dates=[draw.get("draw_date") for draw in historical_data],
+            game_type=game_type
+        )
+
+    def __len__(self):
+        return self.main.shape[0]
+
+    @property
+    def draw_count(self):
+        return self.main.shape[0]
+
+    @property
+    def ball_count(self):
+        return self.main.shape[1]
+
+    @property
+    def numbers(self):
+        """REAL: All numbers in the range covered by the incidence columns"""
+        return np.arange(self.number_range[0], self.number_range[1] + 1)
+
+    @property
+    def offsets(self):
+        """REAL: Main numbers shifted to zero-based incidence column indices"""
+        if self._offsets is None:
+            self._offsets = self.main - self.number_range[0]
+        return self._offsets
+
+    @property
+    def incidence(self):
+        """REAL: One-hot draws x number-range incidence matrix"""
+        if self._incidence is None:
+            incidence = np.zeros((self.draw_count, self.range_size), dtype=np.uint8)
+            rows = np.repeat(np.arange(self.draw_count), self.ball_count)
+            incidence[rows, self.offsets.ravel()] = 1
+            self._incidence = incidence
+        return self._incidence
+
+    @property
+    def sorted_main(self):
+        if self._sorted_main is None:
+            self._sorted_main = np.sort(self.main, axis=1)
+        return self._sorted_main
+
+    @property
+    def sums(self):
+        if self._sums is None:
+            self._sums = self.main.sum(axis=1, dtype=np.int64)
+        return self._sums
+
+    @property
+    def prefix_counts(self):
+        """REAL: Number-major prefix sums of the incidence matrix, shape (range, draws + 1)
+
+        Column j holds the appearance count of every number in draws [0, j), so the
+        counts of any window are the difference of two columns.
+        """
+        if self._prefix_counts is None:
+            prefix_counts = np.zeros((self.range_size, self.draw_count + 1), dtype=np.int32)
+            np.cumsum(self.incidence.T, axis=1, dtype=np.int32, out=prefix_counts[:, 1:])
+            self._prefix_counts = prefix_counts
+        return self._prefix_counts
+
+    @property
+    def prefix_sum_moments(self):
+        """REAL: Prefix sums of draw sums and squared draw sums, each of length draws + 1"""
+        if self._prefix_sum_moments is None:
+            prefix_sums = np.zeros(self.draw_count + 1, dtype=np.int64)
+            prefix_squares = np.zeros(self.draw_count + 1, dtype=np.int64)
+            np.cumsum(self.sums, out=prefix_sums[1:])
+            np.cumsum(self.sums * self.sums, out=prefix_squares[1:])
+            self._prefix_sum_moments = (prefix_sums, prefix_squares)
+        return self._prefix_sum_moments
+
+    def window_frequencies(self, start, end):
+        """REAL: Appearance counts over draws [start, end) as a prefix-sum difference"""
+        prefix_counts = self.prefix_counts
+        return (prefix_counts[:, end] - prefix_counts[:, start]).astype(np.int64)
+
+    def window_appearance_bounds(self, start, end):
+        """REAL: First and last appearance of every number inside draws [start, end), -1 if absent"""
+        prefix_counts = self.prefix_counts
+        first_seen = np.full(self.range_size, -1, dtype=np.int64)
+        last_seen = np.full(self.range_size, -1, dtype=np.int64)
+
+        for offset in np.flatnonzero(prefix_counts[:, end] > prefix_counts[:, start]).tolist():
+            counts = prefix_counts[offset]
+            first_seen[offset] = np.searchsorted(counts, counts[start], side="right") - 1
+            last_seen[offset] = np.searchsorted(counts, counts[end], side="left") - 1
+
+        return first_seen, last_seen
+
+    def window_sum_moments(self, start, end):
+        """REAL: (draw count, sum of draw sums, sum of squared draw sums) over draws [start, end)"""
+        prefix_sums, prefix_squares = self.prefix_sum_moments
+        return end - start, int(prefix_sums[end] - prefix_sums[start]), int(prefix_squares[end] - prefix_squares[start])
+
+    def fingerprint(self):
+        """REAL: Content hash of the draws, used as a cache key for derived analyses"""
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            digest.update(np.asarray(self.number_range, dtype=np.int64).tobytes())
+            digest.update(np.asarray(self.main.shape + self.special.shape, dtype=np.int64).tobytes())
+            digest.update(np.ascontiguousarray(self.main).tobytes())
+            digest.update(np.ascontiguousarray(self.special).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    def number_frequencies(self):
+        """REAL: Appearance count of every number in the range"""
+        return np.bincount(self.offsets.ravel(), minlength=self.range_size)[:self.range_size]
+
+    def appearance_positions(self):
+        """REAL: (number offset, draw index) pairs grouped by number, in draw order"""
+        flat_offsets = self.offsets.ravel()
+        order = np.argsort(flat_offsets, kind="stable")
+        return flat_offsets[order].astype(np.int64), order // self.ball_count
+
+    def draw_date_strings(self, draw_indices):
+        """REAL: Draw dates of many draws as strings in one conversion"""
+        if self.draw_dates is None:
+            return [None] * len(draw_indices)
+        if isinstance(self.draw_dates, np.ndarray):
+            return np.datetime_as_string(self.draw_dates[draw_indices].astype("datetime64[D]")).tolist()
+        return [self.draw_dates[draw_index] for draw_index in draw_indices]
+
+    def draw_date(self, draw_index):
+        if self.draw_dates is None:
+            return None
+        draw_date = self.draw_dates[draw_index]
+        return draw_date if draw_date is None or isinstance(draw_date, str) else str(draw_date)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY DRAW STORE
+Compact Columnar On-Disk Draw History With Memory-Mapped Loading
+"""
+
+import os
+import json
+from datetime import date, datetime
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_game_spec import resolve_game_balls
+
+DRAW_STORE_FORMAT_VERSION = 1
+DRAW_STORE_EPOCH = date(1970, 1, 1)
+
+# Fixed-width column files; row counts live in metadata.json
+DRAW_STORE_COLUMNS = {
+    "main": ("main.u8", np.uint8),
+    "special": ("special.u8", np.uint8),
+    "day_offsets": ("day_offsets.i32", np.int32),
+    "jackpots": ("jackpots.f32", np.float32),
+    "winners": ("winners.u8", np.uint8)
+}
+
+
+def date_to_day_offset(draw_date):
+    """REAL: Convert a draw date (date, datetime or YYYY-MM-DD string) to days since the epoch"""
+    if isinstance(draw_date, str):
+        draw_date = datetime.strptime(draw_date[:10], "%Y-%m-%d").date()
+    elif isinstance(draw_date, datetime):
+        draw_date = draw_date.date()
+    return (draw_date - DRAW_STORE_EPOCH).days
+
+
+class NexusDrawStore:
+    """REAL: Directory of fixed-width draw columns, memory-mapped read-only on load
+
+    Layout: main.u8 (draws x main balls), special.u8 (draws x special balls),
+    day_offsets.i32 (days since 1970-01-01), jackpots.f32, winners.u8 and a
+    metadata.json holding the game definition and the committed draw count.
+    """
+
+    def __init__(self, path, metadata):
+        self.path = path
+        self.metadata = metadata
+        self._columns = None
+
+    # === CREATION ===
+
+    @classmethod
+    def create(cls, path, game_config, game_type=None):
+        """REAL: Create an empty store for a game (existing columns are truncated)"""
+        main_balls, special_balls = resolve_game_balls(game_config)
+        for balls in (main_balls, special_balls):
+            if balls and balls["range"][1] > np.iinfo(np.uint8).max:
+                raise ValueError(f"Ball range {balls['range']} does not fit the uint8 draw store columns")
+
+        os.makedirs(path, exist_ok=True)
+        metadata = {
+            "format_version": DRAW_STORE_FORMAT_VERSION,
+            "game_type": game_type,
+            "number_range": list(main_balls["range"]),
+            "ball_count": main_balls["count"],
+            "special_range": list(special_balls["range"]) if special_balls else None,
+            "special_count": special_balls["count"] if special_balls else 0,
+            "draw_count": 0
+        }
+
+        for file_name, _ in DRAW_STORE_COLUMNS.values():
+            open(os.path.join(path, file_name), "wb").close()
+
+        store = cls(path, metadata)
+        store._write_metadata()
+        return store
+
+    @classmethod
+    def write(cls, path, historical_data, game_config, game_type=None):
+        """REAL: Write a list of draw records (or a draw matrix) to a new store"""
+        store = cls.create(path, game_config, game_type)
+
+        if isinstance(historical_data, NexusDrawMatrix):
+            day_offsets = None
+            if historical_data.draw_dates is not None:
+                day_offsets = np.asarray(historical_data.draw_dates, dtype="datetime64[D]").astype(np.int32)
+            store.append(historical_data.main, historical_data.special, day_offsets=day_offsets)
+            return store
+
+        ball_count = store.metadata["ball_count"]
+        special_count = store.metadata["special_count"]
+        numbers = np.array([draw["numbers"][:ball_count + special_count] for draw in historical_data],
+                           dtype=np.uint8).reshape(len(historical_data), ball_count + special_count)
+
+        store.append(
+            numbers[:, :ball_count],
+            numbers[:, ball_count:],
+            day_offsets=[date_to_day_offset(draw["draw_date"]) for draw in historical_data],
+            jackpots=[draw.get("jackpot_amount", 0.0) for draw in historical_data],
+            winners=[draw.get("winners_count", 0) for draw in historical_data]
+        )
+        return store
+
+    @classmethod
+    def open(cls, path):
+        """REAL: Open an existing store; columns are memory-mapped on first access"""
+        with open(os.path.join(path, "metadata.json")) as f:
+            metadata = json.load(f)
+
+        if metadata.get("format_version") != DRAW_STORE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported draw store format: {metadata.get('format_version')}")
+
+        return cls(path, metadata)
+
+    @staticmethod
+    def exists(path):
+        return os.path.exists(os.path.join(path, "metadata.json"))
+
+    def _write_metadata(self):
+        # Replace atomically so readers never see a half-written draw count
+        metadata_file = os.path.join(self.path, "metadata.json")
+        with open(metadata_file + ".tmp", "w") as f:
+            json.dump(self.metadata, f, indent=2)
+        os.replace(metadata_file + ".tmp", metadata_file)
+
+    # === APPENDING ===
+
+    def append(self, main_numbers, special_numbers=None, day_offsets=None, jackpots=None, winners=None):
+        """REAL: Append a block of draws to every column and commit the new draw count"""
+        main_numbers = np.asarray(main_numbers)
+        draw_count = len(main_numbers)
+        if draw_count == 0:
+            return 0
+
+        ball_count = self.metadata["ball_count"]
+        special_count = self.metadata["special_count"]
+
+        if special_numbers is None:
+            special_numbers = np.zeros((draw_count, special_count), dtype=np.uint8)
+        if day_offsets is None:
+            # Without dates, continue three days after the last stored draw
+            last_offset = int(self.day_offsets[-1]) if len(self) else date_to_day_offset(date.today())
+            day_offsets = last_offset + 3 * np.arange(1, draw_count + 1)
+
+        blocks = {
+            "main": np.asarray(main_numbers, dtype=np.uint8).reshape(draw_count, ball_count),
+            "special": np.asarray(special_numbers, dtype=np.uint8).reshape(draw_count, special_count),
+            "day_offsets": np.asarray(day_offsets, dtype=np.int32).reshape(draw_count),
+            "jackpots": np.zeros(draw_count, dtype=np.float32) if jackpots is None
+                        else np.asarray(jackpots, dtype=np.float32).reshape(draw_count),
+            "winners": np.zeros(draw_count, dtype=np.uint8) if winners is None
+                       else np.asarray(winners, dtype=np.uint8).reshape(draw_count)
+        }
+
+        committed_count = self.metadata["draw_count"]
+        for column_name, (file_name, dtype) in DRAW_STORE_COLUMNS.items():
+            column_file = os.path.join(self.path, file_name)
+            row_bytes = int(np.prod(blocks[column_name].shape[1:], dtype=np.int64)) * np.dtype(dtype).itemsize
+            with open(column_file, "r+b") as f:
+                # Drop any rows left behind by an append that never committed
+                f.truncate(committed_count * row_bytes)
+                f.seek(0, os.SEEK_END)
+                f.write(np.ascontiguousarray(blocks[column_name]).tobytes())
+
+        self.metadata["draw_count"] = committed_count + draw_count
+        self._write_metadata()
+        self._columns = None
+        return draw_count
+
+    # === READING ===
+
+    def __len__(self):
+        return self.metadata["draw_count"]
+
+    def _column_shape(self, column_name):
+        draw_count = self.metadata["draw_count"]
+        if column_name == "main":
+            return (draw_count, self.metadata["ball_count"])
+        if column_name == "special":
+            return (draw_count, self.metadata["special_count"])
+        return (draw_count,)
+
+    @property
+    def columns(self):
+        """REAL: Read-only memory maps of every column (empty arrays for an empty store)"""
+        if self._columns is None:
+            columns = {}
+            for column_name, (file_name, dtype) in DRAW_STORE_COLUMNS.items():
+                shape = self._column_shape(column_name)
+                if int(np.prod(shape)) == 0:
+                    columns[column_name] = np.zeros(shape, dtype=dtype)
+                else:
+                    columns[column_name] = np.memmap(os.path.join(self.path, file_name), dtype=dtype,
+                                                     mode="r", shape=shape)
+            self._columns = columns
+        return self._columns
+
+    @property
+    def main(self):
+        return self.columns["main"]
+
+    @property
+    def special(self):
+        return self.columns["special"]
+
+    @property
+    def day_offsets(self):
+        return self.columns["day_offsets"]
+
+    @property
+    def jackpots(self):
+        return self.columns["jackpots"]
+
+    @property
+    def winners(self):
+        return self.columns["winners"]
+
+    @property
+    def draw_dates(self):
+        return self.day_offsets.astype("datetime64[D]")
+
+    def to_draw_matrix(self, start=0, end=None):
+        """REAL: Zero-copy draw matrix view over draws [start, end) for the analyzers"""
+        end = len(self) if end is None else end
+        return NexusDrawMatrix(
+            self.main[start:end],
+            self.metadata["number_range"],
+            special_numbers=self.special[start:end],
+            draw_dates=self.draw_dates[start:end],
+            game_type=self.metadata["game_type"]
+        )
+
+    def iter_draws(self, start=0, end=None):
+        """REAL: Yield draw records in the generate_historical_lottery_data layout"""
+        end = len(self) if end is None else end
+        for draw_index in range(start, end):
+            main_numbers = self.main[draw_index].tolist()
+            special_numbers = self.special[draw_index].tolist()
+            yield {
+                "draw_date": str(self.day_offsets[draw_index].astype("datetime64[D]")),
+                "game_type": self.metadata["game_type"],
+                "numbers": main_numbers + special_numbers,
+                "main_numbers": main_numbers,
+                "special_numbers": special_numbers,
+                "jackpot_amount": float(self.jackpots[draw_index]),
+                "winners_count": int(self.winners[draw_index])
+            }
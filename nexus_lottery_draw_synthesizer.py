@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY DRAW SYNTHESIZER
+Seeded Vectorized Generation Of Synthetic Draw Histories
+"""
+
+from datetime import date
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_game_spec import resolve_game_balls
+from nexus_lottery_draw_store import date_to_day_offset
+
+# Draws generated per block; bounds memory and keeps (seed, count) reproducible
+SYNTHESIS_BLOCK_SIZE = 65536
+
+
+def sample_without_replacement(rng, draw_count, number_range, ball_count):
+    """REAL: Sample draw_count sorted k-subsets of a range without replacement
+
+    Sparse games (k well below the range) draw k integers per row and redraw the
+    rows that collided; dense games take the k smallest of per-number random keys
+    via argpartition. Both are uniform over k-subsets.
+    """
+    range_size = number_range[1] - number_range[0] + 1
+
+    if ball_count * 4 <= range_size:
+        selected = rng.integers(0, range_size, (draw_count, ball_count), dtype=np.int16)
+        selected.sort(axis=1)
+        collided = np.flatnonzero((np.diff(selected, axis=1) == 0).any(axis=1))
+        while len(collided):
+            redrawn = rng.integers(0, range_size, (len(collided), ball_count), dtype=np.int16)
+            redrawn.sort(axis=1)
+            selected[collided] = redrawn
+            collided = collided[(np.diff(redrawn, axis=1) == 0).any(axis=1)]
+    else:
+        random_keys = rng.random((draw_count, range_size), dtype=np.float32)
+        if ball_count < range_size:
+            selected = np.argpartition(random_keys, ball_count - 1, axis=1)[:, :ball_count]
+        else:
+            selected = np.argsort(random_keys, axis=1)
+        selected.sort(axis=1)
+
+    return (selected + number_range[0]).astype(np.uint8)
+
+
+def iter_synthetic_blocks(game_config, count, seed=None, start_date=None):
+    """REAL: Yield (main, special, day_offsets, jackpots, winners) blocks of synthetic draws
+
+    Draws are three days apart, ending today unless start_date is given; pass both
+    seed and start_date for a fully reproducible history.
+    """
+    main_balls, special_balls = resolve_game_balls(game_config)
+    rng = np.random.default_rng(seed)
+
+    if start_date is None:
+        first_day = date_to_day_offset(date.today()) - count * 3
+    else:
+        first_day = date_to_day_offset(start_date)
+
+    for block_start in range(0, count, SYNTHESIS_BLOCK_SIZE):
+        block_count = min(SYNTHESIS_BLOCK_SIZE, count - block_start)
+
+        main_numbers = sample_without_replacement(rng, block_count, main_balls["range"], main_balls["count"])
+        if special_balls:
+            special_numbers = sample_without_replacement(rng, block_count, special_balls["range"], special_balls["count"])
+        else:
+            special_numbers = np.zeros((block_count, 0), dtype=np.uint8)
+
+        day_offsets = (first_day + 3 * np.arange(block_start, block_start + block_count)).astype(np.int32)
+        jackpots = rng.uniform(10000000, 500000000, block_count).astype(np.float32)  # $10M to $500M
+        winners = rng.integers(0, 4, block_count, dtype=np.uint8)
+
+        yield main_numbers, special_numbers, day_offsets, jackpots, winners
+
+
+def synthesize_draw_matrix(game_config, count, seed=None, start_date=None, game_type=None):
+    """REAL: Generate count synthetic draws straight into a draw matrix"""
+    main_balls, special_balls = resolve_game_balls(game_config)
+    main = np.empty((count, main_balls["count"]), dtype=np.uint8)
+    special = np.empty((count, special_balls["count"] if special_balls else 0), dtype=np.uint8)
+    day_offsets = np.empty(count, dtype=np.int32)
+
+    position = 0
+    for block in iter_synthetic_blocks(game_config, count, seed, start_date):
+        block_count = len(block[0])
+        main[position:position + block_count] = block[0]
+        special[position:position + block_count] = block[1]
+        day_offsets[position:position + block_count] = block[2]
+        position += block_count
+
+    return NexusDrawMatrix(
+        main,
+        main_balls["range"],
+        special_numbers=special,
+        draw_dates=day_offsets.astype("datetime64[D]"),
+        game_type=game_type
+    )
+
+
+def synthesize_draw_store(draw_store, game_config, count, seed=None, start_date=None):
+    """REAL: Append count synthetic draws to a draw store block by block"""
+    for main_numbers, special_numbers, day_offsets, jackpots, winners in iter_synthetic_blocks(
+            game_config, count, seed, start_date):
+        draw_store.append(main_numbers, special_numbers, day_offsets=day_offsets,
+                          jackpots=jackpots, winners=winners)
+    return draw_store
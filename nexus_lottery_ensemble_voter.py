@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY ENSEMBLE VOTER
+Weighted Multi-Agent Ticket Voting Over Whole Ticket Arrays
+"""
+
+import numpy as np
+
+from nexus_lottery_ticket_index import binomial_table, combination_ranks
+
+# Per-agent confidence blocks, each holding an "overall_confidence"
+AGENT_CONFIDENCE_KEYS = (
+    "pattern_confidence", "neural_confidence", "consciousness_confidence", "coordination_confidence"
+)
+
+
+def agent_overall_confidence(agent_result):
+    """REAL: An agent's overall confidence, whichever agent type produced it"""
+    for key in AGENT_CONFIDENCE_KEYS:
+        if isinstance(agent_result.get(key), dict) and "overall_confidence" in agent_result[key]:
+            return float(agent_result[key]["overall_confidence"])
+    return 0.0
+
+
+def agent_ticket_array(agent_result, ball_count):
+    """REAL: (tickets x ball_count) array of an agent's tickets, from candidate_tickets or predictions"""
+    tickets = agent_result.get("candidate_tickets")
+    if tickets is None:
+        tickets = [
+            prediction["numbers"] for prediction in agent_result.get("predictions", [])
+            if isinstance(prediction, dict) and len(prediction.get("numbers", [])) == ball_count
+        ]
+    return np.asarray(tickets, dtype=np.int64).reshape(-1, ball_count)
+
+
+class NexusEnsembleVoter:
+    """REAL: Confidence-weighted vote of every agent's tickets, scored per distinct ticket
+
+    Agent a votes with weight w_a = performance_weight x overall confidence
+    (normalized over the voting agents), spread evenly over its tickets, so an
+    agent's influence does not grow with its ticket count. Number votes give a
+    consensus probability per number; each distinct ticket is scored by the
+    consensus lift of its numbers times (1 + the weight of agents proposing it).
+    Everything is a bincount or a gather over the concatenated tickets, plus one
+    sort of the 64-bit ticket ranks to merge duplicates.
+    """
+
+    def __init__(self, game_spec, agent_weights):
+        self.game_spec = game_spec
+        self.agent_weights = dict(agent_weights)
+        self.binomials = binomial_table(game_spec.range_size, game_spec.ball_count)
+
+    def vote(self, agent_results):
+        """REAL: Distinct tickets with their votes, supporting agents, scores and confidences"""
+        game_spec = self.game_spec
+        agent_names, agent_confidences, agent_tickets = [], [], []
+        for agent_name, agent_result in agent_results.items():
+            if agent_name not in self.agent_weights or not isinstance(agent_result, dict) or "error" in agent_result:
+                continue
+            tickets = agent_ticket_array(agent_result, game_spec.ball_count)
+            if len(tickets):
+                agent_names.append(agent_name)
+                agent_confidences.append(agent_overall_confidence(agent_result))
+                agent_tickets.append(tickets)
+
+        agent_confidences = np.asarray(agent_confidences, dtype=np.float64)
+        raw_weights = np.asarray([self.agent_weights[name] for name in agent_names], dtype=np.float64)
+        raw_weights = raw_weights * np.maximum(agent_confidences, 0.0)
+        if raw_weights.sum() <= 0:
+            raw_weights = np.ones(len(agent_names))
+        weights = raw_weights / max(raw_weights.sum(), 1e-12)
+
+        vote = {
+            "agents": agent_names,
+            "agent_weights": dict(zip(agent_names, weights.tolist())),
+            "agent_confidences": dict(zip(agent_names, agent_confidences.tolist())),
+            "total_tickets": int(sum(len(tickets) for tickets in agent_tickets)),
+            "number_probabilities": np.full(game_spec.range_size, 1.0 / game_spec.range_size),
+            "tickets": np.zeros((0, game_spec.ball_count), dtype=np.int64),
+            "ranks": np.zeros(0, dtype=np.int64),
+            "ticket_votes": np.zeros(0),
+            "support_masks": np.zeros(0, dtype=np.int64),
+            "agreement": np.zeros(0),
+            "consensus_lift": np.zeros(0),
+            "scores": np.zeros(0),
+            "ticket_confidences": np.zeros(0)
+        }
+        if not agent_names:
+            return vote
+
+        offsets = np.sort(np.concatenate(agent_tickets), axis=1) - game_spec.number_range[0]
+        if offsets.min() < 0 or offsets.max() >= game_spec.range_size:
+            raise ValueError(f"Ticket numbers outside {game_spec.number_range}")
+        ticket_agents = np.repeat(np.arange(len(agent_names)), [len(tickets) for tickets in agent_tickets])
+        ticket_votes = (weights / [len(tickets) for tickets in agent_tickets])[ticket_agents]
+
+        # Consensus probability of every number from the weighted ticket votes
+        number_votes = np.bincount(offsets.ravel(), weights=np.repeat(ticket_votes, game_spec.ball_count),
+                                   minlength=game_spec.range_size)
+        vote["number_probabilities"] = number_votes / number_votes.sum()
+
+        # Merge identical tickets proposed by one or several agents
+        ranks = combination_ranks(offsets, self.binomials)
+        unique_ranks, first_rows, inverse = np.unique(ranks, return_index=True, return_inverse=True)
+        support_masks = np.zeros(len(unique_ranks), dtype=np.int64)
+        np.bitwise_or.at(support_masks, inverse, np.left_shift(1, ticket_agents))
+        supporting = (support_masks[:, None] >> np.arange(len(agent_names))) & 1 == 1
+
+        agreement = supporting @ weights
+        support_confidence = (supporting @ (weights * agent_confidences)) / np.maximum(agreement, 1e-12)
+        unique_offsets = offsets[first_rows]
+        consensus_lift = vote["number_probabilities"][unique_offsets].mean(axis=1) * game_spec.range_size
+
+        vote.update({
+            "tickets": unique_offsets + game_spec.number_range[0],
+            "ranks": unique_ranks,
+            "ticket_votes": np.bincount(inverse, weights=ticket_votes, minlength=len(unique_ranks)),
+            "support_masks": support_masks,
+            "agreement": agreement,
+            "consensus_lift": consensus_lift,
+            "scores": consensus_lift * (1.0 + agreement),
+            "ticket_confidences": np.minimum(0.85, support_confidence * (0.75 + 0.25 * agreement))
+        })
+        return vote
+
+    @staticmethod
+    def select(vote, count):
+        """REAL: Row indices of the count best-scoring tickets (ties broken by rank, so deterministic)"""
+        return np.lexsort((vote["ranks"], -vote["scores"]))[:max(0, count)]
+
+    @staticmethod
+    def supporting_agents(vote, row):
+        """REAL: Names of the agents that proposed one voted ticket"""
+        mask = int(vote["support_masks"][row])
+        return [agent_name for bit, agent_name in enumerate(vote["agents"]) if mask >> bit & 1]
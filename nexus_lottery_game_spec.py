@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY GAME SPEC
+Compiled Per-Game Ranges, Counts And Lookup Tables Shared By Every Analyzer
+"""
+
+import numpy as np
+
+from nexus_lottery_sequence_engine import NexusSequenceEngine
+from nexus_lottery_odds_tables import NexusOddsTable
+from nexus_lottery_ticket_sampler import subset_sum_table
+
+
+def resolve_game_balls(game_config):
+    """REAL: Resolve main ball and special ball definitions from a game config or spec"""
+    if isinstance(game_config, NexusGameSpec):
+        return game_config.main_balls, game_config.special_balls
+    if "white_balls" in game_config:
+        return game_config["white_balls"], game_config.get("power_ball")
+    elif "main_balls" in game_config:
+        return game_config["main_balls"], game_config.get("mega_ball")
+    else:
+        return game_config["numbers"], None
+
+
+class NexusGameSpec:
+    """REAL: One game's config parsed once into plain attributes and precomputed arrays
+
+    Accepted anywhere a lottery_games entry is, so hot paths read attributes
+    instead of probing the white_balls/main_balls/numbers keys on every call.
+    """
+
+    def __init__(self, main_balls, special_balls=None, game_type=None, sum_bucket_count=20):
+        self.game_type = game_type
+        self.main_balls = main_balls
+        self.special_balls = special_balls
+
+        # Main balls
+        self.number_range = (int(main_balls["range"][0]), int(main_balls["range"][1]))
+        self.range_size = self.number_range[1] - self.number_range[0] + 1
+        self.ball_count = int(main_balls["count"])
+        self.numbers = np.arange(self.number_range[0], self.number_range[1] + 1)
+
+        # Special balls (range None and count 0 for single-pool games)
+        self.special_range = tuple(special_balls["range"]) if special_balls else None
+        self.special_count = int(special_balls["count"]) if special_balls else 0
+        self.special_numbers = (np.arange(self.special_range[0], self.special_range[1] + 1)
+                                if special_balls else np.zeros(0, dtype=np.int64))
+
+        # Sequence detection tables; fibonacci_mask is indexed by range offset
+        self.sequence_engine = NexusSequenceEngine(self.number_range)
+        self.fibonacci_mask = self.sequence_engine.fibonacci_lookup[self.numbers]
+
+        # Reachable main-ball sums; sum analyses split observed sums into sum_bucket_count buckets
+        self.min_sum = int(self.numbers[:self.ball_count].sum())
+        self.max_sum = int(self.numbers[-self.ball_count:].sum())
+        self.sum_bucket_count = sum_bucket_count
+
+        # Number of distinct main-ball tickets with each sum 0..max_sum
+        self.sum_counts = subset_sum_table(self.numbers, self.ball_count, self.max_sum)[0, self.ball_count]
+
+        # Exact match-class odds; one ticket in jackpot_odds wins the jackpot
+        self.odds_table = NexusOddsTable.from_game_spec(self)
+        self.jackpot_odds = self.odds_table.class_total
+
+    @classmethod
+    def from_game_config(cls, game_config, game_type=None, **kwargs):
+        """REAL: Compile a lottery_games entry (specs are returned unchanged)"""
+        if isinstance(game_config, cls):
+            return game_config
+        main_balls, special_balls = resolve_game_balls(game_config)
+        return cls(main_balls, special_balls, game_type=game_type, **kwargs)
+
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY INCREMENTAL ANALYSIS STATE
+Per-Draw Frequency, Gap and Sum Tracking Without Full Recompute
+"""
+
+import numpy as np
+
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_game_spec import resolve_game_balls
+
+# Absent runs up to this many draws stretch a number's tracked gap (batch gap analysis)
+TRACKED_ABSENCE_LIMIT = 50
+
+
+def welford_add(counts, means, m2, index, values):
+    """REAL: Add one value to each indexed running mean/variance (index must be unique)"""
+    new_counts = counts[index] + 1
+    delta = values - means[index]
+    new_means = means[index] + delta / new_counts
+    m2[index] += delta * (values - new_means)
+    means[index] = new_means
+    counts[index] = new_counts
+
+
+def welford_remove(counts, means, m2, index, values):
+    """REAL: Remove one previously added value from each indexed running mean/variance"""
+    new_counts = counts[index] - 1
+    old_means = means[index]
+    new_means = np.zeros(len(index))
+    np.divide(old_means * (new_counts + 1) - values, new_counts, out=new_means, where=new_counts > 0)
+    m2[index] = np.where(new_counts > 0, m2[index] - (values - old_means) * (values - new_means), 0.0)
+    means[index] = new_means
+    counts[index] = new_counts
+
+
+def tracked_gap_values(gaps, absent_runs, is_first):
+    """REAL: Gap recorded for an appearance by the batch gap analysis, and whether it is recorded
+
+    A number's first appearance records only the absent run that follows it;
+    later appearances record their gap, stretched by a longer following run.
+    Runs are capped at TRACKED_ABSENCE_LIMIT draws.
+    """
+    is_first = np.asarray(is_first, dtype=bool)
+    tracked_absence = np.minimum(absent_runs, TRACKED_ABSENCE_LIMIT)
+    values = np.where(is_first, tracked_absence, np.maximum(gaps, tracked_absence))
+    return values, ~is_first | (absent_runs >= 1)
+
+
+class NexusIncrementalAnalysisState:
+    """REAL: Frequency/gap/sum state updated in O(ball count) per added or removed draw
+
+    gap_* are the plain distances between consecutive appearances of a number.
+    tracked_gap_* reproduce the gaps of the batch gap analysis, whose value for
+    an appearance depends on the absent run after it: entries are folded into
+    the running statistics once the number reappears, and each number's open
+    entry is evaluated at query time by tracked_gap_summary().
+    """
+
+    def __init__(self, number_range, ball_count, window_size=None, sum_bucket_count=20, capacity=1024):
+        self.number_range = (int(number_range[0]), int(number_range[1]))
+        self.range_size = self.number_range[1] - self.number_range[0] + 1
+        self.ball_count = int(ball_count)
+        self.window_size = window_size
+
+        # Frequency counters and last-seen absolute draw indices
+        self.frequencies = np.zeros(self.range_size, dtype=np.int64)
+        self.last_seen = np.full(self.range_size, -1, dtype=np.int64)
+        self._last_column = np.zeros(self.range_size, dtype=np.int64)
+
+        # Welford running gap mean/variance per number
+        self.gap_counts = np.zeros(self.range_size, dtype=np.int64)
+        self.gap_means = np.zeros(self.range_size, dtype=np.float64)
+        self.gap_m2 = np.zeros(self.range_size, dtype=np.float64)
+
+        # Closed batch-semantics gaps per number, and the gap of each open entry (0: first appearance)
+        self.tracked_gap_counts = np.zeros(self.range_size, dtype=np.int64)
+        self.tracked_gap_means = np.zeros(self.range_size, dtype=np.float64)
+        self.tracked_gap_m2 = np.zeros(self.range_size, dtype=np.float64)
+        self._open_gaps = np.zeros(self.range_size, dtype=np.int64)
+
+        # Sum histogram over every reachable sum of the game
+        self.min_sum = sum(range(self.number_range[0], self.number_range[0] + self.ball_count))
+        self.max_sum = sum(range(self.number_range[1] - self.ball_count + 1, self.number_range[1] + 1))
+        self.sum_bucket_size = max(1, -(-(self.max_sum - self.min_sum + 1) // sum_bucket_count))
+        self.sum_histogram = np.zeros(sum_bucket_count, dtype=np.int64)
+        self.sum_mean = 0.0
+        self.sum_m2 = 0.0
+
+        # Ring buffer of the draws in the window, plus the next appearance of each ball
+        capacity = max(1, capacity, window_size or 0)
+        self._draws = np.zeros((capacity, self.ball_count), dtype=np.int64)
+        self._next = np.full((capacity, self.ball_count), -1, dtype=np.int64)
+        self.first_index = 0  # Absolute index of the oldest draw in the window
+        self.next_index = 0   # Absolute index the next added draw receives
+
+    @classmethod
+    def from_game_config(cls, game_config, window_size=None, **kwargs):
+        main_balls, _ = resolve_game_balls(game_config)
+        return cls(main_balls["range"], main_balls["count"], window_size=window_size, **kwargs)
+
+    @classmethod
+    def from_draw_matrix(cls, draw_matrix, window_size=None, **kwargs):
+        """REAL: Seed the state from a draw matrix in one vectorized pass"""
+        main = draw_matrix.main if window_size is None else draw_matrix.main[-window_size:]
+        draw_count = len(main)
+
+        minimum_capacity = max(draw_count, window_size or 0, kwargs.pop("capacity", 1024))
+        capacity = 1
+        while capacity < minimum_capacity:
+            capacity *= 2
+
+        state = cls(draw_matrix.number_range, draw_matrix.ball_count, window_size=window_size,
+                    capacity=capacity, **kwargs)
+        if draw_count == 0:
+            return state
+
+        offsets = main.astype(np.int64) - state.number_range[0]
+        flat_offsets = offsets.ravel()
+        state._draws[:draw_count] = offsets
+        state.frequencies = np.bincount(flat_offsets, minlength=state.range_size)
+
+        # Appearances grouped by number; consecutive pairs of a group are the gaps
+        order = np.argsort(flat_offsets, kind="stable")
+        appearance_numbers = flat_offsets[order]
+        appearance_draws = order // state.ball_count
+        appearance_columns = order % state.ball_count
+
+        same_number = appearance_numbers[1:] == appearance_numbers[:-1]
+        gap_numbers = appearance_numbers[1:][same_number]
+        gaps = (appearance_draws[1:] - appearance_draws[:-1])[same_number]
+        state._next[appearance_draws[:-1][same_number], appearance_columns[:-1][same_number]] = \
+            appearance_draws[1:][same_number]
+
+        state.gap_counts = np.bincount(gap_numbers, minlength=state.range_size)
+        gap_totals = np.bincount(gap_numbers, weights=gaps, minlength=state.range_size)
+        np.divide(gap_totals, state.gap_counts, out=state.gap_means, where=state.gap_counts > 0)
+        state.gap_m2 = np.bincount(gap_numbers, weights=(gaps - state.gap_means[gap_numbers]) ** 2,
+                                   minlength=state.range_size)
+
+        is_first = np.insert(~same_number, 0, True)
+        is_last = np.append(~same_number, True)
+
+        # Batch-semantics gaps: every appearance but the last is closed by the next one
+        appearance_gaps = np.zeros(len(order), dtype=np.int64)
+        appearance_gaps[1:][same_number] = gaps
+        closed = ~is_last
+        absent_runs = np.append(appearance_draws[1:] - appearance_draws[:-1] - 1, 0)
+        tracked_values, tracked = tracked_gap_values(appearance_gaps[closed], absent_runs[closed], is_first[closed])
+        tracked_numbers = appearance_numbers[closed][tracked]
+        tracked_values = tracked_values[tracked]
+        state.tracked_gap_counts = np.bincount(tracked_numbers, minlength=state.range_size)
+        tracked_totals = np.bincount(tracked_numbers, weights=tracked_values, minlength=state.range_size)
+        np.divide(tracked_totals, state.tracked_gap_counts, out=state.tracked_gap_means,
+                  where=state.tracked_gap_counts > 0)
+        state.tracked_gap_m2 = np.bincount(
+            tracked_numbers, weights=(tracked_values - state.tracked_gap_means[tracked_numbers]) ** 2,
+            minlength=state.range_size
+        )
+        state._open_gaps[appearance_numbers[is_last]] = appearance_gaps[is_last]
+
+        state.last_seen[appearance_numbers[is_last]] = appearance_draws[is_last]
+        state._last_column[appearance_numbers[is_last]] = appearance_columns[is_last]
+
+        draw_sums = main.sum(axis=1, dtype=np.int64)
+        state.sum_histogram += np.bincount(state._sum_buckets(draw_sums), minlength=len(state.sum_histogram))
+        state.sum_mean = float(draw_sums.mean())
+        state.sum_m2 = float(((draw_sums - state.sum_mean) ** 2).sum())
+
+        state.next_index = draw_count
+        return state
+
+    def __len__(self):
+        return self.next_index - self.first_index
+
+    @property
+    def numbers(self):
+        return np.arange(self.number_range[0], self.number_range[1] + 1)
+
+    def _sum_buckets(self, draw_sums):
+        return np.minimum((draw_sums - self.min_sum) // self.sum_bucket_size, len(self.sum_histogram) - 1)
+
+    def _grow(self):
+        """REAL: Double the ring buffer, keeping absolute draw indices valid"""
+        old_capacity = len(self._draws)
+        new_capacity = old_capacity * 2
+        window = np.arange(self.first_index, self.next_index)
+
+        draws = np.zeros((new_capacity, self.ball_count), dtype=np.int64)
+        next_appearance = np.full((new_capacity, self.ball_count), -1, dtype=np.int64)
+        draws[window % new_capacity] = self._draws[window % old_capacity]
+        next_appearance[window % new_capacity] = self._next[window % old_capacity]
+
+        self._draws = draws
+        self._next = next_appearance
+
+    def add_draw(self, numbers):
+        """REAL: Append one draw, evicting the oldest draw once the window is full"""
+        offsets = np.asarray(numbers[:self.ball_count], dtype=np.int64) - self.number_range[0]
+        if (len(offsets) != self.ball_count or offsets.min() < 0 or offsets.max() >= self.range_size
+                or len(np.unique(offsets)) != self.ball_count):
+            raise ValueError(f"Draw {list(numbers)} does not match the {self.ball_count}-ball range {self.number_range}")
+
+        if self.window_size is not None and len(self) >= self.window_size:
+            self.remove_draw()
+        if len(self) >= len(self._draws):
+            self._grow()
+
+        draw_index = self.next_index
+        slot = draw_index % len(self._draws)
+        self._draws[slot] = offsets
+        self._next[slot] = -1
+
+        # Close the gap since each number's previous appearance
+        previous = self.last_seen[offsets]
+        seen = previous >= 0
+        if seen.any():
+            seen_offsets = offsets[seen]
+            self._next[previous[seen] % len(self._draws), self._last_column[seen_offsets]] = draw_index
+            gaps = draw_index - previous[seen]
+            welford_add(self.gap_counts, self.gap_means, self.gap_m2, seen_offsets, gaps)
+
+            # The reappearance closes each number's open tracked gap
+            open_gaps = self._open_gaps[seen_offsets]
+            tracked_values, tracked = tracked_gap_values(open_gaps, gaps - 1, open_gaps == 0)
+            welford_add(self.tracked_gap_counts, self.tracked_gap_means, self.tracked_gap_m2,
+                        seen_offsets[tracked], tracked_values[tracked])
+            self._open_gaps[seen_offsets] = gaps
+
+        self._open_gaps[offsets[~seen]] = 0
+        self.last_seen[offsets] = draw_index
+        self._last_column[offsets] = np.arange(self.ball_count)
+        self.frequencies[offsets] += 1
+
+        draw_sum = int(offsets.sum()) + self.number_range[0] * self.ball_count
+        self.sum_histogram[self._sum_buckets(draw_sum)] += 1
+        sum_delta = draw_sum - self.sum_mean
+        self.sum_mean += sum_delta / (len(self) + 1)
+        self.sum_m2 += sum_delta * (draw_sum - self.sum_mean)
+
+        self.next_index += 1
+
+    def remove_draw(self):
+        """REAL: Drop the oldest draw in the window and return its numbers"""
+        if len(self) == 0:
+            raise IndexError("No draws to remove from the analysis state")
+
+        draw_index = self.first_index
+        slot = draw_index % len(self._draws)
+        offsets = self._draws[slot].copy()
+        next_appearance = self._next[slot]
+
+        # Gaps that started at this draw leave the window with it
+        has_next = next_appearance >= 0
+        if has_next.any():
+            gap_offsets = offsets[has_next]
+            next_draws = next_appearance[has_next]
+            gaps = next_draws - draw_index
+            welford_remove(self.gap_counts, self.gap_means, self.gap_m2, gap_offsets, gaps)
+
+            # This draw was each number's first appearance, so its tracked gap was the absent run
+            tracked_values, tracked = tracked_gap_values(gaps, gaps - 1, True)
+            welford_remove(self.tracked_gap_counts, self.tracked_gap_means, self.tracked_gap_m2,
+                           gap_offsets[tracked], tracked_values[tracked])
+
+            # The next appearance becomes the first: open ones reset, closed ones lose their gap
+            is_open = self.last_seen[gap_offsets] == next_draws
+            self._open_gaps[gap_offsets[is_open]] = 0
+
+            closed_offsets = gap_offsets[~is_open]
+            closed_draws = next_draws[~is_open]
+            if len(closed_offsets):
+                closed_slots = closed_draws % len(self._draws)
+                closed_columns = np.argmax(self._draws[closed_slots] == closed_offsets[:, None], axis=1)
+                absent_runs = self._next[closed_slots, closed_columns] - closed_draws - 1
+                old_values, _ = tracked_gap_values(gaps[~is_open], absent_runs, False)
+                welford_remove(self.tracked_gap_counts, self.tracked_gap_means, self.tracked_gap_m2,
+                               closed_offsets, old_values)
+                new_values, tracked = tracked_gap_values(gaps[~is_open], absent_runs, True)
+                welford_add(self.tracked_gap_counts, self.tracked_gap_means, self.tracked_gap_m2,
+                            closed_offsets[tracked], new_values[tracked])
+
+        # Numbers without a later appearance are no longer in the window
+        self.last_seen[offsets[~has_next]] = -1
+        self._open_gaps[offsets[~has_next]] = 0
+        self.frequencies[offsets] -= 1
+
+        draw_sum = int(offsets.sum()) + self.number_range[0] * self.ball_count
+        self.sum_histogram[self._sum_buckets(draw_sum)] -= 1
+        remaining = len(self) - 1
+        if remaining > 0:
+            old_sum_mean = self.sum_mean
+            self.sum_mean = (old_sum_mean * len(self) - draw_sum) / remaining
+            self.sum_m2 -= (draw_sum - old_sum_mean) * (draw_sum - self.sum_mean)
+        else:
+            self.sum_mean = 0.0
+            self.sum_m2 = 0.0
+
+        self.first_index += 1
+        return (offsets + self.number_range[0]).tolist()
+
+    def gap_variances(self):
+        """REAL: Sample variance of the gaps of every number (0 below two gaps)"""
+        variances = np.zeros(self.range_size)
+        np.divide(self.gap_m2, self.gap_counts - 1, out=variances, where=self.gap_counts > 1)
+        return variances
+
+    def tracked_gap_summary(self):
+        """REAL: Per-number count and mean of the batch-semantics gaps, plus their pooled sample variance"""
+        seen = self.last_seen >= 0
+        absent_runs = self.next_index - self.last_seen - 1
+        open_values, has_open = tracked_gap_values(self._open_gaps, absent_runs, self._open_gaps == 0)
+        open_values = np.where(seen & has_open, open_values, 0)
+        has_open = seen & has_open
+
+        counts = self.tracked_gap_counts + has_open
+        totals = self.tracked_gap_means * self.tracked_gap_counts + open_values
+        squares = self.tracked_gap_m2 + self.tracked_gap_counts * self.tracked_gap_means ** 2 + open_values ** 2
+        means = np.zeros(self.range_size)
+        np.divide(totals, counts, out=means, where=counts > 0)
+
+        total_count = int(counts.sum())
+        variance = 0.0
+        if total_count > 1:
+            variance = max(0.0, float((squares.sum() - totals.sum() ** 2 / total_count) / (total_count - 1)))
+        return counts, means, variance
+
+    def current_gaps(self):
+        """REAL: Draws since each number's last appearance (0 if unseen in the window)"""
+        return np.where(self.last_seen >= 0, self.next_index - self.last_seen, 0)
+
+    def to_draw_matrix(self):
+        """REAL: Materialize the draws currently in the window as a draw matrix"""
+        window = np.arange(self.first_index, self.next_index) % len(self._draws)
+        return NexusDrawMatrix(self._draws[window] + self.number_range[0], self.number_range)
+
+    def snapshot(self):
+        """REAL: O(range) copy of the running state"""
+        return {
+            "draw_count": len(self),
+            "first_index": self.first_index,
+            "next_index": self.next_index,
+            "frequencies": self.frequencies.copy(),
+            "last_seen": self.last_seen.copy(),
+            "gap_counts": self.gap_counts.copy(),
+            "gap_means": self.gap_means.copy(),
+            "gap_variances": self.gap_variances(),
+            "sum_histogram": self.sum_histogram.copy(),
+            "sum_bucket_edges": self.min_sum + self.sum_bucket_size * np.arange(len(self.sum_histogram) + 1),
+            "sum_mean": self.sum_mean,
+            "sum_variance": self.sum_m2 / (len(self) - 1) if len(self) > 1 else 0.0
+        }
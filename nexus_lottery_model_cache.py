@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY MODEL CACHE
+Trained Neural Scorer State On Disk, Keyed By Game, Network And Hyperparameters
+"""
+
+import os
+import json
+import hashlib
+import zipfile
+import tempfile
+
+import numpy as np
+
+MODEL_CACHE_FORMAT_VERSION = 1
+
+
+class NexusModelCache:
+    """REAL: Directory of uncompressed .npz files, one per (game, network, hyperparameters)
+
+    Each file holds the scorer's ridge statistics, heads, trained span and the
+    fingerprint of the draw history it was trained on. The scorer compares that
+    fingerprint against the current history itself, so a restored state is
+    reused as is (same draws), extended (appended draws) or refitted.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def model_key(self, game_type, model):
+        """REAL: File stem for a model - game, network type and a hash of its hyperparameters"""
+        hyperparameters = json.dumps(model.hyperparameters(), sort_keys=True)
+        digest = hashlib.sha256(hyperparameters.encode("utf-8")).hexdigest()[:16]
+        return f"{game_type}_{model.network_type.lower()}_{digest}"
+
+    def model_path(self, game_type, model):
+        return os.path.join(self.cache_dir, f"{self.model_key(game_type, model)}.npz")
+
+    def load(self, game_type, model):
+        """REAL: Restore a model's cached state; False when there is no usable entry"""
+        path = self.model_path(game_type, model)
+        if not os.path.exists(path):
+            return False
+
+        # A truncated or corrupt entry is a miss; the next save replaces it
+        try:
+            with np.load(path) as arrays:
+                if int(arrays["format_version"]) != MODEL_CACHE_FORMAT_VERSION:
+                    return False
+                model.load_state(arrays)
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            model.reset()
+            return False
+        return True
+
+    def save(self, game_type, model):
+        """REAL: Write a model's state, replacing the previous entry atomically
+
+        Each save writes its own temporary file, so concurrent writers for the
+        same entry never interleave; the last os.replace wins.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.model_path(game_type, model)
+
+        cache_file = tempfile.NamedTemporaryFile(dir=self.cache_dir, prefix=f"{self.model_key(game_type, model)}_",
+                                                 suffix=".tmp", delete=False)
+        try:
+            with cache_file:
+                np.savez(cache_file, format_version=np.asarray(MODEL_CACHE_FORMAT_VERSION), **model.state_arrays())
+            os.replace(cache_file.name, path)
+        except Exception:
+            if os.path.exists(cache_file.name):
+                os.remove(cache_file.name)
+            raise
+        return path
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY MONTE CARLO ENGINE
+Vectorized Simulation Of Future Draws Against A Ticket Set
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Draws per independently seeded block; fixed so results do not depend on the worker count
+SIMULATION_BLOCK_DRAWS = 1 << 18
+
+# Upper bound on (draws x max(tickets, numbers)) cells held per batch inside a block
+SIMULATION_BATCH_CELLS = 1 << 22
+
+
+def simulate_draw_offsets(rng, draw_count, range_size, ball_count):
+    """REAL: (draws x ball_count) zero-based offsets of uniformly random draws"""
+    keys = rng.random((draw_count, range_size), dtype=np.float32)
+    return np.argpartition(keys, ball_count - 1, axis=1)[:, :ball_count]
+
+
+def incidence_columns(offsets, range_size):
+    """REAL: (range x rows) float32 one-hot columns, so draws @ columns counts matches"""
+    offsets = np.asarray(offsets, dtype=np.int64)
+    columns = np.zeros((range_size, len(offsets)), dtype=np.float32)
+    columns[offsets.ravel(), np.repeat(np.arange(len(offsets)), offsets.shape[1])] = 1.0
+    return columns
+
+
+def simulate_outcome_block(seed_sequence, draw_count, main_columns, ball_count, special_columns=None,
+                           special_count=0, batch_cells=SIMULATION_BATCH_CELLS):
+    """REAL: Per-draw best (main, special) class of the whole set over draw_count simulated
+    draws from one RNG stream, as a (main matches x special matches) histogram
+
+    Per-ticket histograms are not tallied here: they are exact from the odds table.
+    """
+    rng = np.random.default_rng(seed_sequence)
+    range_size, ticket_count = main_columns.shape
+    special_size = special_columns.shape[0] if special_columns is not None else 0
+    class_count = (ball_count + 1) * (special_count + 1)
+
+    best_histogram = np.zeros(class_count, dtype=np.int64)
+    batch_size = max(1, min(draw_count, batch_cells // max(ticket_count, range_size, 1)))
+
+    for batch_start in range(0, draw_count, batch_size):
+        batch_count = min(batch_size, draw_count - batch_start)
+        draws = simulate_draw_offsets(rng, batch_count, range_size, ball_count)
+
+        # Incidence rows of the draws times ticket incidence columns = main matches per (draw, ticket)
+        draw_rows = np.zeros((batch_count, range_size), dtype=np.float32)
+        np.put_along_axis(draw_rows, draws, 1.0, axis=1)
+        classes = (draw_rows @ main_columns).astype(np.int64) * (special_count + 1)
+
+        if special_count:
+            special_draws = simulate_draw_offsets(rng, batch_count, special_size, special_count)
+            special_rows = np.zeros((batch_count, special_size), dtype=np.float32)
+            np.put_along_axis(special_rows, special_draws, 1.0, axis=1)
+            classes += (special_rows @ special_columns).astype(np.int64)
+
+        best_histogram += np.bincount(classes.max(axis=1), minlength=class_count)
+
+    return best_histogram.reshape(ball_count + 1, special_count + 1)
+
+
+class NexusMonteCarloEngine:
+    """REAL: Simulates future draws in seeded blocks and tallies the ticket set's best match class
+
+    Per-ticket and pooled class histograms come from the exact odds table; only
+    the best class of a multi-ticket set depends on how its tickets overlap and
+    is sampled. The draw count is split into SIMULATION_BLOCK_DRAWS blocks, each with its own
+    child of SeedSequence(seed).spawn, so the same seed gives the same tallies
+    with any number of workers. Within a block, draws are matched against all
+    tickets at once as an incidence-matrix product.
+    """
+
+    def __init__(self, game_spec, seed=None, max_workers=None, block_draws=SIMULATION_BLOCK_DRAWS):
+        self.game_spec = game_spec
+        self.seed_sequence = np.random.SeedSequence(seed)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.block_draws = block_draws
+
+    def ticket_columns(self, tickets, special_numbers=None):
+        """REAL: Main (and special) incidence columns of a ticket set"""
+        game_spec = self.game_spec
+        tickets = np.asarray(tickets, dtype=np.int64).reshape(-1, game_spec.ball_count)
+        main_columns = incidence_columns(tickets - game_spec.number_range[0], game_spec.range_size)
+
+        special_columns = None
+        if game_spec.special_count and special_numbers is not None:
+            special_numbers = np.asarray(special_numbers, dtype=np.int64).reshape(len(tickets), game_spec.special_count)
+            special_columns = incidence_columns(special_numbers - game_spec.special_range[0],
+                                                len(game_spec.special_numbers))
+        return main_columns, special_columns
+
+    def exact_outcomes(self, ticket_count, draw_count, with_special=False):
+        """REAL: Expected class counts from the exact odds table, without sampling
+
+        Every ticket has the same hypergeometric class distribution, so the
+        per-ticket and pooled histograms are exact for any set; the best-class
+        histogram is only exact for a single ticket and is omitted otherwise.
+        """
+        odds_table = self.game_spec.odds_table
+        class_probabilities = odds_table.class_probabilities if with_special \
+            else odds_table.main_probabilities[:, None]
+
+        ticket_histograms = np.broadcast_to(draw_count * class_probabilities,
+                                            (ticket_count,) + class_probabilities.shape)
+        main_histograms = ticket_histograms.sum(axis=2)
+        outcomes = {
+            "draws_simulated": draw_count,
+            "ticket_count": ticket_count,
+            "exact": True,
+            "ticket_class_histograms": ticket_histograms,
+            "ticket_match_histograms": main_histograms,
+            "set_match_histogram": main_histograms.sum(axis=0),
+            "mean_matches_per_ticket": np.full(ticket_count, odds_table.expected_main_matches)
+        }
+        if ticket_count == 1:
+            outcomes["set_best_class_histogram"] = ticket_histograms[0]
+            outcomes["set_best_match_histogram"] = main_histograms[0]
+        return outcomes
+
+    def simulate(self, tickets, draw_count, special_numbers=None):
+        """REAL: Match-class distribution of every ticket and of the whole set over draw_count draws
+
+        Classes are (main matches, special matches); special matches are only
+        tallied when special_numbers are given for a game with a special ball.
+        Per-ticket and pooled histograms are always the exact expected counts;
+        the set_best_* histograms are sampled unless the set is a single ticket,
+        in which case nothing is sampled and "exact" is True.
+        """
+        start_time = time.perf_counter()
+        main_columns, special_columns = self.ticket_columns(tickets, special_numbers)
+        special_count = self.game_spec.special_count if special_columns is not None else 0
+
+        ticket_count = main_columns.shape[1]
+        outcomes = self.exact_outcomes(ticket_count, draw_count, with_special=bool(special_count))
+
+        if ticket_count == 1:
+            outcomes.update({"blocks": 0, "workers": 0, "elapsed_seconds": time.perf_counter() - start_time})
+            return outcomes
+
+        block_sizes = [min(self.block_draws, draw_count - block_start)
+                       for block_start in range(0, draw_count, self.block_draws)]
+        block_args = [
+            (child_seed, block_size, main_columns, self.game_spec.ball_count, special_columns, special_count)
+            for child_seed, block_size in zip(self.seed_sequence.spawn(len(block_sizes)), block_sizes)
+        ]
+
+        worker_count = min(len(block_args), self.max_workers)
+        if worker_count > 1:
+            with ProcessPoolExecutor(max_workers=worker_count) as executor:
+                block_results = list(executor.map(simulate_outcome_block, *zip(*block_args)))
+        else:
+            block_results = [simulate_outcome_block(*args) for args in block_args]
+
+        best_histogram = sum(block_results, np.zeros((self.game_spec.ball_count + 1, special_count + 1),
+                                                     dtype=np.int64))
+        outcomes.update({
+            "exact": False,
+            "blocks": len(block_args),
+            "workers": worker_count,
+            "set_best_class_histogram": best_histogram,
+            "set_best_match_histogram": best_histogram.sum(axis=1),
+            "elapsed_seconds": time.perf_counter() - start_time
+        })
+        return outcomes
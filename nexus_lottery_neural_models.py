@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY NEURAL MODELS
+CPU-Only NumPy Convolutional, Attention And Stacking Next-Draw Scorers
+
+Latency budget: each network fits and scores in at most NEURAL_LATENCY_BUDGET_MS
+on one CPU core. The budget holds for any history length because training only
+uses the last max_training_draws windows; the cost is O(windows x range x
+kernel_size) for the convolution and O(windows x context x embedding) for
+attention. Feature buffers are allocated once per model and reused. Heads are
+kept as ridge sufficient statistics, so appended draws train only their new
+windows and an unchanged history trains nothing.
+"""
+
+import time
+import hashlib
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+NEURAL_LATENCY_BUDGET_MS = 250
+
+
+def ridge_solve(features, targets, ridge=1.0):
+    """REAL: Closed-form ridge regression weights for (samples x features) inputs"""
+    gram = features.T @ features
+    gram[np.diag_indices_from(gram)] += ridge
+    return np.linalg.solve(gram, features.T @ targets)
+
+
+def normalize_scores(scores):
+    """REAL: Clip negative scores and normalize each row to a probability vector"""
+    scores = np.maximum(scores, 0.0)
+    totals = scores.sum(axis=-1, keepdims=True)
+    uniform = np.full(scores.shape, 1.0 / scores.shape[-1])
+    return np.divide(scores, totals, out=uniform, where=totals > 0)
+
+
+def holdout_lift(probabilities, targets):
+    """REAL: Mean probability given to the numbers actually drawn, relative to uniform (1.0)"""
+    if not len(targets):
+        return 1.0
+    drawn_probability = (probabilities * targets).sum() / max(1, targets.sum())
+    return float(drawn_probability * probabilities.shape[-1])
+
+
+def incidence_rows(main, first_number, range_size):
+    """REAL: Float32 one-hot (draws x range) rows for a slice of the draw matrix"""
+    main = np.asarray(main)
+    incidence = np.zeros((len(main), range_size), dtype=np.float32)
+    rows = np.repeat(np.arange(len(main)), main.shape[1])
+    incidence[rows, main.ravel().astype(np.int64) - first_number] = 1.0
+    return incidence
+
+
+def history_fingerprint(main, draw_count):
+    """REAL: Hash of the first draw_count draws, independent of the matrix dtype"""
+    prefix = np.ascontiguousarray(main[:draw_count], dtype=np.int16)
+    digest = hashlib.sha256()
+    digest.update(np.asarray(prefix.shape, dtype=np.int64).tobytes())
+    digest.update(prefix.tobytes())
+    return digest.hexdigest()
+
+
+class NexusNeuralScorer:
+    """REAL: Shared training loop - windowed features, ridge head, holdout scoring
+
+    Subclasses turn incidence rows into per-window features; the window ending
+    at draw t is trained to predict the incidence row of draw t + 1. The head is
+    kept as ridge sufficient statistics (gram = X'X, moment = X'y) over the
+    training span, so appended draws only add their new windows and subtract the
+    windows that fell out of the last max_training_draws.
+    """
+
+    network_type = None
+
+    def __init__(self, range_size, first_number=1, context_length=32, max_training_draws=2048,
+                 holdout_draws=50, ridge=1.0):
+        self.range_size = range_size
+        self.first_number = first_number
+        self.context_length = context_length
+        self.max_training_draws = max_training_draws
+        self.holdout_draws = holdout_draws
+        self.ridge = ridge
+        self.window_capacity = max_training_draws + 1
+        self.reset()
+
+    def reset(self):
+        """REAL: Forget the trained state"""
+        self.gram = None
+        self.moment = None
+        self.head = None
+        self.holdout_head = None
+        self.trained_span = (0, 0)  # window-end draws [start, end) in the statistics
+        self.holdout_count = 0
+        self.draw_count = 0
+        self.fingerprint = None
+        self.training_mode = None
+
+    def hyperparameters(self):
+        """REAL: Everything that changes the trained weights, used as the cache key"""
+        return {
+            "range_size": self.range_size,
+            "first_number": self.first_number,
+            "context_length": self.context_length,
+            "max_training_draws": self.max_training_draws,
+            "holdout_draws": self.holdout_draws,
+            "ridge": self.ridge
+        }
+
+    def window_features(self, incidence):
+        raise NotImplementedError
+
+    def feature_moments(self, features, targets):
+        raise NotImplementedError
+
+    def predict_head(self, features, head):
+        return features @ head.astype(np.float32)
+
+    def solve_head(self, gram, moment):
+        gram = gram.copy()
+        gram[np.diag_indices_from(gram)] += self.ridge
+        return np.linalg.solve(gram, moment)
+
+    def _window_block(self, main, start, end):
+        # Features of the windows ending at draws start .. end - 1 and the incidence rows of the draws after them
+        incidence = incidence_rows(main[start - self.context_length + 1:end + 1], self.first_number, self.range_size)
+        return self.window_features(incidence[:-1]), incidence[self.context_length:]
+
+    def _accumulate(self, main, start, end, sign):
+        for block_start in range(start, end, self.window_capacity):
+            block_end = min(end, block_start + self.window_capacity)
+            gram, moment = self.feature_moments(*self._window_block(main, block_start, block_end))
+            if self.gram is None:
+                self.gram, self.moment = sign * gram, sign * moment
+            else:
+                self.gram += sign * gram
+                self.moment += sign * moment
+
+    def matches_history(self, main):
+        """REAL: True when the trained state covers exactly these draws"""
+        return (self.fingerprint is not None and self.draw_count == len(main)
+                and history_fingerprint(main, self.draw_count) == self.fingerprint)
+
+    def update(self, main):
+        """REAL: Bring the head up to date with main; returns the windows trained on this call
+
+        The same history trains nothing (warm), appended draws train only the new
+        windows (incremental) and any other history refits from scratch (cold).
+        """
+        draw_count = len(main)
+        if (self.fingerprint is not None and draw_count >= self.draw_count
+                and history_fingerprint(main, self.draw_count) == self.fingerprint):
+            if draw_count == self.draw_count:
+                self.training_mode = "warm"
+                return 0
+            self.training_mode = "incremental"
+        else:
+            self.reset()
+            self.training_mode = "cold"
+
+        end = max(0, draw_count - 1)
+        start = min(end, max(self.context_length - 1, end - self.max_training_draws))
+        old_start, old_end = self.trained_span
+
+        incremental_windows = (end - old_end) + (start - old_start)
+        if (self.training_mode == "incremental" and old_start <= start <= old_end <= end
+                and incremental_windows < end - start):
+            # Add the windows of the appended draws, drop those older than the training span
+            trained_windows = end - old_end
+            self._accumulate(main, old_end, end, 1.0)
+            self._accumulate(main, old_start, start, -1.0)
+        else:
+            trained_windows = end - start
+            self.gram = self.moment = None
+            self._accumulate(main, start, end, 1.0)
+
+        self.trained_span = (start, end)
+        self.draw_count = draw_count
+        self.fingerprint = history_fingerprint(main, draw_count)
+        self.head = self.holdout_head = None
+        self.holdout_count = 0
+
+        if self.gram is not None:
+            self.head = self.solve_head(self.gram, self.moment)
+            # Holdout head: the same statistics without the last holdout windows
+            self.holdout_count = min(self.holdout_draws, (end - start) // 5)
+            if self.holdout_count:
+                gram, moment = self.feature_moments(*self._window_block(main, end - self.holdout_count, end))
+                self.holdout_head = self.solve_head(self.gram - gram, self.moment - moment)
+
+        return trained_windows
+
+    def score(self, main):
+        """REAL: Next-draw probabilities plus the holdout draws scored by the holdout head"""
+        result = {
+            "network_type": self.network_type,
+            "training_windows": self.trained_span[1] - self.trained_span[0],
+            "number_probabilities": np.full(self.range_size, 1.0 / self.range_size),
+            "holdout_probabilities": np.zeros((0, self.range_size)),
+            "holdout_targets": np.zeros((0, self.range_size)),
+            "holdout_lift": 1.0
+        }
+
+        if self.head is not None:
+            next_incidence = incidence_rows(main[len(main) - self.context_length:], self.first_number, self.range_size)
+            result["number_probabilities"] = normalize_scores(
+                self.predict_head(self.window_features(next_incidence), self.head))[0]
+
+        if self.holdout_head is not None:
+            end = self.trained_span[1]
+            features, targets = self._window_block(main, end - self.holdout_count, end)
+            result["holdout_probabilities"] = normalize_scores(self.predict_head(features, self.holdout_head))
+            result["holdout_targets"] = targets
+            result["holdout_lift"] = holdout_lift(result["holdout_probabilities"], targets)
+
+        return result
+
+    def fit_predict(self, main):
+        """REAL: Train on the recent history (only what changed) and score the next draw
+
+        main is the (draws x balls) matrix. Returns next-draw probabilities,
+        holdout probabilities/targets (the last holdout_draws draws, scored by a
+        head fitted only on earlier windows), the training mode and the elapsed
+        time against the latency budget.
+        """
+        start_time = time.perf_counter()
+        trained_windows = self.update(main)
+        result = self.score(main)
+        result["training_mode"] = self.training_mode
+        result["trained_windows"] = trained_windows
+        result["elapsed_ms"] = (time.perf_counter() - start_time) * 1000
+        result["within_latency_budget"] = result["elapsed_ms"] <= NEURAL_LATENCY_BUDGET_MS
+        return result
+
+    def state_arrays(self):
+        """REAL: Trained state as plain arrays for np.savez"""
+        empty = np.zeros(0)
+        return {
+            "gram": self.gram if self.gram is not None else empty,
+            "moment": self.moment if self.moment is not None else empty,
+            "head": self.head if self.head is not None else empty,
+            "holdout_head": self.holdout_head if self.holdout_head is not None else empty,
+            "trained_span": np.asarray(self.trained_span, dtype=np.int64),
+            "holdout_count": np.asarray(self.holdout_count, dtype=np.int64),
+            "draw_count": np.asarray(self.draw_count, dtype=np.int64),
+            "fingerprint": np.asarray(self.fingerprint or "")
+        }
+
+    def load_state(self, arrays):
+        """REAL: Restore a state written by state_arrays"""
+        def optional(name):
+            values = np.array(arrays[name], dtype=np.float64)
+            return values if values.size else None
+
+        self.gram = optional("gram")
+        self.moment = optional("moment")
+        self.head = optional("head")
+        self.holdout_head = optional("holdout_head")
+        self.trained_span = tuple(int(value) for value in arrays["trained_span"])
+        self.holdout_count = int(arrays["holdout_count"])
+        self.draw_count = int(arrays["draw_count"])
+        self.fingerprint = str(arrays["fingerprint"]) or None
+
+
+class NexusConvolutionalScorer(NexusNeuralScorer):
+    """REAL: 1-D convolution over each number's appearance series with a shared ridge head
+
+    A fixed causal filter bank (recency decays, moving averages, a trend
+    detector) runs along time for every number; ReLU features feed one linear
+    head shared by all numbers.
+    """
+
+    network_type = "CNN_PATTERN_DETECTOR"
+
+    def __init__(self, range_size, **kwargs):
+        super().__init__(range_size, **kwargs)
+        self.kernels = self.build_kernels(self.context_length)
+        # Preallocated (windows, numbers, filters) feature buffer
+        self._features = np.empty((self.window_capacity, range_size, self.kernels.shape[1] + 1),
+                                  dtype=np.float32)
+
+    @staticmethod
+    def build_kernels(kernel_size):
+        """REAL: (kernel_size, filters) causal filter bank; the last tap is the newest draw"""
+        ages = np.arange(kernel_size)[::-1]
+        filters = []
+        for half_life in (2, 4, 8, 16):
+            decay = 0.5 ** (ages / half_life)
+            filters.append(decay / decay.sum())
+        for span in (4, 16, kernel_size):
+            filters.append((ages < span) / span)
+        trend = np.where(ages < 8, 1.0, np.where(ages < 16, -1.0, 0.0)) / 8
+        filters.extend([trend, -trend])
+        return np.stack(filters, axis=1).astype(np.float32)
+
+    def window_features(self, incidence):
+        window_count = len(incidence) - self.context_length + 1
+        features = self._features[:window_count]
+        # (windows, numbers, taps) view of every window, contracted with the filter bank
+        windows = sliding_window_view(incidence, self.context_length, axis=0)
+        np.matmul(windows, self.kernels, out=features[:, :, :-1])
+        np.maximum(features[:, :, :-1], 0.0, out=features[:, :, :-1])
+        features[:, :, -1] = 1.0  # bias
+        return features
+
+    def feature_moments(self, features, targets):
+        # Every (window, number) pair is one sample of the shared head
+        flat_features = features.reshape(-1, features.shape[-1]).astype(np.float64)
+        return flat_features.T @ flat_features, flat_features.T @ targets.reshape(-1).astype(np.float64)
+
+
+class NexusAttentionScorer(NexusNeuralScorer):
+    """REAL: Single-head scaled dot-product attention over the recent draws
+
+    Draws are embedded by a fixed seeded projection of their incidence rows plus
+    sinusoidal recency encodings. The newest draw attends over the context; the
+    attended context and the newest embedding feed a multi-output ridge head
+    that scores every number.
+    """
+
+    network_type = "TRANSFORMER_ANALYZER"
+
+    def __init__(self, range_size, embedding_size=16, seed=0, **kwargs):
+        super().__init__(range_size, **kwargs)
+        self.embedding_size = embedding_size
+        rng = np.random.default_rng(seed)
+        self.projection = (rng.standard_normal((range_size, embedding_size)) / np.sqrt(embedding_size)).astype(np.float32)
+
+        positions = np.arange(self.context_length)[::-1, None]
+        frequencies = 1.0 / 10000 ** (np.arange(0, embedding_size, 2) / embedding_size)
+        encoding = np.zeros((self.context_length, embedding_size))
+        encoding[:, 0::2] = np.sin(positions * frequencies)
+        encoding[:, 1::2] = np.cos(positions * frequencies)
+        self.position_encoding = encoding.astype(np.float32)
+
+        # Preallocated (windows, context, embedding) keys and (windows, 2 x embedding + 1) features
+        self.seed = seed
+        self._keys = np.empty((self.window_capacity, self.context_length, embedding_size), dtype=np.float32)
+        self._features = np.empty((self.window_capacity, 2 * embedding_size + 1), dtype=np.float32)
+
+    def window_features(self, incidence):
+        window_count = len(incidence) - self.context_length + 1
+        embeddings = incidence @ self.projection
+
+        keys = self._keys[:window_count]
+        keys[...] = sliding_window_view(embeddings, self.context_length, axis=0).transpose(0, 2, 1)
+        keys += self.position_encoding
+
+        queries = keys[:, -1, :]
+        attention = np.einsum("wsd,wd->ws", keys, queries) / np.sqrt(self.embedding_size)
+        attention -= attention.max(axis=1, keepdims=True)
+        np.exp(attention, out=attention)
+        attention /= attention.sum(axis=1, keepdims=True)
+
+        features = self._features[:window_count]
+        features[:, :self.embedding_size] = np.einsum("ws,wsd->wd", attention, keys)
+        features[:, self.embedding_size:-1] = queries
+        features[:, -1] = 1.0  # bias
+        return features
+
+    def hyperparameters(self):
+        hyperparameters = super().hyperparameters()
+        hyperparameters.update({"embedding_size": self.embedding_size, "seed": self.seed})
+        return hyperparameters
+
+    def feature_moments(self, features, targets):
+        features = features.astype(np.float64)
+        return features.T @ features, features.T @ targets.astype(np.float64)
+
+
+def fit_stacking_weights(holdout_probabilities, holdout_targets, ridge=1e-3):
+    """REAL: Non-negative, normalized stacking weights from the models' holdout probabilities"""
+    model_count = len(holdout_probabilities)
+    if not model_count or not len(holdout_targets):
+        return np.full(model_count, 1.0 / max(1, model_count))
+
+    stacked = np.stack([probabilities.reshape(-1) for probabilities in holdout_probabilities], axis=1)
+    weights = np.maximum(ridge_solve(stacked, holdout_targets.reshape(-1).astype(np.float64), ridge), 0.0)
+    if weights.sum() <= 0:
+        return np.full(model_count, 1.0 / model_count)
+    return weights / weights.sum()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY ODDS TABLES
+Exact Hypergeometric Match-Class Probabilities Per Game
+"""
+
+from math import comb
+
+import numpy as np
+
+# Marks the top prize class, which pays the current jackpot
+JACKPOT = "jackpot"
+
+# Published fixed prizes per (main matches, special matches); unlisted classes pay nothing
+GAME_PRIZE_TABLES = {
+    "powerball": {
+        (5, 1): JACKPOT, (5, 0): 1000000, (4, 1): 50000, (4, 0): 100,
+        (3, 1): 100, (3, 0): 7, (2, 1): 7, (1, 1): 4, (0, 1): 4
+    },
+    "mega_millions": {
+        (5, 1): JACKPOT, (5, 0): 1000000, (4, 1): 10000, (4, 0): 500,
+        (3, 1): 200, (3, 0): 10, (2, 1): 10, (1, 1): 4, (0, 1): 2
+    },
+    "state_lotto": {
+        (6, 0): JACKPOT, (5, 0): 2000, (4, 0): 50, (3, 0): 5
+    }
+}
+
+
+def hypergeometric_ways(population, drawn, picked):
+    """REAL: Ways a draw of `drawn` from `population` shares m = 0..picked numbers with a `picked`-number ticket"""
+    return np.array([
+        comb(picked, matches) * comb(population - picked, drawn - matches)
+        for matches in range(picked + 1)
+    ], dtype=np.int64)
+
+
+class NexusOddsTable:
+    """REAL: Exact probability of every (main matches, special matches) class for one ticket
+
+    Main and special balls come from independent pools, so each class count is
+    the product of two hypergeometric counts; every lookup afterwards is O(1).
+    """
+
+    def __init__(self, range_size, ball_count, special_size=0, special_count=0):
+        self.range_size = range_size
+        self.ball_count = ball_count
+        self.special_size = special_size
+        self.special_count = special_count
+
+        self.main_ways = hypergeometric_ways(range_size, ball_count, ball_count)
+        self.main_total = comb(range_size, ball_count)
+        self.special_ways = hypergeometric_ways(special_size, special_count, special_count)
+        self.special_total = comb(special_size, special_count)
+
+        self.main_probabilities = self.main_ways / self.main_total
+        self.special_probabilities = self.special_ways / self.special_total
+        self.class_ways = np.outer(self.main_ways, self.special_ways)
+        self.class_total = self.main_total * self.special_total
+        self.class_probabilities = self.class_ways / self.class_total
+
+        # P(at least m main matches) and the mean main matches of a random ticket
+        self.main_at_least = self.main_probabilities[::-1].cumsum()[::-1]
+        self.expected_main_matches = float(self.main_probabilities @ np.arange(ball_count + 1))
+
+    @classmethod
+    def from_game_spec(cls, game_spec):
+        return cls(game_spec.range_size, game_spec.ball_count,
+                   len(game_spec.special_numbers), game_spec.special_count)
+
+    def probability(self, main_matches, special_matches=0):
+        """REAL: Exact probability of one match class"""
+        return float(self.class_probabilities[main_matches, special_matches])
+
+    def odds(self, main_matches, special_matches=0):
+        """REAL: The class's "1 in N" odds (inf for impossible classes)"""
+        ways = int(self.class_ways[main_matches, special_matches])
+        return self.class_total / ways if ways else float("inf")
+
+    def expected_class_counts(self, draw_count, ticket_count=1):
+        """REAL: Expected (tickets x main x special) class counts over draw_count random draws"""
+        return np.broadcast_to(draw_count * self.class_probabilities,
+                               (ticket_count,) + self.class_probabilities.shape)
+
+    def odds_rows(self):
+        """REAL: Every possible class with its probability and odds, best class first"""
+        return [
+            {
+                "main_matches": main_matches,
+                "special_matches": special_matches,
+                "probability": self.probability(main_matches, special_matches),
+                "odds_one_in": self.odds(main_matches, special_matches)
+            }
+            for main_matches in range(self.ball_count, -1, -1)
+            for special_matches in range(self.special_count, -1, -1)
+        ]
+
+
+def prize_matrix(game_type, ball_count, special_count, jackpot):
+    """REAL: (main matches x special matches) prize of one ticket; jackpot-only for unknown games"""
+    prizes = np.zeros((ball_count + 1, special_count + 1))
+    prize_table = GAME_PRIZE_TABLES.get(game_type, {(ball_count, special_count): JACKPOT})
+    for (main_matches, special_matches), prize in prize_table.items():
+        if main_matches <= ball_count and special_matches <= special_count:
+            prizes[main_matches, special_matches] = jackpot if prize == JACKPOT else prize
+    return prizes
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY PREDICTION QUERY
+Streaming, Index-Backed Reads Of Stored Predictions Into NumPy Arrays
+"""
+
+import sqlite3
+
+import numpy as np
+
+# Rows fetched from the cursor (and returned) per page
+PREDICTION_PAGE_SIZE = 65536
+
+PREDICTION_COLUMNS = "id, algorithm_name, prediction_timestamp, confidence_score, predicted_numbers"
+
+
+def prediction_page_arrays(rows):
+    """REAL: Column arrays of fetched prediction rows; numbers is a (rows x balls) uint8 matrix"""
+    if not rows:
+        return {
+            "ids": np.zeros(0, dtype=np.int64),
+            "algorithm_names": np.zeros(0, dtype=str),
+            "timestamps": np.zeros(0, dtype=np.float64),
+            "confidence_scores": np.zeros(0, dtype=np.float64),
+            "numbers": np.zeros((0, 0), dtype=np.uint8)
+        }
+
+    ids, algorithm_names, timestamps, confidence_scores, blobs = zip(*rows)
+    ball_count = len(blobs[0])
+    if all(len(blob) == ball_count for blob in blobs):
+        numbers = np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(blobs), ball_count)
+    else:
+        # Mixed ticket sizes (only possible across games): pad short rows with zeros
+        numbers = np.zeros((len(blobs), max(len(blob) for blob in blobs)), dtype=np.uint8)
+        for row, blob in enumerate(blobs):
+            numbers[row, :len(blob)] = np.frombuffer(blob, dtype=np.uint8)
+
+    return {
+        "ids": np.fromiter(ids, dtype=np.int64, count=len(ids)),
+        "algorithm_names": np.asarray(algorithm_names, dtype=str),
+        "timestamps": np.fromiter(timestamps, dtype=np.float64, count=len(timestamps)),
+        "confidence_scores": np.asarray(confidence_scores, dtype=np.float64),
+        "numbers": numbers
+    }
+
+
+def concatenate_prediction_pages(pages):
+    """REAL: One set of column arrays from consecutive pages"""
+    pages = [page for page in pages if len(page["ids"])]
+    if not pages:
+        return prediction_page_arrays([])
+    if len(pages) == 1:
+        return pages[0]
+
+    width = max(page["numbers"].shape[1] for page in pages)
+    numbers = [
+        page["numbers"] if page["numbers"].shape[1] == width
+        else np.pad(page["numbers"], ((0, 0), (0, width - page["numbers"].shape[1])))
+        for page in pages
+    ]
+    arrays = {key: np.concatenate([page[key] for page in pages]) for key in pages[0] if key != "numbers"}
+    arrays["numbers"] = np.concatenate(numbers)
+    return arrays
+
+
+class NexusPredictionQuery:
+    """REAL: Read path over nexus_lottery_algorithms.db
+
+    Game/time-range scans are answered from the covering
+    (game_type, prediction_timestamp, algorithm_name, confidence_score,
+    predicted_numbers) index without touching the table, and top-N by
+    confidence is a bounded (N-row) sort over the same index range. A separate
+    confidence index would make the sort free but doubles the cost of every
+    insert. Results stream from the cursor one page at a time, so memory is
+    bounded by the page size rather than the history.
+
+    The connection only reads: the table and its index are created by
+    NexusPredictionStore, which must have written (and flushed) the schema first.
+    """
+
+    def __init__(self, db_path, page_size=PREDICTION_PAGE_SIZE):
+        self.db_path = db_path
+        self.page_size = page_size
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+
+    @staticmethod
+    def filter_clause(game_type, start_time=None, end_time=None, algorithm_name=None):
+        """REAL: WHERE clause and parameters for a game, [start_time, end_time) and algorithm"""
+        conditions = ["game_type = ?"]
+        parameters = [game_type]
+        if start_time is not None:
+            conditions.append("prediction_timestamp >= ?")
+            parameters.append(start_time)
+        if end_time is not None:
+            conditions.append("prediction_timestamp < ?")
+            parameters.append(end_time)
+        if algorithm_name is not None:
+            conditions.append("algorithm_name = ?")
+            parameters.append(algorithm_name)
+        return " AND ".join(conditions), parameters
+
+    def iter_pages(self, statement, parameters, page_size=None):
+        """REAL: Page arrays streamed from one cursor, page_size rows at a time"""
+        page_size = page_size or self.page_size
+        cursor = self.connection.execute(statement, parameters)
+        try:
+            while True:
+                rows = cursor.fetchmany(page_size)
+                if not rows:
+                    break
+                yield prediction_page_arrays(rows)
+        finally:
+            cursor.close()
+
+    def iter_predictions(self, game_type, start_time=None, end_time=None, algorithm_name=None, page_size=None):
+        """REAL: Predictions of a game in time order (insertion order within a timestamp), as page arrays"""
+        where, parameters = self.filter_clause(game_type, start_time, end_time, algorithm_name)
+        return self.iter_pages(f'''
+            SELECT {PREDICTION_COLUMNS} FROM algorithm_predictions
+            WHERE {where}
+            ORDER BY prediction_timestamp, id
+        ''', parameters, page_size)
+
+    def predictions(self, game_type, start_time=None, end_time=None, algorithm_name=None):
+        """REAL: All matching predictions as one set of arrays"""
+        return concatenate_prediction_pages(self.iter_predictions(game_type, start_time, end_time, algorithm_name))
+
+    def top_predictions(self, game_type, count, start_time=None, end_time=None, algorithm_name=None):
+        """REAL: The count most confident predictions of a game, most confident first"""
+        where, parameters = self.filter_clause(game_type, start_time, end_time, algorithm_name)
+        return concatenate_prediction_pages(self.iter_pages(f'''
+            SELECT {PREDICTION_COLUMNS} FROM algorithm_predictions
+            WHERE {where}
+            ORDER BY confidence_score DESC
+            LIMIT ?
+        ''', parameters + [int(count)]))
+
+    def count(self, game_type, start_time=None, end_time=None, algorithm_name=None):
+        """REAL: Number of matching predictions (index-only)"""
+        where, parameters = self.filter_clause(game_type, start_time, end_time, algorithm_name)
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM algorithm_predictions WHERE {where}", parameters
+        ).fetchone()[0]
+
+    def close(self):
+        self.connection.close()
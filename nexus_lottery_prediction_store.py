@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY PREDICTION STORE
+Batched WAL-Mode SQLite Persistence For Agent Predictions
+"""
+
+import time
+
+import numpy as np
+
+from nexus_write_behind_logger import get_write_behind_logger
+
+PREDICTION_STORE_SCHEMA = (
+    '''
+    CREATE TABLE IF NOT EXISTS algorithm_predictions (
+        id INTEGER PRIMARY KEY,
+        algorithm_name TEXT,
+        game_type TEXT,
+        predicted_numbers BLOB,
+        confidence_score REAL,
+        consciousness_guidance REAL,
+        neural_probability REAL,
+        prediction_timestamp REAL
+    )
+    ''',
+    # Covers game/time-range scans and top-N sorts entirely (packed numbers are a few bytes per row)
+    '''
+    CREATE INDEX IF NOT EXISTS idx_algorithm_predictions_game_time_covering
+    ON algorithm_predictions (game_type, prediction_timestamp, algorithm_name, confidence_score, predicted_numbers)
+    '''
+)
+
+PREDICTION_INSERT = '''
+    INSERT INTO algorithm_predictions
+    (algorithm_name, game_type, predicted_numbers, confidence_score,
+     consciousness_guidance, neural_probability, prediction_timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def pack_numbers(numbers):
+    """REAL: Ticket numbers as one byte each (every game range fits in 1..255)"""
+    return bytes(numbers)
+
+
+def unpack_numbers(blob):
+    """REAL: Ticket numbers from a packed predicted_numbers blob"""
+    return np.frombuffer(blob, dtype=np.uint8)
+
+
+class NexusPredictionStore:
+    """REAL: algorithm_predictions rows written through the shared write-behind logger
+
+    The schema and its covering game/time index are queued once per database;
+    each save is one queued executemany that the writer thread commits in a
+    single transaction on its WAL connection.
+    """
+
+    def __init__(self, db_path, write_logger=None):
+        self.db_path = db_path
+        self.write_logger = write_logger or get_write_behind_logger()
+        self.write_logger.ensure_schema(db_path, PREDICTION_STORE_SCHEMA)
+
+    def insert_predictions(self, rows):
+        """REAL: Queue (algorithm_name, game_type, packed numbers, confidence, guidance,
+        neural probability, timestamp) rows as one transaction; returns the row count"""
+        return self.write_logger.executemany(self.db_path, PREDICTION_INSERT, rows)
+
+    def save_deployment_predictions(self, deployment_result, prediction_timestamp=None):
+        """REAL: Queue every agent prediction of a deployment; returns the row count"""
+        game_type = deployment_result["game_type"]
+        prediction_timestamp = time.time() if prediction_timestamp is None else prediction_timestamp
+
+        # Guidance and neural probability are the agents' own per-ticket outputs; NULL when absent
+        def prediction_rows():
+            for agent_name, agent_result in deployment_result["agent_predictions"].items():
+                for prediction in agent_result.get("predictions", []):
+                    yield (
+                        agent_name,
+                        game_type,
+                        pack_numbers(prediction.get("numbers", [])),
+                        prediction.get("confidence_factors", {}).get("overall_confidence", 0.0),
+                        prediction.get("consciousness_guidance"),
+                        prediction.get("neural_probability"),
+                        prediction_timestamp
+                    )
+
+        return self.insert_predictions(prediction_rows())
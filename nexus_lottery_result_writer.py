@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY RESULT WRITER
+Streaming NDJSON Deployment Artifacts, Written As Agents Finish
+"""
+
+import json
+
+# Intermediate agent analyses left out of the artifact when analyses are not kept
+AGENT_ANALYSIS_KEYS = ("analysis_methods", "neural_networks", "ensemble_vote")
+
+# Ticket arrays the prediction records already carry one row at a time
+AGENT_ARRAY_KEYS = ("candidate_tickets",)
+
+# Prediction records encoded per write call
+PREDICTION_WRITE_CHUNK = 4096
+
+
+class NexusDeploymentResultWriter:
+    """REAL: One compact JSON record per line instead of one indented document
+
+    Records, in order: a "deployment" header; per agent as it finishes, an
+    "agent" record (its result without the predictions) followed by one
+    "prediction" record per ticket; "prediction" records for the ensemble;
+    and a closing "summary" with the remaining deployment fields. Nothing
+    is held beyond the chunk being encoded. The first I/O or encoding error
+    is printed and stored in error, and later writes are skipped.
+
+    The file is created exclusively, so two deployments can never share (and
+    interleave lines in) one artifact; an existing path raises FileExistsError.
+    """
+
+    def __init__(self, results_file, keep_analyses=True, json_default=None):
+        self.results_file = results_file
+        self.keep_analyses = keep_analyses
+        self.encoder = json.JSONEncoder(separators=(",", ":"), default=json_default)
+        self.output = open(results_file, "x", encoding="utf-8")
+        self.agents_written = set()
+        self.records_written = 0
+        self.error = None
+
+    def write_lines(self, records):
+        if self.error is not None or self.output.closed:
+            return
+        try:
+            lines = [self.encoder.encode(record) for record in records]
+            if lines:
+                self.output.write("\n".join(lines) + "\n")
+                self.records_written += len(lines)
+        except (OSError, TypeError, ValueError) as e:
+            self.error = str(e)
+            print(f"Error saving deployment results: {e}")
+
+    def write_header(self, deployment_result):
+        self.write_lines([{
+            "record": "deployment",
+            "deployment_timestamp": deployment_result["deployment_timestamp"],
+            "game_type": deployment_result["game_type"],
+            "prediction_count": deployment_result["prediction_count"],
+            "analyses_kept": self.keep_analyses
+        }])
+
+    def write_predictions(self, source, predictions):
+        """REAL: One "prediction" record per ticket, encoded a chunk at a time"""
+        for chunk_start in range(0, len(predictions), PREDICTION_WRITE_CHUNK):
+            self.write_lines(
+                dict(prediction, record="prediction", source=source)
+                for prediction in predictions[chunk_start:chunk_start + PREDICTION_WRITE_CHUNK]
+            )
+
+    def write_agent_result(self, agent_name, agent_result, wall_time=None):
+        """REAL: An agent's record and predictions; usable directly as a scheduler on_result callback"""
+        if agent_name in self.agents_written:
+            return
+        self.agents_written.add(agent_name)
+
+        skipped_keys = ("predictions",) + AGENT_ARRAY_KEYS + (() if self.keep_analyses else AGENT_ANALYSIS_KEYS)
+        agent_record = {"record": "agent", "agent_name": agent_name, "wall_time": wall_time}
+        agent_record.update((key, value) for key, value in agent_result.items() if key not in skipped_keys)
+        agent_record["predictions_written"] = len(agent_result.get("predictions", []))
+
+        self.write_lines([agent_record])
+        self.write_predictions(agent_name, agent_result.get("predictions", []))
+
+    def write_deployment(self, deployment_result):
+        """REAL: Agents not streamed yet, the ensemble predictions and the closing summary"""
+        agent_timings = deployment_result.get("agent_timings", {})
+        for agent_name, agent_result in deployment_result["agent_predictions"].items():
+            self.write_agent_result(agent_name, agent_result, agent_timings.get(agent_name))
+
+        self.write_predictions("ensemble", deployment_result.get("ensemble_predictions", []))
+
+        summary = {"record": "summary"}
+        summary.update(
+            (key, value) for key, value in deployment_result.items()
+            if key not in ("agent_predictions", "ensemble_predictions")
+        )
+        self.write_lines([summary])
+
+    def close(self):
+        if not self.output.closed:
+            self.output.close()
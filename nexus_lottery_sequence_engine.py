@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY SEQUENCE ENGINE
+Single-Pass Consecutive, Arithmetic and Fibonacci Detection Over Sorted Draws
+"""
+
+import numpy as np
+
+
+def fibonacci_lookup(max_number):
+    """REAL: Boolean table where entry n is True when n is a Fibonacci number"""
+    lookup = np.zeros(max(int(max_number), 1) + 1, dtype=bool)
+    previous, current = 1, 1
+    while current <= max_number:
+        lookup[current] = True
+        previous, current = current, previous + current
+    return lookup
+
+
+class NexusSequenceEngine:
+    """REAL: Vectorized sequence detection over every draw at once"""
+
+    def __init__(self, number_range, max_step=9, min_progression_length=3, min_fibonacci_count=3):
+        self.number_range = tuple(number_range)
+        self.steps = np.arange(1, max_step + 1)
+        self.min_progression_length = min_progression_length
+        self.min_fibonacci_count = min_fibonacci_count
+        self.fibonacci_lookup = fibonacci_lookup(self.number_range[1])
+
+    def consecutive_lengths(self, differences):
+        """REAL: Longest run of consecutive numbers per draw (1 when there is none)"""
+        run_length = np.zeros(len(differences), dtype=np.int64)
+        max_consecutive = np.ones(len(differences), dtype=np.int64)
+        for column in range(differences.shape[1]):
+            run_length = np.where(differences[:, column] == 1, run_length + 1, 0)
+            np.maximum(max_consecutive, run_length + 1, out=max_consecutive)
+        return max_consecutive
+
+    def arithmetic_progressions(self, differences):
+        """REAL: (draw index, step, length) of every progression, for all steps in one scan
+
+        A progression is reported when a differing gap closes it, matching the
+        per-draw scan it replaces; results are ordered by draw, step, position.
+        """
+        # (draws, gap positions, steps) equality cube
+        step_matches = differences[:, :, None] == self.steps[None, None, :]
+        run_length = np.zeros((len(differences), len(self.steps)), dtype=np.int8)
+
+        draw_indices, steps, positions, lengths = [], [], [], []
+        for position in range(differences.shape[1]):
+            matches = step_matches[:, position, :]
+            closed = ~matches & (run_length + 1 >= self.min_progression_length)
+            if closed.any():
+                draw_index, step_index = np.nonzero(closed)
+                draw_indices.append(draw_index)
+                steps.append(self.steps[step_index])
+                positions.append(np.full(len(draw_index), position))
+                lengths.append(run_length[draw_index, step_index].astype(np.int64) + 1)
+            run_length = np.where(matches, run_length + 1, 0)
+
+        if not draw_indices:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty, empty
+
+        draw_indices = np.concatenate(draw_indices)
+        steps = np.concatenate(steps)
+        positions = np.concatenate(positions)
+        lengths = np.concatenate(lengths)
+
+        order = np.lexsort((positions, steps, draw_indices))
+        return draw_indices[order], steps[order], lengths[order]
+
+    def fibonacci_members(self, sorted_main):
+        """REAL: Per-ball Fibonacci membership mask through the lookup table"""
+        return self.fibonacci_lookup[sorted_main]
+
+    def analyze(self, sorted_main):
+        """REAL: Run every detector over a (draws x balls) matrix of sorted draws"""
+        differences = np.diff(sorted_main.astype(np.int64), axis=1)
+        progression_draws, progression_steps, progression_lengths = self.arithmetic_progressions(differences)
+        fibonacci_members = self.fibonacci_members(sorted_main)
+
+        return {
+            "consecutive_lengths": self.consecutive_lengths(differences),
+            "progression_draws": progression_draws,
+            "progression_steps": progression_steps,
+            "progression_lengths": progression_lengths,
+            "fibonacci_members": fibonacci_members,
+            "fibonacci_counts": fibonacci_members.sum(axis=1)
+        }
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY TEMPORAL ENGINE
+Sliding-Window Position Trend Statistics Over The Whole Draw History
+"""
+
+import numpy as np
+
+
+class NexusTemporalWindowEngine:
+    """REAL: Per-position diff, variance and trend statistics for every draw window at once
+
+    A window is window_length consecutive draws; its statistics come from the
+    window_length - 1 draw-to-draw differences of each ball position. Every
+    per-window sum is a difference of two prefix sums over the history, so each
+    statistic costs O(draws x positions) whatever the window length.
+    """
+
+    def __init__(self, window_length=10, trend_threshold=0.6):
+        self.window_length = window_length
+        self.trend_threshold = trend_threshold
+
+    def _window_sums(self, values):
+        # (draw differences, positions) -> (windows, positions) sums over each window
+        prefix = np.zeros((len(values) + 1,) + values.shape[1:], dtype=np.int64)
+        np.cumsum(values, axis=0, out=prefix[1:])
+        return prefix[self.window_length - 1:] - prefix[:len(prefix) - self.window_length + 1]
+
+    def window_statistics(self, main):
+        """REAL: Statistics of every full window of a (draws x positions) matrix
+
+        Window w covers draws w .. w + window_length - 1. Per window and position:
+        diff sums, sample diff variance (exact zero detection), increasing and
+        decreasing ratios and mean step sizes; per window: pattern strength and
+        trend strengths in the calculate_temporal_trend layout.
+        """
+        main = np.asarray(main)
+        window_count = max(0, len(main) - self.window_length + 1) if self.window_length > 0 else 0
+        position_count = main.shape[1] if main.ndim == 2 else 0
+        statistics = {
+            "window_length": self.window_length,
+            "window_count": window_count,
+            "window_ends": np.arange(self.window_length - 1, self.window_length - 1 + window_count)
+        }
+
+        diff_count = self.window_length - 1
+        if window_count == 0 or diff_count < 1 or position_count == 0:
+            statistics.update({
+                "pattern_strengths": np.zeros(window_count),
+                "position_variances": np.zeros((window_count, position_count)),
+                "increasing_strengths": np.zeros(window_count),
+                "decreasing_strengths": np.zeros(window_count),
+                "random_strengths": np.ones(window_count),
+                "increasing_changes": np.full((window_count, position_count), np.nan),
+                "decreasing_changes": np.full((window_count, position_count), np.nan)
+            })
+            return statistics
+
+        differences = np.diff(main.astype(np.int64), axis=0)
+        increasing = differences > 0
+        decreasing = differences < 0
+
+        diff_sums = self._window_sums(differences)
+        square_sums = self._window_sums(differences * differences)
+        increasing_counts = self._window_sums(increasing.astype(np.int64))
+        decreasing_counts = self._window_sums(decreasing.astype(np.int64))
+        increase_totals = self._window_sums(np.where(increasing, differences, 0))
+        decrease_totals = self._window_sums(np.where(decreasing, -differences, 0))
+
+        # Sample variance from integer moments, so constant steps give exactly 0
+        if diff_count > 1:
+            variances = (diff_count * square_sums - diff_sums * diff_sums) / (diff_count * (diff_count - 1))
+        else:
+            variances = np.zeros(diff_sums.shape)
+        consistency = np.where(variances > 0, 1.0 / (1.0 + variances), 1.0)
+        statistics["pattern_strengths"] = consistency.mean(axis=1)
+        statistics["position_variances"] = variances
+
+        increasing_ratios = increasing_counts / diff_count
+        decreasing_ratios = decreasing_counts / diff_count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            statistics["increasing_changes"] = np.where(
+                increasing_ratios > self.trend_threshold, increase_totals / increasing_counts, np.nan)
+            statistics["decreasing_changes"] = np.where(
+                decreasing_ratios > self.trend_threshold, -decrease_totals / decreasing_counts, np.nan)
+
+        if self.window_length < 3:
+            # Too short for a trend; everything counts as random
+            statistics["increasing_strengths"] = np.zeros(window_count)
+            statistics["decreasing_strengths"] = np.zeros(window_count)
+            statistics["random_strengths"] = np.ones(window_count)
+            statistics["increasing_changes"][:] = np.nan
+            statistics["decreasing_changes"][:] = np.nan
+        else:
+            statistics["increasing_strengths"] = increasing_ratios.sum(axis=1) / position_count
+            statistics["decreasing_strengths"] = decreasing_ratios.sum(axis=1) / position_count
+            statistics["random_strengths"] = 1.0 - np.maximum(statistics["increasing_strengths"],
+                                                              statistics["decreasing_strengths"])
+
+        return statistics
+
+    def temporal_trend(self, statistics, window):
+        """REAL: One window's trends as the calculate_temporal_trend dict"""
+        increasing_changes = statistics["increasing_changes"][window]
+        decreasing_changes = statistics["decreasing_changes"][window]
+        return {
+            "increasing_trend": {
+                "strength": float(statistics["increasing_strengths"][window]),
+                "predicted_changes": increasing_changes[~np.isnan(increasing_changes)].tolist()
+            },
+            "decreasing_trend": {
+                "strength": float(statistics["decreasing_strengths"][window]),
+                "predicted_changes": decreasing_changes[~np.isnan(decreasing_changes)].tolist()
+            },
+            "cyclical_trend": {"strength": 0.0, "predicted_changes": []},
+            "random_trend": {
+                "strength": float(statistics["random_strengths"][window]),
+                "predicted_changes": []
+            }
+        }
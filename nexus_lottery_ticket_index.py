@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY TICKET INDEX
+Combinatorial-Rank Ticket Deduplication And Pair/Triple Coverage Tracking
+"""
+
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+
+def binomial_table(max_n, max_k):
+    """REAL: Table B[n, k] = C(n, k) for 0 <= n <= max_n, 0 <= k <= max_k"""
+    table = np.zeros((max_n + 1, max_k + 1), dtype=np.int64)
+    for n in range(max_n + 1):
+        for k in range(min(n, max_k) + 1):
+            table[n, k] = comb(n, k)
+    return table
+
+
+def combination_ranks(offsets, binomials):
+    """REAL: Colex rank of each sorted row of zero-based offsets (combinatorial number system)
+
+    Row (c_1 < ... < c_k) maps to C(c_1, 1) + ... + C(c_k, k), a bijection onto
+    0..C(range, k) - 1.
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    positions = np.arange(1, offsets.shape[1] + 1)
+    return binomials[offsets, positions].sum(axis=1)
+
+
+class NexusTicketIndex:
+    """REAL: Bitmap of ticket ranks plus multiplicity counts of every covered pair/triple
+
+    Duplicate checks are one bit lookup per ticket and coverage queries are a
+    bincount over sub-combination ranks, so ensembles never compare tickets pairwise.
+    """
+
+    def __init__(self, number_range, ball_count, coverage_sizes=(2, 3)):
+        self.number_range = (int(number_range[0]), int(number_range[1]))
+        self.range_size = self.number_range[1] - self.number_range[0] + 1
+        self.ball_count = int(ball_count)
+        self.coverage_sizes = tuple(size for size in coverage_sizes if size < self.ball_count)
+
+        self.binomials = binomial_table(self.range_size, self.ball_count)
+        self.ticket_space = comb(self.range_size, self.ball_count)
+        self.ticket_bits = np.zeros((self.ticket_space + 7) // 8, dtype=np.uint8)
+        self.ticket_count = 0
+
+        # Position tuples of each sub-combination size, e.g. the 10 pairs of a 5-ball ticket
+        self.subset_positions = {
+            size: np.array(list(combinations(range(self.ball_count), size)), dtype=np.int64)
+            for size in self.coverage_sizes
+        }
+        self.subset_counts = {
+            size: np.zeros(comb(self.range_size, size), dtype=np.uint32)
+            for size in self.coverage_sizes
+        }
+
+    @classmethod
+    def from_game_spec(cls, game_spec, **kwargs):
+        return cls(game_spec.number_range, game_spec.ball_count, **kwargs)
+
+    def __len__(self):
+        return self.ticket_count
+
+    def _offsets(self, tickets):
+        offsets = np.sort(np.asarray(tickets, dtype=np.int64).reshape(-1, self.ball_count), axis=1)
+        offsets -= self.number_range[0]
+        if len(offsets) and (offsets.min() < 0 or offsets.max() >= self.range_size):
+            raise ValueError(f"Ticket numbers outside {self.number_range}")
+        return offsets
+
+    def ranks(self, tickets):
+        """REAL: Combinatorial rank of each ticket (order within a ticket is ignored)"""
+        return combination_ranks(self._offsets(tickets), self.binomials)
+
+    def _subset_ranks(self, offsets, size):
+        # (tickets, subsets per ticket) ranks of every size-member sub-combination
+        positions = self.subset_positions[size]
+        subset_offsets = offsets[:, positions].reshape(-1, size)
+        return combination_ranks(subset_offsets, self.binomials).reshape(len(offsets), len(positions))
+
+    def contains(self, tickets):
+        """REAL: True for every ticket already in the index"""
+        ranks = self.ranks(tickets)
+        return (self.ticket_bits[ranks >> 3] >> (ranks & 7).astype(np.uint8)) & 1 == 1
+
+    def add(self, tickets):
+        """REAL: Index tickets; returns a mask of those that were new
+
+        A ticket repeated within the batch counts as new only at its first row.
+        """
+        offsets = self._offsets(tickets)
+        ranks = combination_ranks(offsets, self.binomials)
+
+        is_new = np.zeros(len(ranks), dtype=bool)
+        _, first_rows = np.unique(ranks, return_index=True)
+        is_new[first_rows] = True
+        is_new &= (self.ticket_bits[ranks >> 3] >> (ranks & 7).astype(np.uint8)) & 1 == 0
+
+        new_ranks = ranks[is_new]
+        np.bitwise_or.at(self.ticket_bits, new_ranks >> 3, (1 << (new_ranks & 7)).astype(np.uint8))
+        self.ticket_count += int(is_new.sum())
+
+        for size in self.coverage_sizes:
+            subset_ranks = self._subset_ranks(offsets[is_new], size).ravel()
+            self.subset_counts[size] += np.bincount(
+                subset_ranks, minlength=len(self.subset_counts[size])
+            ).astype(np.uint32)
+
+        return is_new
+
+    def coverage(self, size=2, tickets=None):
+        """REAL: Distinct size-member combinations covered by the index (or by tickets alone)"""
+        total = comb(self.range_size, size)
+        if tickets is None:
+            covered = int(np.count_nonzero(self.subset_counts[size]))
+        else:
+            covered = int(np.count_nonzero(np.bincount(
+                self._subset_ranks(self._offsets(tickets), size).ravel(), minlength=total
+            )))
+        return {
+            "subset_size": size,
+            "covered": covered,
+            "total": total,
+            "coverage_fraction": covered / total if total else 0.0
+        }
+
+    def overlap_counts(self, tickets, size):
+        """REAL: Per ticket, how many of its size-member combinations the index already covers
+
+        With size = ball_count - 1 (when tracked), a nonzero count marks a
+        near-duplicate sharing all but one number with an indexed ticket.
+        """
+        covered = self.subset_counts[size][self._subset_ranks(self._offsets(tickets), size)] > 0
+        return covered.sum(axis=1)
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+NEXUS LOTTERY TICKET SAMPLER
+Batch Weighted Ticket Generation Conditioned Exactly On Sum Ranges
+"""
+
+import numpy as np
+
+# Tickets sampled per block; bounds the (numbers x tickets) uniform matrix
+TICKET_BLOCK_SIZE = 65536
+
+
+def build_number_weights(game_spec, freq_analysis, gap_analysis, floor_weight=0.05):
+    """REAL: Selection probability per number from the frequency and gap analyses
+
+    Mirrors the single-ticket mix: top hot numbers share 40%, top balanced numbers
+    40%, top cold numbers 20%, and gap-due numbers (appearance probability above
+    0.7) are boosted. Every number keeps floor_weight so any ticket stays reachable.
+    """
+    weights = np.full(game_spec.range_size, floor_weight, dtype=np.float64)
+
+    category_shares = [
+        (freq_analysis.get("hot_numbers", [])[:10], 0.4),
+        (freq_analysis.get("balanced_numbers", [])[:10], 0.4),
+        (freq_analysis.get("cold_numbers", [])[:5], 0.2)
+    ]
+    for entries, share in category_shares:
+        offsets = np.array([entry["number"] for entry in entries], dtype=np.int64) - game_spec.number_range[0]
+        offsets = offsets[(offsets >= 0) & (offsets < game_spec.range_size)]
+        if len(offsets):
+            weights[offsets] += share * game_spec.ball_count / len(offsets)
+
+    due_numbers = [
+        num for num, pred in gap_analysis.get("gap_predictions", {}).items()
+        if pred.get("appearance_probability", 0) > 0.7
+    ]
+    due_offsets = np.array(due_numbers, dtype=np.int64) - game_spec.number_range[0]
+    due_offsets = due_offsets[(due_offsets >= 0) & (due_offsets < game_spec.range_size)]
+    weights[due_offsets] += 0.5
+
+    return weights / weights.sum()
+
+
+def sum_range_mask(ticket_sums, sum_ranges):
+    """REAL: True for every ticket sum inside any of the inclusive (start, end) ranges"""
+    if not sum_ranges:
+        return np.ones(len(ticket_sums), dtype=bool)
+    bounds = np.asarray(sum_ranges, dtype=np.int64).reshape(-1, 2)
+    ticket_sums = np.asarray(ticket_sums)[:, None]
+    return ((ticket_sums >= bounds[:, 0]) & (ticket_sums <= bounds[:, 1])).any(axis=1)
+
+
+def subset_sum_table(values, ball_count, max_sum, weights=None):
+    """REAL: DP table T[i, j, s] over subsets of values[i:] with j members summing to s
+
+    Without weights the entries are exact subset counts; with weights each subset
+    contributes the product of its members' weights.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    table = np.zeros((len(values) + 1, ball_count + 1, max_sum + 1),
+                     dtype=np.int64 if weights is None else np.float64)
+    table[len(values), 0, 0] = 1
+
+    for i in range(len(values) - 1, -1, -1):
+        table[i] = table[i + 1]
+        value = values[i]
+        if value <= max_sum:
+            # Subsets that take values[i]: one more member, value more in the sum
+            taken = table[i + 1, :-1, :max_sum + 1 - value]
+            table[i, 1:, value:] += taken if weights is None else weights[i] * taken
+
+    return table
+
+
+def sample_sum_constrained_tickets(rng, values, weights, ball_count, allowed_sums, ticket_count):
+    """REAL: Weighted k-subsets drawn exactly conditioned on their sum, with no rejection
+
+    P(ticket) is proportional to the product of its weights over tickets whose sum
+    is allowed. A target sum is drawn per ticket from the DP totals, then every
+    number is walked once in ascending order and taken with its exact conditional
+    probability, so the cost is fixed at len(values) steps per block.
+    """
+    values = np.asarray(values, dtype=np.int64)
+    max_sum = len(allowed_sums) - 1
+    # Scale weights to mean 1 so products stay well inside float64 range
+    weights = np.asarray(weights, dtype=np.float64) / np.mean(weights)
+    table = subset_sum_table(values, ball_count, max_sum, weights)
+
+    sum_mass = table[0, ball_count] * allowed_sums
+    ticket_dtype = np.uint8 if values[-1] <= np.iinfo(np.uint8).max else np.int16
+    tickets = np.empty((ticket_count, ball_count), dtype=ticket_dtype)
+
+    for block_start in range(0, ticket_count, TICKET_BLOCK_SIZE):
+        block_count = min(TICKET_BLOCK_SIZE, ticket_count - block_start)
+        block = tickets[block_start:block_start + block_count]
+
+        remaining_sums = rng.choice(len(sum_mass), size=block_count, p=sum_mass / sum_mass.sum())
+        remaining_balls = np.full(block_count, ball_count, dtype=np.int64)
+        uniforms = rng.random((len(values), block_count))
+
+        for i, value in enumerate(values.tolist()):
+            open_rows = np.flatnonzero((remaining_balls > 0) & (remaining_sums >= value))
+            if not len(open_rows):
+                continue
+            balls = remaining_balls[open_rows]
+            sums = remaining_sums[open_rows]
+
+            take_probability = weights[i] * table[i + 1, balls - 1, sums - value] / table[i, balls, sums]
+            taken_rows = open_rows[uniforms[i, open_rows] < take_probability]
+
+            block[taken_rows, ball_count - remaining_balls[taken_rows]] = value
+            remaining_balls[taken_rows] -= 1
+            remaining_sums[taken_rows] -= value
+
+    return tickets
+
+
+class NexusTicketSampler:
+    """REAL: Draws many pattern-weighted tickets per call, conditioned on sum ranges
+
+    P(ticket) is proportional to the product of its numbers' probabilities; with
+    sum_ranges, tickets are drawn only among sums inside those ranges.
+    """
+
+    def __init__(self, game_spec, probabilities, sum_ranges=None, seed=None):
+        self.game_spec = game_spec
+        self.probabilities = probabilities
+        self.sum_ranges = [tuple(sum_range) for sum_range in (sum_ranges or [])]
+        self.rng = np.random.default_rng(seed)
+
+    def allowed_sums(self):
+        """REAL: Mask over 0..max_sum of reachable sums inside the sum ranges"""
+        sum_values = np.arange(self.game_spec.max_sum + 1)
+        return sum_range_mask(sum_values, self.sum_ranges) & (self.game_spec.sum_counts > 0)
+
+    def sample(self, ticket_count):
+        """REAL: (tickets, sum_valid) for ticket_count tickets
+
+        When no reachable sum lies inside the ranges, tickets are drawn from every
+        sum and flagged in sum_valid.
+        """
+        allowed_sums = self.allowed_sums()
+        sum_valid = np.ones(ticket_count, dtype=bool)
+        if not allowed_sums.any():
+            allowed_sums = self.game_spec.sum_counts > 0
+            sum_valid[:] = False
+
+        tickets = sample_sum_constrained_tickets(
+            self.rng, self.game_spec.numbers, self.probabilities, self.game_spec.ball_count,
+            allowed_sums, ticket_count
+        )
+        return tickets, sum_valid
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+NEXUS WRITE-BEHIND LOGGER
+Background SQLite Writer Draining A Bounded Queue In Batched Transactions
+"""
+
+import os
+import time
+import queue
+import atexit
+import sqlite3
+import threading
+
+# Queued writes (not rows) before enqueue blocks the caller
+WRITE_BEHIND_QUEUE_SIZE = 10000
+
+# Queued writes committed together in one transaction per database
+WRITE_BEHIND_BATCH_SIZE = 512
+
+# One logger (and writer thread) per process
+_write_behind_loggers = {}
+_write_behind_loggers_lock = threading.Lock()
+
+
+def get_write_behind_logger():
+    """REAL: The process's shared write-behind logger, started on first use"""
+    with _write_behind_loggers_lock:
+        process_id = os.getpid()
+        if process_id not in _write_behind_loggers:
+            _write_behind_loggers[process_id] = NexusWriteBehindLogger()
+        return _write_behind_loggers[process_id]
+
+
+class NexusWriteBehindLogger:
+    """REAL: Callers enqueue INSERTs; one daemon thread owns the connections and commits them
+
+    Each database gets a single WAL connection opened by the writer thread.
+    The writer blocks for one queued write, drains up to batch_size more and
+    commits them per database in one transaction; if that transaction fails
+    the writes are retried one by one so a single bad row loses only itself.
+    The queue is bounded, so a producer outrunning the disk blocks on enqueue
+    and the wait is reported in metrics().
+    """
+
+    def __init__(self, max_queue_size=WRITE_BEHIND_QUEUE_SIZE, batch_size=WRITE_BEHIND_BATCH_SIZE):
+        self.write_queue = queue.Queue(maxsize=max_queue_size)
+        self.batch_size = batch_size
+        self.connections = {}
+        self.schemas = set()
+        self.progress = threading.Condition()
+        self.writer_thread = None
+        self.writer_lock = threading.Lock()
+
+        self.enqueued_writes = 0
+        self.completed_writes = 0
+        self.enqueued_rows = 0
+        self.written_rows = 0
+        self.failed_writes = 0
+        self.batches = 0
+        self.backpressure_waits = 0
+        self.backpressure_seconds = 0.0
+        self.max_queue_depth = 0
+        self.last_error = None
+
+        atexit.register(self.flush)
+
+    def ensure_schema(self, db_path, statements):
+        """REAL: Queue a database's CREATE statements once, ahead of its first insert"""
+        schema_key = os.path.abspath(db_path)
+        with self.progress:
+            if schema_key in self.schemas:
+                return
+            self.schemas.add(schema_key)
+        for statement in statements:
+            self.enqueue(db_path, statement, None)
+
+    def execute(self, db_path, statement, parameters=()):
+        """REAL: Queue one parameterized statement"""
+        self.enqueue(db_path, statement, [tuple(parameters)])
+
+    def executemany(self, db_path, statement, rows):
+        """REAL: Queue a statement for many parameter rows, written in the same transaction"""
+        rows = list(rows)
+        if rows:
+            self.enqueue(db_path, statement, rows)
+        return len(rows)
+
+    def enqueue(self, db_path, statement, rows):
+        self.start()
+        with self.progress:
+            self.enqueued_writes += 1
+            self.enqueued_rows += len(rows) if rows is not None else 0
+
+        write = (db_path, statement, rows)
+        try:
+            self.write_queue.put_nowait(write)
+        except queue.Full:
+            wait_start = time.perf_counter()
+            self.write_queue.put(write)
+            with self.progress:
+                self.backpressure_waits += 1
+                self.backpressure_seconds += time.perf_counter() - wait_start
+
+        queue_depth = self.write_queue.qsize()
+        if queue_depth > self.max_queue_depth:
+            self.max_queue_depth = queue_depth
+
+    def start(self):
+        with self.writer_lock:
+            if self.writer_thread is None or not self.writer_thread.is_alive():
+                self.writer_thread = threading.Thread(
+                    target=self.drain_queue, name="nexus-write-behind", daemon=True
+                )
+                self.writer_thread.start()
+
+    def connection(self, db_path):
+        """REAL: The writer thread's connection to db_path, opened in WAL mode on first use"""
+        connection_key = os.path.abspath(db_path)
+        if connection_key not in self.connections:
+            connection = sqlite3.connect(db_path)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self.connections[connection_key] = connection
+        return self.connections[connection_key]
+
+    def drain_queue(self):
+        while True:
+            batch = [self.write_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            batches_by_database = {}
+            for write in batch:
+                batches_by_database.setdefault(write[0], []).append(write)
+
+            written_rows = 0
+            failed_writes = 0
+            for db_path, writes in batches_by_database.items():
+                try:
+                    connection = self.connection(db_path)
+                    try:
+                        with connection:
+                            batch_rows = sum(self.apply_write(connection, write) for write in writes)
+                        written_rows += batch_rows
+                    except sqlite3.Error:
+                        # Isolate the failing write; the rest of the batch still commits
+                        for write in writes:
+                            try:
+                                with connection:
+                                    written_rows += self.apply_write(connection, write)
+                            except sqlite3.Error as e:
+                                failed_writes += 1
+                                self.last_error = f"{db_path}: {e}"
+                                print(f"Write-behind error: {self.last_error}")
+                except Exception as e:
+                    failed_writes += len(writes)
+                    self.last_error = f"{db_path}: {e}"
+                    print(f"Write-behind error: {self.last_error}")
+
+            with self.progress:
+                self.completed_writes += len(batch)
+                self.written_rows += written_rows
+                self.failed_writes += failed_writes
+                self.batches += 1
+                self.progress.notify_all()
+
+    @staticmethod
+    def apply_write(connection, write):
+        db_path, statement, rows = write
+        if rows is None:
+            connection.execute(statement)
+            return 0
+        connection.executemany(statement, rows)
+        return len(rows)
+
+    def flush(self, timeout=None):
+        """REAL: Block until everything queued before the call is committed; False on timeout"""
+        with self.progress:
+            target = self.enqueued_writes
+            if self.writer_thread is None:
+                return self.completed_writes >= target
+            return self.progress.wait_for(lambda: self.completed_writes >= target, timeout=timeout)
+
+    def metrics(self):
+        """REAL: Queue depth, throughput and backpressure counters"""
+        with self.progress:
+            return {
+                "queue_depth": self.write_queue.qsize(),
+                "queue_capacity": self.write_queue.maxsize,
+                "max_queue_depth": self.max_queue_depth,
+                "pending_writes": self.enqueued_writes - self.completed_writes,
+                "enqueued_writes": self.enqueued_writes,
+                "completed_writes": self.completed_writes,
+                "enqueued_rows": self.enqueued_rows,
+                "written_rows": self.written_rows,
+                "failed_writes": self.failed_writes,
+                "batches": self.batches,
+                "backpressure_waits": self.backpressure_waits,
+                "backpressure_seconds": self.backpressure_seconds,
+                "last_error": self.last_error
+            }
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the agent DAG scheduler and its in-process fallback
+"""
+
+import numpy as np
+
+from nexus_lottery_agent_scheduler import (
+    NexusAgentScheduler, NexusAgentTask, SHARED_HISTORY, DEPENDENCY_RESULTS
+)
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+
+
+def count_draws(history):
+    return {"draws": len(history), "dates_shared": history.draw_dates is not None}
+
+
+def total_draws(dependency_results):
+    return sum(result["draws"] for result in dependency_results.values())
+
+
+def agent_tasks():
+    return {
+        "first_agent": NexusAgentTask(count_draws, (SHARED_HISTORY,)),
+        "second_agent": NexusAgentTask(count_draws, (SHARED_HISTORY,)),
+        "combined_agent": NexusAgentTask(total_draws, (DEPENDENCY_RESULTS,),
+                                         depends_on=["first_agent", "second_agent"])
+    }
+
+
+def draw_history(draw_count, draw_dates):
+    rng = np.random.default_rng(4)
+    return NexusDrawMatrix(np.sort(np.argsort(rng.random((draw_count, 69)), axis=1)[:, :5] + 1, axis=1),
+                           (1, 69), draw_dates=draw_dates)
+
+
+def test_pooled_schedule_runs_with_legacy_dates():
+    # Dates that are not ISO cannot be shared as datetime64 and stay in the parent
+    history = draw_history(40, [f"01/{day % 28 + 1:02d}/2020" for day in range(40)])
+    scheduler = NexusAgentScheduler(max_workers=2, min_pooled_draws=0)
+    assert scheduler.uses_pool(history)
+
+    finished = []
+    schedule_result = scheduler.run(agent_tasks(), shared_history=history,
+                                    on_result=lambda name, result, wall_time: finished.append(name))
+
+    assert schedule_result["results"]["first_agent"] == {"draws": 40, "dates_shared": False}
+    assert schedule_result["results"]["combined_agent"] == 80
+    assert finished[-1] == "combined_agent"
+
+
+def test_small_or_single_worker_schedules_run_in_process():
+    history = draw_history(100, [str(day) for day in np.arange("2020-01-01", 100, dtype="datetime64[D]")])
+
+    assert not NexusAgentScheduler(max_workers=2).uses_pool(history)
+    assert not NexusAgentScheduler(max_workers=1, min_pooled_draws=0).uses_pool(history)
+    assert not NexusAgentScheduler(max_workers=2, use_processes=False, min_pooled_draws=0).uses_pool(history)
+
+    schedule_result = NexusAgentScheduler(max_workers=2).run(agent_tasks(), shared_history=history)
+    assert schedule_result["results"]["first_agent"] == {"draws": 100, "dates_shared": True}
+    assert schedule_result["results"]["combined_agent"] == 200
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for the columnar draw store and draw file ingestion round-trips
+"""
+
+import csv
+import gzip
+import json
+
+import numpy as np
+import pytest
+
+from nexus_lottery_draw_ingestion import NexusDrawIngestion
+from nexus_lottery_draw_store import NexusDrawStore, date_to_day_offset
+from nexus_lottery_game_spec import NexusGameSpec
+
+POWERBALL = {
+    "white_balls": {"range": (1, 69), "count": 5},
+    "power_ball": {"range": (1, 26), "count": 1}
+}
+
+
+def draw_records(count, seed=6):
+    rng = np.random.default_rng(seed)
+    start_day = date_to_day_offset("2020-01-04")
+    return [
+        {
+            "draw_date": str(np.datetime64(start_day + 3 * index, "D")),
+            "numbers": sorted(rng.choice(np.arange(1, 70), 5, replace=False).tolist()) + [int(rng.integers(1, 27))],
+            "jackpot_amount": float(rng.integers(10, 500) * 1000000),
+            "winners_count": int(rng.integers(0, 4))
+        }
+        for index in range(count)
+    ]
+
+
+def assert_store_matches(store, records):
+    assert len(store) == len(records)
+    np.testing.assert_array_equal(store.main, [record["numbers"][:5] for record in records])
+    np.testing.assert_array_equal(store.special, [record["numbers"][5:] for record in records])
+    np.testing.assert_array_equal(store.day_offsets, [date_to_day_offset(record["draw_date"]) for record in records])
+    np.testing.assert_array_equal(store.jackpots, [record["jackpot_amount"] for record in records])
+    np.testing.assert_array_equal(store.winners, [record["winners_count"] for record in records])
+
+
+def test_draw_store_write_open_round_trip(tmp_path):
+    records = draw_records(300)
+    NexusDrawStore.write(str(tmp_path / "store"), records, POWERBALL, "powerball")
+
+    store = NexusDrawStore.open(str(tmp_path / "store"))
+    assert_store_matches(store, records)
+    first_draw = next(store.iter_draws())
+    assert (first_draw["draw_date"], first_draw["numbers"]) == (records[0]["draw_date"], records[0]["numbers"])
+
+    draw_matrix = store.to_draw_matrix(100, 200)
+    np.testing.assert_array_equal(draw_matrix.main, store.main[100:200])
+    assert draw_matrix.game_type == "powerball"
+
+
+def test_draw_store_append_commits_draw_count(tmp_path):
+    records = draw_records(50)
+    store = NexusDrawStore.create(str(tmp_path / "store"), POWERBALL, "powerball")
+    for chunk_start in range(0, len(records), 20):
+        chunk = records[chunk_start:chunk_start + 20]
+        store.append(
+            [record["numbers"][:5] for record in chunk],
+            [record["numbers"][5:] for record in chunk],
+            day_offsets=[date_to_day_offset(record["draw_date"]) for record in chunk],
+            jackpots=[record["jackpot_amount"] for record in chunk],
+            winners=[record["winners_count"] for record in chunk]
+        )
+
+    assert_store_matches(NexusDrawStore.open(str(tmp_path / "store")), records)
+
+
+def write_draw_file(path, records, file_format):
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "wt", encoding="utf-8", newline="") as f:
+        if file_format == "csv":
+            writer = csv.DictWriter(f, fieldnames=["draw_date", "numbers", "jackpot_amount", "winners_count"])
+            writer.writeheader()
+            for record in records:
+                writer.writerow(dict(record, numbers=" ".join(map(str, record["numbers"]))))
+        elif file_format == "jsonl":
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        else:
+            json.dump({"draws": records}, f, indent=2)
+
+
+@pytest.mark.parametrize("file_name, file_format", [
+    ("draws.csv", "csv"),
+    ("draws.jsonl.gz", "jsonl"),
+    ("draws.json", "json")
+])
+def test_ingestion_round_trip(tmp_path, file_name, file_format):
+    records = draw_records(250)
+    bad_records = [
+        dict(records[0], numbers=[1, 2, 3, 4, 70, 5]),
+        dict(records[0], numbers=[1, 1, 2, 3, 4, 5]),
+        dict(records[0], numbers=[1, 2, 3, 4, 5, 27]),
+        dict(records[0], numbers=[1, 2, 3, 4, 5]),
+        dict(records[0], draw_date="")
+    ]
+    path = str(tmp_path / file_name)
+    write_draw_file(path, records[:100] + bad_records + records[100:], file_format)
+
+    store = NexusDrawStore.create(str(tmp_path / "store"), POWERBALL, "powerball")
+    report = NexusDrawIngestion(NexusGameSpec.from_game_config(POWERBALL), chunk_size=64).ingest_file(path, store)
+
+    assert report["rows_read"] == len(records) + len(bad_records)
+    assert report["rows_accepted"] == len(records)
+    assert report["rejection_reasons"] == {
+        "main_number_out_of_range": 1,
+        "duplicate_main_number": 1,
+        "invalid_special_number": 1,
+        "wrong_ball_count": 1,
+        "missing_draw_date": 1
+    }
+    assert_store_matches(NexusDrawStore.open(str(tmp_path / "store")), records)
+
+
+def test_ingestion_rejects_json_without_draw_list(tmp_path):
+    path = tmp_path / "draws.json"
+    path.write_text(json.dumps({"results": []}))
+    store = NexusDrawStore.create(str(tmp_path / "store"), POWERBALL, "powerball")
+
+    with pytest.raises(ValueError):
+        NexusDrawIngestion(POWERBALL).ingest_file(str(path), store)
+
+
+MEGA_MILLIONS = {
+    "main_balls": {"range": (1, 70), "count": 5},
+    "mega_ball": {"range": (1, 25), "count": 1}
+}
+
+
+def test_ingestion_of_an_export_layout(tmp_path):
+    # Published-export layout: US dates, mains in drawn order, the special ball and
+    # currency-formatted jackpot in their own columns, plus an ignored multiplier
+    path = tmp_path / "Lottery_Mega_Millions_Winning_Numbers.csv"
+    path.write_text(
+        "Draw Date,Winning Numbers,Mega Ball,Multiplier,Jackpot\n"
+        "01/04/2022,45 03 27 61 12,10,03,\"$1,000,000\"\n"
+        "01/07/2022,09 70 14 33 02,25,02,$20000000\n"
+        "2022-01-11,01 02 03 04 05,01,02,$5\n"
+        "01/14/2022,01 02 03 04 05 06,01,02,$5\n"
+        "01/18/2022,01 02 03 04 05,,02,$5\n"
+    )
+    store = NexusDrawStore.create(str(tmp_path / "store"), MEGA_MILLIONS, "mega_millions")
+    report = NexusDrawIngestion(MEGA_MILLIONS, date_format="%m/%d/%Y").ingest_file(str(path), store)
+
+    assert report["rows_accepted"] == 2
+    assert report["rejection_reasons"] == {"invalid_draw_date": 1, "wrong_ball_count": 2}
+
+    store = NexusDrawStore.open(str(tmp_path / "store"))
+    np.testing.assert_array_equal(store.main, [[3, 12, 27, 45, 61], [2, 9, 14, 33, 70]])
+    np.testing.assert_array_equal(store.special, [[10], [25]])
+    np.testing.assert_array_equal(store.day_offsets, [date_to_day_offset("2022-01-04"),
+                                                      date_to_day_offset("2022-01-07")])
+    np.testing.assert_array_equal(store.jackpots, [1000000.0, 20000000.0])
+
+
+def test_ingestion_rejects_unrecognised_columns(tmp_path):
+    path = tmp_path / "draws.csv"
+    path.write_text("when,balls\n2022-01-04,1 2 3 4 5 6\n")
+    store = NexusDrawStore.create(str(tmp_path / "store"), POWERBALL, "powerball")
+
+    report = NexusDrawIngestion(POWERBALL).ingest_file(str(path), store)
+    assert report["rejection_reasons"] == {"wrong_ball_count": 1}
+
+    aliased = NexusDrawIngestion(POWERBALL, field_aliases={"draw_date": ["when"], "numbers": ["balls"]})
+    assert aliased.ingest_file(str(path), store)["rows_accepted"] == 1
@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Tests that plain game configs resolve to one compiled spec and analyse like the spec
+"""
+
+import pytest
+
+from nexus_lottery_algorithm_system import NexusLotteryAlgorithmSystem
+
+
+@pytest.fixture(scope="module")
+def lottery_system():
+    return NexusLotteryAlgorithmSystem()
+
+
+def test_game_configs_compile_once(lottery_system):
+    powerball_config = dict(lottery_system.lottery_games["powerball"])
+    assert lottery_system.resolve_game_spec(powerball_config) is lottery_system.game_specs["powerball"]
+
+    custom_config = {"numbers": {"range": (1, 40), "count": 5}}
+    custom_spec = lottery_system.resolve_game_spec(custom_config)
+    assert lottery_system.resolve_game_spec(dict(custom_config)) is custom_spec
+    assert lottery_system.resolve_game_spec(custom_spec) is custom_spec
+
+
+@pytest.mark.parametrize("analysis_name", [
+    "detect_sequence_patterns", "analyze_sum_range_patterns", "lstm_prediction_network", "analyze_recency_guidance"
+])
+def test_plain_config_analyses_match_spec_analyses(lottery_system, analysis_name):
+    historical_data = lottery_system.load_historical_draws("state_lotto", 200)
+    draw_matrix = lottery_system.build_draw_matrix(historical_data, lottery_system.get_game_spec("state_lotto"))
+    analysis = getattr(lottery_system, analysis_name)
+
+    from_config = analysis(draw_matrix, lottery_system.lottery_games["state_lotto"])
+    from_spec = analysis(draw_matrix, lottery_system.get_game_spec("state_lotto"))
+
+    assert "error" not in from_config
+    assert from_config["confidence_score"] == pytest.approx(from_spec["confidence_score"])
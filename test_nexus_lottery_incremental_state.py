@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental lottery analysis state against full rebuilds
+"""
+
+import numpy as np
+import pytest
+
+from nexus_lottery_algorithm_system import NexusLotteryAlgorithmSystem
+from nexus_lottery_draw_matrix import NexusDrawMatrix
+from nexus_lottery_incremental_state import NexusIncrementalAnalysisState
+
+
+def random_history(seed, draw_count, number_range, ball_count):
+    rng = np.random.default_rng(seed)
+    numbers = np.arange(number_range[0], number_range[1] + 1)
+    return np.array([np.sort(rng.choice(numbers, ball_count, replace=False)) for _ in range(draw_count)])
+
+
+def assert_same_state(state, rebuilt):
+    assert len(state) == len(rebuilt)
+    np.testing.assert_array_equal(state.frequencies, rebuilt.frequencies)
+    np.testing.assert_array_equal(state.current_gaps(), rebuilt.current_gaps())
+    np.testing.assert_array_equal(state.gap_counts, rebuilt.gap_counts)
+    np.testing.assert_allclose(state.gap_means, rebuilt.gap_means, atol=1e-9)
+    np.testing.assert_allclose(state.gap_variances(), rebuilt.gap_variances(), atol=1e-6)
+    np.testing.assert_array_equal(state.sum_histogram, rebuilt.sum_histogram)
+    assert state.sum_mean == pytest.approx(rebuilt.sum_mean)
+
+    counts, means, variance = state.tracked_gap_summary()
+    rebuilt_counts, rebuilt_means, rebuilt_variance = rebuilt.tracked_gap_summary()
+    np.testing.assert_array_equal(counts, rebuilt_counts)
+    np.testing.assert_allclose(means, rebuilt_means, atol=1e-9)
+    assert variance == pytest.approx(rebuilt_variance, abs=1e-6)
+
+
+@pytest.mark.parametrize("number_range, ball_count, window_size", [
+    ((1, 20), 5, None),
+    ((1, 20), 5, 60),
+    ((1, 69), 5, 150),
+])
+def test_incremental_updates_match_rebuild(number_range, ball_count, window_size):
+    draws = random_history(7, 400, number_range, ball_count)
+    state = NexusIncrementalAnalysisState(number_range, ball_count, window_size=window_size, capacity=4)
+
+    for draw_count, draw in enumerate(draws, 1):
+        state.add_draw(draw)
+        if draw_count % 37 == 0 or draw_count == len(draws):
+            rebuilt = NexusIncrementalAnalysisState.from_draw_matrix(
+                NexusDrawMatrix(draws[:draw_count], number_range), window_size=window_size
+            )
+            assert_same_state(state, rebuilt)
+
+
+def test_remove_draw_matches_rebuild_of_remaining_draws():
+    draws = random_history(11, 200, (1, 30), 5)
+    state = NexusIncrementalAnalysisState.from_draw_matrix(NexusDrawMatrix(draws, (1, 30)))
+
+    for removed in range(1, 150):
+        assert state.remove_draw() == draws[removed - 1].tolist()
+        if removed % 29 == 0:
+            rebuilt = NexusIncrementalAnalysisState.from_draw_matrix(NexusDrawMatrix(draws[removed:], (1, 30)))
+            assert_same_state(state, rebuilt)
+
+
+@pytest.mark.parametrize("window_size", [None, 80])
+def test_incremental_gap_analysis_matches_batch(window_size):
+    system = NexusLotteryAlgorithmSystem()
+    game_config = system.get_game_spec("powerball")
+    draws = random_history(3, 300, (1, 69), 5)
+
+    state = NexusIncrementalAnalysisState((1, 69), 5, window_size=window_size)
+    for draw in draws:
+        state.add_draw(draw)
+    window = draws if window_size is None else draws[-window_size:]
+
+    incremental = system.analyze_gap_patterns(state, game_config)
+    batch = system.analyze_gap_patterns(NexusDrawMatrix(window, (1, 69)), game_config)
+
+    assert "error" not in incremental and "error" not in batch
+    assert incremental["average_gaps"] == pytest.approx(batch["average_gaps"])
+    assert incremental["gap_predictions"].keys() == batch["gap_predictions"].keys()
+    for number, prediction in batch["gap_predictions"].items():
+        assert incremental["gap_predictions"][number] == pytest.approx(prediction)
+    assert incremental["confidence_score"] == pytest.approx(batch["confidence_score"])
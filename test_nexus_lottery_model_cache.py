@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for the on-disk neural model cache
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from nexus_lottery_model_cache import NexusModelCache
+from nexus_lottery_neural_models import NexusConvolutionalScorer
+
+
+@pytest.fixture
+def draw_history():
+    rng = np.random.default_rng(16)
+    return np.sort(np.argsort(rng.random((300, 49)), axis=1)[:, :6] + 1, axis=1)
+
+
+def test_saved_model_restores_warm(tmp_path, draw_history):
+    model_cache = NexusModelCache(str(tmp_path))
+    trained = NexusConvolutionalScorer(49)
+    trained_result = trained.fit_predict(draw_history)
+    path = model_cache.save("state_lotto", trained)
+
+    assert os.listdir(tmp_path) == [os.path.basename(path)]
+
+    restored = NexusConvolutionalScorer(49)
+    assert model_cache.load("state_lotto", restored)
+    restored_result = restored.fit_predict(draw_history)
+    assert restored_result["training_mode"] == "warm"
+    np.testing.assert_allclose(restored_result["number_probabilities"], trained_result["number_probabilities"])
+
+
+@pytest.mark.parametrize("corrupt_bytes", [b"", b"PK\x03\x04 truncated", b"not an archive"])
+def test_corrupt_entry_is_a_miss_and_is_replaced(tmp_path, draw_history, corrupt_bytes):
+    model_cache = NexusModelCache(str(tmp_path))
+    model = NexusConvolutionalScorer(49)
+    with open(model_cache.model_path("state_lotto", model), "wb") as cache_file:
+        cache_file.write(corrupt_bytes)
+
+    assert not model_cache.load("state_lotto", model)
+    model.fit_predict(draw_history)
+    model_cache.save("state_lotto", model)
+    assert model_cache.load("state_lotto", NexusConvolutionalScorer(49))
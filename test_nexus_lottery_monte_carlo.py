@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for the Monte Carlo engine's exact histograms and sampled best-of-set classes
+"""
+
+import numpy as np
+
+from nexus_lottery_game_spec import NexusGameSpec
+from nexus_lottery_monte_carlo import NexusMonteCarloEngine
+
+STATE_LOTTO = NexusGameSpec.from_game_config({"numbers": {"range": (1, 49), "count": 6}})
+TICKETS = [[1, 2, 3, 4, 5, 6], [4, 5, 6, 7, 8, 9], [20, 25, 30, 35, 40, 45]]
+
+
+def test_multi_ticket_histograms_are_exact_and_only_best_class_is_sampled():
+    draw_count = 50000
+    outcomes = NexusMonteCarloEngine(STATE_LOTTO, seed=19, max_workers=1, block_draws=20000).simulate(
+        TICKETS, draw_count)
+
+    expected = draw_count * STATE_LOTTO.odds_table.main_probabilities
+    assert not outcomes["exact"] and outcomes["blocks"] == 3
+    np.testing.assert_allclose(outcomes["ticket_match_histograms"], np.tile(expected, (len(TICKETS), 1)))
+    np.testing.assert_allclose(outcomes["set_match_histogram"], len(TICKETS) * expected)
+
+    # The best of three tickets matches at least as well as one ticket, and at most as well as three
+    best_histogram = outcomes["set_best_match_histogram"]
+    assert best_histogram.sum() == draw_count
+    best_at_least_one = best_histogram[1:].sum() / draw_count
+    single_at_least_one = STATE_LOTTO.odds_table.main_at_least[1]
+    assert single_at_least_one < best_at_least_one < len(TICKETS) * single_at_least_one
+
+
+def test_sampled_best_class_does_not_depend_on_worker_count():
+    engine_args = dict(seed=20, block_draws=10000)
+    single = NexusMonteCarloEngine(STATE_LOTTO, max_workers=1, **engine_args).simulate(TICKETS, 30000)
+    pooled = NexusMonteCarloEngine(STATE_LOTTO, max_workers=3, **engine_args).simulate(TICKETS, 30000)
+
+    assert pooled["workers"] == 3
+    np.testing.assert_array_equal(single["set_best_class_histogram"], pooled["set_best_class_histogram"])
+
+
+def test_single_ticket_is_answered_without_sampling():
+    outcomes = NexusMonteCarloEngine(STATE_LOTTO, seed=1).simulate(TICKETS[:1], 1000)
+
+    assert outcomes["exact"] and outcomes["blocks"] == 0
+    np.testing.assert_allclose(outcomes["set_best_match_histogram"], 1000 * STATE_LOTTO.odds_table.main_probabilities)
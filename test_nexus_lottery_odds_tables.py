@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the exact match-class odds tables against published game odds
+"""
+
+import numpy as np
+import pytest
+
+from nexus_lottery_algorithm_system import REFERENCE_JACKPOT, NexusLotteryAlgorithmSystem
+from nexus_lottery_game_spec import NexusGameSpec
+from nexus_lottery_odds_tables import GAME_PRIZE_TABLES, JACKPOT, NexusOddsTable
+
+# Published Powerball prize odds ("1 in N"), keyed by (white balls, Powerball) matched
+PUBLISHED_POWERBALL_ODDS = {
+    (5, 1): 292201338.00,
+    (5, 0): 11688053.52,
+    (4, 1): 913129.18,
+    (4, 0): 36525.17,
+    (3, 1): 14494.11,
+    (3, 0): 579.76,
+    (2, 1): 701.33,
+    (1, 1): 91.98,
+    (0, 1): 38.32
+}
+PUBLISHED_POWERBALL_OVERALL_ODDS = 24.87
+
+
+@pytest.fixture
+def powerball_odds():
+    return NexusGameSpec.from_game_config({
+        "white_balls": {"range": (1, 69), "count": 5},
+        "power_ball": {"range": (1, 26), "count": 1}
+    }).odds_table
+
+
+def test_powerball_odds_match_published_odds(powerball_odds):
+    for (main_matches, special_matches), published_odds in PUBLISHED_POWERBALL_ODDS.items():
+        assert round(powerball_odds.odds(main_matches, special_matches), 2) == published_odds
+
+    prize_probability = sum(powerball_odds.probability(*prize_class) for prize_class in PUBLISHED_POWERBALL_ODDS)
+    assert round(1 / prize_probability, 2) == PUBLISHED_POWERBALL_OVERALL_ODDS
+
+
+def test_odds_table_is_a_probability_distribution(powerball_odds):
+    assert powerball_odds.class_ways.sum() == powerball_odds.class_total
+    assert powerball_odds.class_probabilities.sum() == pytest.approx(1.0)
+    assert powerball_odds.main_at_least[0] == pytest.approx(1.0)
+    assert powerball_odds.expected_main_matches == pytest.approx(5 * 5 / 69)
+
+
+def test_single_pool_odds_and_impossible_classes():
+    odds_table = NexusOddsTable(49, 6)
+    assert odds_table.class_probabilities.shape == (7, 1)
+    assert odds_table.odds(6) == 13983816
+
+    # 5 of 8: a ticket always shares at least 2 numbers with the draw
+    small_table = NexusOddsTable(8, 5)
+    assert np.isinf(small_table.odds(0)) and np.isinf(small_table.odds(1))
+    assert small_table.odds(2) == 56 / 10
+
+
+def test_resource_estimate_is_the_exact_expected_return():
+    # Expected return of one ticket from the published (rounded) odds and prizes
+    prizes = GAME_PRIZE_TABLES["powerball"]
+    published_return = sum(
+        (REFERENCE_JACKPOT if prizes[prize_class] == JACKPOT else prizes[prize_class]) / published_odds
+        for prize_class, published_odds in PUBLISHED_POWERBALL_ODDS.items()
+    )
+
+    system = NexusLotteryAlgorithmSystem()
+    estimate = system.estimate_resource_generation_potential(10, {"pattern_agent": 0.5}, "powerball")
+    assert estimate == pytest.approx(10 * published_return, rel=1e-4)
+    assert system.estimate_resource_generation_potential(10, {"pattern_agent": 0.0}, "powerball") == 0.0
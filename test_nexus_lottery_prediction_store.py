@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Tests for the write-behind prediction store and the NumPy query path over it
+"""
+
+import time
+import sqlite3
+
+import numpy as np
+import pytest
+
+from nexus_lottery_algorithm_system import NexusLotteryAlgorithmSystem
+from nexus_lottery_prediction_query import NexusPredictionQuery, concatenate_prediction_pages
+from nexus_lottery_prediction_store import NexusPredictionStore, pack_numbers, unpack_numbers
+from nexus_write_behind_logger import NexusWriteBehindLogger
+
+ROW_COUNT = 100000
+ALGORITHMS = ("pattern_agent", "neural_agent", "consciousness_agent", "optimization_agent")
+
+
+@pytest.fixture(scope="module")
+def stored_predictions(tmp_path_factory):
+    """100k rows over two games, four agents and ten timestamps, written through one logger"""
+    db_path = str(tmp_path_factory.mktemp("predictions") / "nexus_lottery_algorithms.db")
+    rng = np.random.default_rng(21)
+
+    rows = {
+        "game_types": np.where(rng.random(ROW_COUNT) < 0.75, "powerball", "mega_millions"),
+        "algorithm_names": np.array(ALGORITHMS)[rng.integers(0, len(ALGORITHMS), ROW_COUNT)],
+        "numbers": np.sort(np.argsort(rng.random((ROW_COUNT, 69)), axis=1)[:, :5] + 1, axis=1).astype(np.uint8),
+        "confidence_scores": rng.random(ROW_COUNT),
+        "timestamps": 1700000000.0 + rng.integers(0, 10, ROW_COUNT)
+    }
+
+    write_logger = NexusWriteBehindLogger(batch_size=8)
+    prediction_store = NexusPredictionStore(db_path, write_logger=write_logger)
+    for chunk_start in range(0, ROW_COUNT, 25000):
+        chunk = slice(chunk_start, chunk_start + 25000)
+        prediction_store.insert_predictions(zip(
+            rows["algorithm_names"][chunk].tolist(),
+            rows["game_types"][chunk].tolist(),
+            map(pack_numbers, rows["numbers"][chunk].tolist()),
+            rows["confidence_scores"][chunk].tolist(),
+            [0.0] * (chunk.stop - chunk.start),
+            [0.0] * (chunk.stop - chunk.start),
+            rows["timestamps"][chunk].tolist()
+        ))
+    assert write_logger.flush(timeout=60)
+
+    metrics = write_logger.metrics()
+    assert metrics["written_rows"] == ROW_COUNT and metrics["failed_writes"] == 0
+
+    prediction_query = NexusPredictionQuery(db_path, page_size=4096)
+    yield rows, prediction_query
+    prediction_query.close()
+
+
+def test_pack_numbers_round_trip():
+    assert unpack_numbers(pack_numbers([1, 17, 42, 69, 255])).tolist() == [1, 17, 42, 69, 255]
+
+
+def test_stored_rows_round_trip_in_time_order(stored_predictions):
+    rows, prediction_query = stored_predictions
+    arrays = prediction_query.predictions("powerball")
+
+    # Row ids follow insertion order, so (timestamp, id) order is a stable sort by timestamp
+    selected = np.flatnonzero(rows["game_types"] == "powerball")
+    expected = selected[np.argsort(rows["timestamps"][selected], kind="stable")]
+
+    assert prediction_query.count("powerball") == len(selected)
+    np.testing.assert_array_equal(arrays["ids"], expected + 1)
+    np.testing.assert_array_equal(arrays["numbers"], rows["numbers"][expected])
+    np.testing.assert_array_equal(arrays["algorithm_names"], rows["algorithm_names"][expected])
+    np.testing.assert_array_equal(arrays["timestamps"], rows["timestamps"][expected])
+    np.testing.assert_array_equal(arrays["confidence_scores"], rows["confidence_scores"][expected])
+
+
+def test_filtered_and_paged_queries(stored_predictions):
+    rows, prediction_query = stored_predictions
+    start_time, end_time = 1700000003.0, 1700000007.0
+    arrays = prediction_query.predictions("mega_millions", start_time, end_time, "neural_agent")
+
+    expected = np.flatnonzero(
+        (rows["game_types"] == "mega_millions") & (rows["algorithm_names"] == "neural_agent") &
+        (rows["timestamps"] >= start_time) & (rows["timestamps"] < end_time)
+    )
+    assert sorted(arrays["ids"].tolist()) == (expected + 1).tolist()
+
+    pages = list(prediction_query.iter_predictions("mega_millions", page_size=1000))
+    assert max(len(page["ids"]) for page in pages) == 1000
+    np.testing.assert_array_equal(concatenate_prediction_pages(pages)["ids"],
+                                  prediction_query.predictions("mega_millions")["ids"])
+
+
+def test_top_predictions_are_most_confident_first(stored_predictions):
+    rows, prediction_query = stored_predictions
+    arrays = prediction_query.top_predictions("powerball", 50)
+
+    selected = np.flatnonzero(rows["game_types"] == "powerball")
+    expected_scores = np.sort(rows["confidence_scores"][selected])[::-1][:50]
+    np.testing.assert_array_equal(arrays["confidence_scores"], expected_scores)
+    np.testing.assert_array_equal(arrays["numbers"], rows["numbers"][arrays["ids"] - 1])
+
+
+def test_deployment_rows_store_agent_outputs_or_null(tmp_path):
+    system = NexusLotteryAlgorithmSystem()
+    system.desktop_path = str(tmp_path)
+    agent_results = {
+        agent_name: system.expand_agent_predictions(system.agent_system[agent_name]["implementation"](
+            "powerball", system.load_historical_draws("powerball", 200), 5))
+        for agent_name in ("pattern_agent", "neural_agent", "consciousness_agent")
+    }
+    neural_probabilities = [prediction["neural_probability"]
+                            for prediction in agent_results["neural_agent"]["predictions"]]
+    assert all(0.0 < probability < 1.0 for probability in neural_probabilities)
+
+    db_path = str(tmp_path / "nexus_lottery_algorithms.db")
+    write_logger = NexusWriteBehindLogger()
+    NexusPredictionStore(db_path, write_logger=write_logger).save_deployment_predictions(
+        {"game_type": "powerball", "agent_predictions": agent_results})
+    assert write_logger.flush(timeout=60)
+
+    with sqlite3.connect(db_path) as connection:
+        rows = connection.execute(
+            "SELECT algorithm_name, consciousness_guidance, neural_probability FROM algorithm_predictions ORDER BY id"
+        ).fetchall()
+    stored = {agent_name: [row[1:] for row in rows if row[0] == agent_name] for agent_name in agent_results}
+    assert stored["pattern_agent"] == [(None, None)] * 5
+    assert [row[1] for row in stored["neural_agent"]] == pytest.approx(neural_probabilities)
+    assert all(guidance > 0.0 and probability is None for guidance, probability in stored["consciousness_agent"])
+
+
+def test_batch_workers_commit_every_game(tmp_path, monkeypatch):
+    system = NexusLotteryAlgorithmSystem()
+    system.desktop_path = str(tmp_path)
+    system.draw_store_path = str(tmp_path / "draw_store")
+    system.model_cache.cache_dir = str(tmp_path / "model_cache")
+    system.outcome_simulation_cells = 20000
+
+    # A slow disk: forked workers inherit the patch, so their queued rows are still
+    # uncommitted when execute_game_batch returns and the worker exits without atexit
+    apply_write = NexusWriteBehindLogger.apply_write
+
+    def slow_apply_write(connection, write):
+        time.sleep(0.5)
+        return apply_write(connection, write)
+
+    monkeypatch.setattr(NexusWriteBehindLogger, "apply_write", staticmethod(slow_apply_write))
+
+    jobs = [("state_lotto", 50), ("powerball", 50), ("mega_millions", 50)]
+    batch_result = system.execute_lottery_algorithm_batch(jobs, max_workers=3)
+
+    for deployment_result in batch_result["deployment_results"]:
+        assert deployment_result["deployment_success"], deployment_result.get("error")
+        stored = system.query_stored_predictions(deployment_result["game_type"])
+        assert stored["prediction_count"] == deployment_result["predictions_queued"] > 0
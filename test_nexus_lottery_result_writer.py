@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for the streamed NDJSON deployment result artifacts
+"""
+
+import glob
+import json
+import os
+
+import pytest
+
+from nexus_lottery_algorithm_system import NexusLotteryAlgorithmSystem
+from nexus_lottery_result_writer import NexusDeploymentResultWriter
+
+
+@pytest.fixture
+def lottery_system(tmp_path):
+    system = NexusLotteryAlgorithmSystem()
+    system.desktop_path = str(tmp_path)
+    system.draw_store_path = str(tmp_path / "draw_store")
+    system.model_cache.cache_dir = str(tmp_path / "model_cache")
+    system.outcome_simulation_cells = 20000
+    return system
+
+
+def read_artifact(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_batch_writes_one_parsable_artifact_per_deployment(lottery_system):
+    jobs = [("powerball", 3), ("powerball", 4), ("mega_millions", 3), ("mega_millions", 5)]
+    batch_result = lottery_system.execute_lottery_algorithm_batch(jobs, max_workers=2)
+    assert all(result["deployment_success"] for result in batch_result["deployment_results"])
+
+    artifacts = glob.glob(os.path.join(lottery_system.desktop_path, "nexus_lottery_deployment_results_*.ndjson"))
+    assert len(artifacts) == len(jobs)
+
+    deployments = set()
+    for path in artifacts:
+        records = read_artifact(path)
+        header, summary = records[0], records[-1]
+        assert header["record"] == "deployment" and summary["record"] == "summary"
+        assert [record["record"] for record in records[1:-1]].count("deployment") == 0
+        deployments.add((header["game_type"], header["prediction_count"]))
+
+        agent_records = [record for record in records if record["record"] == "agent"]
+        assert {record["agent_name"] for record in agent_records} == set(lottery_system.agent_system)
+        for agent_record in agent_records:
+            predictions = [record for record in records
+                           if record["record"] == "prediction" and record["source"] == agent_record["agent_name"]]
+            assert len(predictions) == agent_record["predictions_written"]
+
+    assert deployments == set(jobs)
+
+
+def test_writer_refuses_existing_file(tmp_path):
+    results_file = tmp_path / "results.ndjson"
+    NexusDeploymentResultWriter(str(results_file)).close()
+    with pytest.raises(FileExistsError):
+        NexusDeploymentResultWriter(str(results_file))
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Tests for colex combination ranks and the ticket index built on them
+"""
+
+from itertools import combinations
+from math import comb
+
+import numpy as np
+
+from nexus_lottery_ticket_index import NexusTicketIndex, binomial_table, combination_ranks
+
+
+def unrank_combination(rank, ball_count, binomials):
+    """Largest c_k with C(c_k, k) <= rank, then recurse on the remainder (colex unranking)"""
+    offsets = []
+    for position in range(ball_count, 0, -1):
+        offset = position - 1
+        while binomials[offset + 1, position] <= rank:
+            offset += 1
+        offsets.append(offset)
+        rank -= binomials[offset, position]
+    return offsets[::-1]
+
+
+def test_colex_ranks_are_a_bijection_in_colex_order():
+    range_size, ball_count = 14, 4
+    binomials = binomial_table(range_size, ball_count)
+
+    # itertools yields lexicographic order; colex order sorts by the reversed rows
+    offsets = np.array(list(combinations(range(range_size), ball_count)))
+    colex_order = np.lexsort(offsets.T)
+    ranks = combination_ranks(offsets[colex_order], binomials)
+
+    np.testing.assert_array_equal(ranks, np.arange(comb(range_size, ball_count)))
+
+
+def test_colex_rank_round_trip():
+    range_size, ball_count = 69, 5
+    binomials = binomial_table(range_size, ball_count)
+    rng = np.random.default_rng(13)
+    offsets = np.sort(np.argsort(rng.random((500, range_size)), axis=1)[:, :ball_count], axis=1)
+
+    for row, rank in zip(offsets.tolist(), combination_ranks(offsets, binomials).tolist()):
+        assert 0 <= rank < comb(range_size, ball_count)
+        assert unrank_combination(rank, ball_count, binomials) == row
+
+
+def test_ticket_index_flags_duplicates_in_any_order():
+    ticket_index = NexusTicketIndex((1, 20), 3)
+    tickets = np.array([[1, 2, 3], [3, 2, 1], [4, 5, 6], [1, 2, 3], [20, 19, 18]])
+
+    np.testing.assert_array_equal(ticket_index.add(tickets), [True, False, True, False, True])
+    np.testing.assert_array_equal(ticket_index.add([[6, 4, 5], [7, 8, 9]]), [False, True])
+    np.testing.assert_array_equal(ticket_index.contains([[2, 3, 1], [1, 2, 4]]), [True, False])
+    assert len(ticket_index) == 4
+
+    # Pairs of {1,2,3}, {4,5,6}, {18,19,20} and {7,8,9}
+    assert ticket_index.coverage(2)["covered"] == 12
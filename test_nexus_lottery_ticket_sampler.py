@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests that sum-constrained ticket sampling matches the exact conditional distribution
+"""
+
+from itertools import combinations
+
+import numpy as np
+
+from nexus_lottery_game_spec import NexusGameSpec
+from nexus_lottery_ticket_sampler import NexusTicketSampler
+
+
+def exact_ticket_probabilities(numbers, probabilities, ball_count, sum_ranges):
+    """P(ticket) proportional to the product of its probabilities, over tickets with an allowed sum"""
+    tickets, masses = [], []
+    for offsets in combinations(range(len(numbers)), ball_count):
+        ticket = tuple(int(numbers[offset]) for offset in offsets)
+        if any(start <= sum(ticket) <= end for start, end in sum_ranges):
+            tickets.append(ticket)
+            masses.append(np.prod(probabilities[list(offsets)]))
+    masses = np.array(masses)
+    return dict(zip(tickets, masses / masses.sum()))
+
+
+def test_sampler_matches_exact_conditioned_distribution():
+    game_spec = NexusGameSpec.from_game_config({"numbers": {"range": (1, 12), "count": 3}})
+    probabilities = np.linspace(1.0, 3.0, game_spec.range_size)
+    probabilities /= probabilities.sum()
+    sum_ranges = [(12, 17), (25, 28)]
+    ticket_count = 200000
+
+    sampler = NexusTicketSampler(game_spec, probabilities, sum_ranges, seed=12)
+    tickets, sum_valid = sampler.sample(ticket_count)
+    assert sum_valid.all()
+
+    exact = exact_ticket_probabilities(game_spec.numbers, probabilities, game_spec.ball_count, sum_ranges)
+    sampled_tickets, sampled_counts = np.unique(tickets, axis=0, return_counts=True)
+    sampled = dict(zip(map(tuple, sampled_tickets.tolist()), sampled_counts.tolist()))
+
+    # Every sampled ticket is sorted and inside the sum ranges
+    assert set(sampled) <= set(exact)
+
+    # Pearson chi-square against the exact distribution, far below a 5-sigma bound
+    expected = np.array([probability * ticket_count for probability in exact.values()])
+    observed = np.array([sampled.get(ticket, 0) for ticket in exact])
+    chi_square = float(((observed - expected) ** 2 / expected).sum())
+    degrees_of_freedom = len(exact) - 1
+    assert chi_square < degrees_of_freedom + 5 * np.sqrt(2 * degrees_of_freedom)
+
+
+def test_sampler_flags_tickets_when_no_sum_is_reachable():
+    game_spec = NexusGameSpec.from_game_config({"numbers": {"range": (1, 12), "count": 3}})
+    probabilities = np.full(game_spec.range_size, 1.0 / game_spec.range_size)
+
+    tickets, sum_valid = NexusTicketSampler(game_spec, probabilities, [(100, 120)], seed=1).sample(50)
+
+    assert not sum_valid.any()
+    assert tickets.shape == (50, 3)
+    assert (np.diff(tickets.astype(int), axis=1) > 0).all()